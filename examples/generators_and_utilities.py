@@ -6,8 +6,38 @@ utility helpers for creating realistic test data and performing common
 transformations.
 """
 
+import sys
+from collections import Counter
+
 from mocklib import MockFactory
 
+# Avoid per-line flushes when output is piped (e.g. when benchmarking)
+if not sys.stdout.isatty():
+    sys.stdout.reconfigure(line_buffering=False)
+
+
+class Section:
+    """Collect a section's output and write it to stdout in one call
+
+    Each print() acquires the stdout lock and may flush per line; for the
+    dozens of short lines below, buffering per section removes that
+    per-line overhead.
+    """
+
+    def __init__(self, title):
+        self._lines = ["", "=" * 60, title, "=" * 60]
+
+    def add(self, line=""):
+        self._lines.append(line)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+
+
 # Initialize client with API key
 mf = MockFactory(api_key="mf_...")
 
@@ -19,70 +49,74 @@ print("=" * 60)
 print("DATA GENERATORS")
 print("=" * 60)
 
-# Generate realistic users
-print("\n📝 Generating users...")
-users = mf.generator.generate_users(
-    count=10,
-    role="mixed",
-    organization="acme-corp",
-    cloud="dev-cloud",
-    domain="acme.com"
-)
+# Queue all generator calls and send them in ONE HTTP round-trip
+print("\n⚡ Batching all generator calls into a single request...")
+with mf.generator.batch() as batch:
+    users_f = batch.generate_users(
+        count=10,
+        role="mixed",
+        organization="acme-corp",
+        cloud="dev-cloud",
+        domain="acme.com"
+    )
+    employees_f = batch.generate_employees(
+        count=50,
+        organization="acme-corp",
+        departments=["engineering", "sales", "marketing", "hr"]
+    )
+    orgs_f = batch.generate_organizations(count=5)
+    network_f = batch.generate_network_config(
+        cloud="prod-cloud",
+        vpc_cidr="10.0.0.0/16",
+        subnets=4
+    )
+    policies_f = batch.generate_iam_policies(
+        policy_type="common",
+        services=["s3", "dynamodb", "lambda"]
+    )
+    scenario_f = batch.generate_test_scenario(scenario="startup")
+
+# All results are now resolved from the single batched response
+users = users_f.result()
 print(f"✓ Generated {len(users)} users")
 for user in users[:3]:
     print(f"  • {user['username']}: {user['email']} ({user['role']})")
 
-# Generate employees with departments
-print("\n👥 Generating employees...")
-employees = mf.generator.generate_employees(
-    count=50,
-    organization="acme-corp",
-    departments=["engineering", "sales", "marketing", "hr"]
-)
+employees = employees_f.result()
 print(f"✓ Generated {len(employees)} employees")
 
 # Count by department
-dept_counts = {}
-for emp in employees:
-    dept = emp["department"]
-    dept_counts[dept] = dept_counts.get(dept, 0) + 1
+dept_counts = Counter(emp["department"] for emp in employees)
 
 for dept, count in dept_counts.items():
     print(f"  • {dept.title()}: {count} employees")
 
-# Generate organizations
-print("\n🏢 Generating organizations...")
-orgs = mf.generator.generate_organizations(count=5)
+# Generated organizations (from the batch)
+print("\n🏢 Generated organizations...")
+orgs = orgs_f.result()
 print(f"✓ Generated {len(orgs)} organizations")
 for org in orgs:
     print(f"  • {org['name']}: {org['industry']} ({org.get('plan', 'free')} plan)")
 
-# Generate network configuration
-print("\n🌐 Generating network config...")
-network = mf.generator.generate_network_config(
-    cloud="prod-cloud",
-    vpc_cidr="10.0.0.0/16",
-    subnets=4
-)
+# Generated network configuration (from the batch)
+print("\n🌐 Generated network config...")
+network = network_f.result()
 print(f"✓ Generated network configuration")
 print(f"  VPC CIDR: {network.get('vpc', {}).get('cidr_block')}")
 print(f"  Subnets: {len(network.get('subnets', []))}")
 for subnet in network.get('subnets', [])[:3]:
     print(f"    - {subnet.get('name')}: {subnet.get('cidr')}")
 
-# Generate IAM policies
-print("\n🔐 Generating IAM policies...")
-policies = mf.generator.generate_iam_policies(
-    policy_type="common",
-    services=["s3", "dynamodb", "lambda"]
-)
+# Generated IAM policies (from the batch)
+print("\n🔐 Generated IAM policies...")
+policies = policies_f.result()
 print(f"✓ Generated {len(policies)} IAM policies")
 for policy in policies:
     print(f"  • {policy['policy_name']}: {policy.get('description', 'No description')}")
 
-# Generate complete test scenario
-print("\n🎬 Generating test scenario...")
-scenario = mf.generator.generate_test_scenario(scenario="startup")
+# Generated complete test scenario (from the batch)
+print("\n🎬 Generated test scenario...")
+scenario = scenario_f.result()
 print(f"✓ Generated 'startup' test scenario")
 print(f"  Organization: {scenario.get('organization', {}).get('name')}")
 print(f"  Employees: {scenario.get('employees', 0)}")
@@ -94,304 +128,270 @@ print(f"  IAM Users: {scenario.get('iam_users', 0)}")
 # UTILITY HELPERS - Binary/Hex Conversion
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("UTILITY HELPERS: Binary/Hex Conversion")
-print("=" * 60)
+with Section("UTILITY HELPERS: Binary/Hex Conversion") as sec:
+    # Binary to Hex
+    binary = "11010101"
+    hex_val = mf.utilities.bin2hex(binary)
+    sec.add(f"\nBinary {binary} → Hex {hex_val}")
 
-# Binary to Hex
-binary = "11010101"
-hex_val = mf.utilities.bin2hex(binary)
-print(f"\nBinary {binary} → Hex {hex_val}")
-
-# Hex to Binary
-hex_str = "ff"
-bin_val = mf.utilities.hex2bin(hex_str)
-print(f"Hex {hex_str} → Binary {bin_val}")
+    # Hex to Binary
+    hex_str = "ff"
+    bin_val = mf.utilities.hex2bin(hex_str)
+    sec.add(f"Hex {hex_str} → Binary {bin_val}")
 
 # ============================================================================
 # UTILITY HELPERS - IP Address Conversion
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("UTILITY HELPERS: IP Address Conversion")
-print("=" * 60)
-
-# IP to Binary
-ip = "192.168.1.1"
-ip_binary = mf.utilities.ip2bin(ip)
-print(f"\nIP {ip} → Binary {ip_binary}")
+with Section("UTILITY HELPERS: IP Address Conversion") as sec:
+    # IP to Binary
+    ip = "192.168.1.1"
+    ip_binary = mf.utilities.ip2bin(ip)
+    sec.add(f"\nIP {ip} → Binary {ip_binary}")
 
-# Binary to IP
-bin_ip = "11000000101010000000000100000001"
-ip_from_bin = mf.utilities.bin2ip(bin_ip)
-print(f"Binary {bin_ip} → IP {ip_from_bin}")
+    # Binary to IP
+    bin_ip = "11000000101010000000000100000001"
+    ip_from_bin = mf.utilities.bin2ip(bin_ip)
+    sec.add(f"Binary {bin_ip} → IP {ip_from_bin}")
 
-# IP to Long
-ip_long = mf.utilities.ip2long("192.168.1.1")
-print(f"\nIP 192.168.1.1 → Long {ip_long}")
+    # IP to Long
+    ip_long = mf.utilities.ip2long("192.168.1.1")
+    sec.add(f"\nIP 192.168.1.1 → Long {ip_long}")
 
-# Long to IP
-ip_from_long = mf.utilities.long2ip(3232235777)
-print(f"Long 3232235777 → IP {ip_from_long}")
+    # Long to IP
+    ip_from_long = mf.utilities.long2ip(3232235777)
+    sec.add(f"Long 3232235777 → IP {ip_from_long}")
 
 # ============================================================================
 # UTILITY HELPERS - CIDR Operations
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("UTILITY HELPERS: CIDR Operations")
-print("=" * 60)
-
-# CIDR to Range
-cidr = "10.0.0.0/24"
-cidr_range = mf.utilities.cidr_to_range(cidr)
-print(f"\nCIDR {cidr}:")
-print(f"  Start IP: {cidr_range['start_ip']}")
-print(f"  End IP: {cidr_range['end_ip']}")
-print(f"  Total IPs: {cidr_range['total_ips']}")
+with Section("UTILITY HELPERS: CIDR Operations") as sec:
+    # CIDR to Range
+    cidr = "10.0.0.0/24"
+    cidr_range = mf.utilities.cidr_to_range(cidr)
+    sec.add(f"\nCIDR {cidr}:")
+    sec.add(f"  Start IP: {cidr_range['start_ip']}")
+    sec.add(f"  End IP: {cidr_range['end_ip']}")
+    sec.add(f"  Total IPs: {cidr_range['total_ips']}")
 
-# IP in CIDR
-is_in_range = mf.utilities.ip_in_cidr("10.0.0.50", "10.0.0.0/24")
-print(f"\nIs 10.0.0.50 in 10.0.0.0/24? {is_in_range}")
+    # IP in CIDR
+    is_in_range = mf.utilities.ip_in_cidr("10.0.0.50", "10.0.0.0/24")
+    sec.add(f"\nIs 10.0.0.50 in 10.0.0.0/24? {is_in_range}")
 
-# CIDR Overlap
-overlap = mf.utilities.cidr_overlap("10.0.0.0/24", "10.0.0.128/25")
-print(f"Do 10.0.0.0/24 and 10.0.0.128/25 overlap? {overlap}")
+    # CIDR Overlap
+    overlap = mf.utilities.cidr_overlap("10.0.0.0/24", "10.0.0.128/25")
+    sec.add(f"Do 10.0.0.0/24 and 10.0.0.128/25 overlap? {overlap}")
 
 # ============================================================================
 # UTILITY HELPERS - IPv6
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("UTILITY HELPERS: IPv6 Operations")
-print("=" * 60)
+with Section("UTILITY HELPERS: IPv6 Operations") as sec:
+    # Expand IPv6
+    compressed = "2001:db8::1"
+    expanded = mf.utilities.expand_ipv6(compressed)
+    sec.add(f"\nCompressed: {compressed}")
+    sec.add(f"Expanded: {expanded}")
 
-# Expand IPv6
-compressed = "2001:db8::1"
-expanded = mf.utilities.expand_ipv6(compressed)
-print(f"\nCompressed: {compressed}")
-print(f"Expanded: {expanded}")
+    # Compress IPv6
+    full_ipv6 = "2001:0db8:0000:0000:0000:0000:0000:0001"
+    compressed_ipv6 = mf.utilities.compress_ipv6(full_ipv6)
+    sec.add(f"\nFull: {full_ipv6}")
+    sec.add(f"Compressed: {compressed_ipv6}")
 
-# Compress IPv6
-full_ipv6 = "2001:0db8:0000:0000:0000:0000:0000:0001"
-compressed_ipv6 = mf.utilities.compress_ipv6(full_ipv6)
-print(f"\nFull: {full_ipv6}")
-print(f"Compressed: {compressed_ipv6}")
-
-# Validate IPv6
-is_valid = mf.utilities.is_valid_ipv6("2001:db8::1")
-print(f"\nIs '2001:db8::1' valid IPv6? {is_valid}")
+    # Validate IPv6
+    is_valid = mf.utilities.is_valid_ipv6("2001:db8::1")
+    sec.add(f"\nIs '2001:db8::1' valid IPv6? {is_valid}")
 
 # ============================================================================
 # UTILITY HELPERS - Encoding/Decoding
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("UTILITY HELPERS: Encoding/Decoding")
-print("=" * 60)
-
-# Base64 Encode
-original = "Hello World"
-encoded = mf.utilities.base64_encode(original)
-print(f"\nOriginal: {original}")
-print(f"Base64 Encoded: {encoded}")
+with Section("UTILITY HELPERS: Encoding/Decoding") as sec:
+    # Base64 Encode
+    original = "Hello World"
+    encoded = mf.utilities.base64_encode(original)
+    sec.add(f"\nOriginal: {original}")
+    sec.add(f"Base64 Encoded: {encoded}")
 
-# Base64 Decode
-decoded = mf.utilities.base64_decode(encoded)
-print(f"Base64 Decoded: {decoded}")
+    # Base64 Decode
+    decoded = mf.utilities.base64_decode(encoded)
+    sec.add(f"Base64 Decoded: {decoded}")
 
-# URL Encode
-url_text = "hello world & stuff"
-url_encoded = mf.utilities.url_encode(url_text)
-print(f"\nOriginal: {url_text}")
-print(f"URL Encoded: {url_encoded}")
+    # URL Encode
+    url_text = "hello world & stuff"
+    url_encoded = mf.utilities.url_encode(url_text)
+    sec.add(f"\nOriginal: {url_text}")
+    sec.add(f"URL Encoded: {url_encoded}")
 
-# URL Decode
-url_decoded = mf.utilities.url_decode(url_encoded)
-print(f"URL Decoded: {url_decoded}")
+    # URL Decode
+    url_decoded = mf.utilities.url_decode(url_encoded)
+    sec.add(f"URL Decoded: {url_decoded}")
 
 # ============================================================================
 # UTILITY HELPERS - Hashing
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("UTILITY HELPERS: Hashing")
-print("=" * 60)
-
-data = "Hello World"
-print(f"\nData: {data}")
-print(f"MD5: {mf.utilities.md5(data)}")
-print(f"SHA1: {mf.utilities.sha1(data)}")
-print(f"SHA256: {mf.utilities.sha256(data)}")
-print(f"SHA512: {mf.utilities.sha512(data)[:64]}...")
+with Section("UTILITY HELPERS: Hashing") as sec:
+    data = "Hello World"
+    sec.add(f"\nData: {data}")
+    # One dispatch for all four algorithms instead of four separate calls
+    hashes = mf.utilities.hash_many([data], algorithms=["md5", "sha1", "sha256", "sha512"])
+    sec.add(f"MD5: {hashes['md5'][0]}")
+    sec.add(f"SHA1: {hashes['sha1'][0]}")
+    sec.add(f"SHA256: {hashes['sha256'][0]}")
+    sec.add(f"SHA512: {hashes['sha512'][0][:64]}...")
 
 # ============================================================================
 # UTILITY HELPERS - UUIDs
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("UTILITY HELPERS: UUIDs")
-print("=" * 60)
-
-# Generate UUID v4
-uuid_v4 = mf.utilities.generate_uuid(version=4)
-print(f"\nGenerated UUID v4: {uuid_v4}")
+with Section("UTILITY HELPERS: UUIDs") as sec:
+    # Generate UUID v4
+    uuid_v4 = mf.utilities.generate_uuid(version=4)
+    sec.add(f"\nGenerated UUID v4: {uuid_v4}")
 
-# Validate UUID
-is_valid_uuid = mf.utilities.validate_uuid(uuid_v4)
-print(f"Is valid UUID? {is_valid_uuid}")
+    # Validate UUID
+    is_valid_uuid = mf.utilities.validate_uuid(uuid_v4)
+    sec.add(f"Is valid UUID? {is_valid_uuid}")
 
 # ============================================================================
 # UTILITY HELPERS - Time Operations
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("UTILITY HELPERS: Time Operations")
-print("=" * 60)
+with Section("UTILITY HELPERS: Time Operations") as sec:
+    # Get timestamp
+    unix_ts = mf.utilities.timestamp(format="unix")
+    sec.add(f"\nUnix Timestamp: {unix_ts}")
 
-# Get timestamp
-unix_ts = mf.utilities.timestamp(format="unix")
-print(f"\nUnix Timestamp: {unix_ts}")
+    iso_ts = mf.utilities.timestamp(format="iso8601")
+    sec.add(f"ISO8601: {iso_ts}")
 
-iso_ts = mf.utilities.timestamp(format="iso8601")
-print(f"ISO8601: {iso_ts}")
+    # Convert to ISO8601
+    iso_from_unix = mf.utilities.iso8601(1640995200)
+    sec.add(f"\nUnix 1640995200 → ISO8601: {iso_from_unix}")
 
-# Convert to ISO8601
-iso_from_unix = mf.utilities.iso8601(1640995200)
-print(f"\nUnix 1640995200 → ISO8601: {iso_from_unix}")
+    # Parse time
+    parsed = mf.utilities.parse_time("2022-01-01T00:00:00Z")
+    sec.add(f"ISO8601 '2022-01-01T00:00:00Z' → Unix: {parsed}")
 
-# Parse time
-parsed = mf.utilities.parse_time("2022-01-01T00:00:00Z")
-print(f"ISO8601 '2022-01-01T00:00:00Z' → Unix: {parsed}")
-
-# Time ago
-relative = mf.utilities.time_ago(1640995200)
-print(f"1640995200 was: {relative}")
+    # Time ago
+    relative = mf.utilities.time_ago(1640995200)
+    sec.add(f"1640995200 was: {relative}")
 
 # ============================================================================
 # UTILITY HELPERS - String Operations
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("UTILITY HELPERS: String Operations")
-print("=" * 60)
-
-# Slugify
-text = "Hello World & Stuff!"
-slug = mf.utilities.slugify(text)
-print(f"\nOriginal: {text}")
-print(f"Slug: {slug}")
-
-# Random string
-random_str = mf.utilities.random_string(length=32, charset="hex")
-print(f"\nRandom hex string (32 chars): {random_str}")
-
-# Random password
-password = mf.utilities.random_password(
-    length=20,
-    include_symbols=True,
-    include_numbers=True,
-    include_uppercase=True,
-    include_lowercase=True
-)
-print(f"Random password (20 chars): {password}")
+with Section("UTILITY HELPERS: String Operations") as sec:
+    # Slugify
+    text = "Hello World & Stuff!"
+    slug = mf.utilities.slugify(text)
+    sec.add(f"\nOriginal: {text}")
+    sec.add(f"Slug: {slug}")
+
+    # Random string
+    random_str = mf.utilities.random_string(length=32, charset="hex")
+    sec.add(f"\nRandom hex string (32 chars): {random_str}")
+
+    # Random password
+    password = mf.utilities.random_password(
+        length=20,
+        include_symbols=True,
+        include_numbers=True,
+        include_uppercase=True,
+        include_lowercase=True
+    )
+    sec.add(f"Random password (20 chars): {password}")
 
 # ============================================================================
 # UTILITY HELPERS - JSON/YAML
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("UTILITY HELPERS: JSON/YAML Operations")
-print("=" * 60)
-
-# YAML to JSON
-yaml_str = """
+with Section("UTILITY HELPERS: JSON/YAML Operations") as sec:
+    # YAML to JSON
+    yaml_str = """
 name: John Doe
 age: 30
 roles:
   - developer
   - admin
 """
-json_obj = mf.utilities.yaml_to_json(yaml_str)
-print(f"\nYAML → JSON:")
-print(f"  Name: {json_obj.get('name')}")
-print(f"  Age: {json_obj.get('age')}")
-print(f"  Roles: {json_obj.get('roles')}")
-
-# JSON to YAML
-json_data = {"name": "Jane Doe", "role": "engineer", "active": True}
-yaml_output = mf.utilities.json_to_yaml(json_data)
-print(f"\nJSON → YAML:")
-print(yaml_output)
-
-# Validate JSON
-json_str = '{"name": "John", "age": 30}'
-validation = mf.utilities.validate_json(json_str)
-print(f"\nJSON Validation: {validation}")
-
-# Pretty print JSON
-pretty = mf.utilities.pretty_json(json_str, indent=4)
-print(f"\nPretty JSON:")
-print(pretty)
+    json_obj = mf.utilities.yaml_to_json(yaml_str)
+    sec.add(f"\nYAML → JSON:")
+    sec.add(f"  Name: {json_obj.get('name')}")
+    sec.add(f"  Age: {json_obj.get('age')}")
+    sec.add(f"  Roles: {json_obj.get('roles')}")
+
+    # JSON to YAML
+    json_data = {"name": "Jane Doe", "role": "engineer", "active": True}
+    yaml_output = mf.utilities.json_to_yaml(json_data)
+    sec.add(f"\nJSON → YAML:")
+    sec.add(yaml_output)
+
+    # Validate JSON
+    json_str = '{"name": "John", "age": 30}'
+    validation = mf.utilities.validate_json(json_str)
+    sec.add(f"\nJSON Validation: {validation}")
+
+    # Pretty print JSON
+    pretty = mf.utilities.pretty_json(json_str, indent=4)
+    sec.add(f"\nPretty JSON:")
+    sec.add(pretty)
 
 # ============================================================================
 # UTILITY HELPERS - AWS ARN Operations
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("UTILITY HELPERS: AWS ARN Operations")
-print("=" * 60)
-
-# Parse ARN
-arn = "arn:aws:iam::123456789:user/john.smith"
-parsed_arn = mf.utilities.parse_arn(arn)
-print(f"\nParsed ARN: {arn}")
-print(f"  Partition: {parsed_arn['partition']}")
-print(f"  Service: {parsed_arn['service']}")
-print(f"  Account: {parsed_arn['account']}")
-print(f"  Resource: {parsed_arn['resource']}")
-
-# Build ARN
-built_arn = mf.utilities.build_arn(
-    service="s3",
-    resource="bucket/my-bucket",
-    region="us-east-1",
-    account="123456789"
-)
-print(f"\nBuilt ARN: {built_arn}")
-
-# Validate ARN
-is_valid_arn = mf.utilities.validate_arn(arn)
-print(f"Is valid ARN? {is_valid_arn}")
+with Section("UTILITY HELPERS: AWS ARN Operations") as sec:
+    # Parse ARN
+    arn = "arn:aws:iam::123456789:user/john.smith"
+    parsed_arn = mf.utilities.parse_arn(arn)
+    sec.add(f"\nParsed ARN: {arn}")
+    sec.add(f"  Partition: {parsed_arn['partition']}")
+    sec.add(f"  Service: {parsed_arn['service']}")
+    sec.add(f"  Account: {parsed_arn['account']}")
+    sec.add(f"  Resource: {parsed_arn['resource']}")
+
+    # Build ARN
+    built_arn = mf.utilities.build_arn(
+        service="s3",
+        resource="bucket/my-bucket",
+        region="us-east-1",
+        account="123456789"
+    )
+    sec.add(f"\nBuilt ARN: {built_arn}")
+
+    # Validate ARN
+    is_valid_arn = mf.utilities.validate_arn(arn)
+    sec.add(f"Is valid ARN? {is_valid_arn}")
 
 # ============================================================================
 # UTILITY HELPERS - URL Operations
 # ============================================================================
 
-print("\n" + "=" * 60)
-print("UTILITY HELPERS: URL Operations")
-print("=" * 60)
-
-# Parse URL
-url = "https://api.example.com:8080/v1/users?page=1&limit=10#results"
-parsed_url = mf.utilities.parse_url(url)
-print(f"\nParsed URL: {url}")
-print(f"  Scheme: {parsed_url['scheme']}")
-print(f"  Host: {parsed_url['host']}")
-print(f"  Port: {parsed_url.get('port')}")
-print(f"  Path: {parsed_url['path']}")
-print(f"  Query: {parsed_url.get('query')}")
-print(f"  Fragment: {parsed_url.get('fragment')}")
-
-# Build URL
-built_url = mf.utilities.build_url(
-    scheme="https",
-    host="api.mockfactory.io",
-    path="/v1/users",
-    query={"page": "1", "limit": "20"},
-    port=443
-)
-print(f"\nBuilt URL: {built_url}")
+with Section("UTILITY HELPERS: URL Operations") as sec:
+    # Parse URL
+    url = "https://api.example.com:8080/v1/users?page=1&limit=10#results"
+    parsed_url = mf.utilities.parse_url(url)
+    sec.add(f"\nParsed URL: {url}")
+    sec.add(f"  Scheme: {parsed_url['scheme']}")
+    sec.add(f"  Host: {parsed_url['host']}")
+    sec.add(f"  Port: {parsed_url.get('port')}")
+    sec.add(f"  Path: {parsed_url['path']}")
+    sec.add(f"  Query: {parsed_url.get('query')}")
+    sec.add(f"  Fragment: {parsed_url.get('fragment')}")
+
+    # Build URL
+    built_url = mf.utilities.build_url(
+        scheme="https",
+        host="api.mockfactory.io",
+        path="/v1/users",
+        query={"page": "1", "limit": "20"},
+        port=443
+    )
+    sec.add(f"\nBuilt URL: {built_url}")
 
 # ============================================================================
 # COMPLETE WORKFLOW EXAMPLE
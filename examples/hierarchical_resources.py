@@ -5,6 +5,8 @@ This example demonstrates how to create and manage organizations, domains,
 clouds, and projects using the MockLib Python SDK.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from mocklib import MockFactory
 
 # Initialize client with API key
@@ -117,56 +119,57 @@ print(f"Created and bound Lambda function: {lambda_fn.function_name}")
 def setup_complete_environment():
     """Set up a complete organizational environment"""
 
-    # 1. Create organization
+    # 1. Create organization (everything below references it by name)
     org = mf.organization.create(
         name="startup-inc",
         plan="free",
         description="Startup Inc."
     )
 
-    # 2. Create domain
-    domain = mf.domain.create(
-        domain="startup.io",
-        organization="startup-inc",
-        verified=True
-    )
-
-    # 3. Create cloud environments
-    dev_cloud = mf.cloud.create(
-        name="dev",
-        provider="aws",
-        region="us-east-1",
-        organization="startup-inc"
-    )
-
-    staging_cloud = mf.cloud.create(
-        name="staging",
-        provider="aws",
-        region="us-east-1",
-        organization="startup-inc"
-    )
-
-    prod_cloud = mf.cloud.create(
-        name="production",
-        provider="aws",
-        region="us-west-2",
-        organization="startup-inc"
-    )
-
-    # 4. Create projects for each environment
-    projects = {}
-    for env_name, cloud_name in [
-        ("development", "dev"),
-        ("staging", "staging"),
-        ("production", "production")
-    ]:
-        project = mf.project.create(
-            name=f"api-{env_name}",
-            environment=env_name,
+    # 2-4. The domain, cloud, and project creations are independent
+    # network calls, so fan them out over a thread pool: wall time is
+    # roughly the slowest call instead of the sum of all seven. The
+    # shared session is thread-safe and pooled.
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        domain_f = executor.submit(
+            mf.domain.create,
+            domain="startup.io",
             organization="startup-inc",
-            description=f"API project for {env_name}"
+            verified=True
         )
-        projects[env_name] = project
+
+        cloud_futures = [
+            executor.submit(
+                mf.cloud.create,
+                name=cloud_name,
+                provider="aws",
+                region=region,
+                organization="startup-inc"
+            )
+            for cloud_name, region in [
+                ("dev", "us-east-1"),
+                ("staging", "us-east-1"),
+                ("production", "us-west-2"),
+            ]
+        ]
+
+        project_futures = {
+            env_name: executor.submit(
+                mf.project.create,
+                name=f"api-{env_name}",
+                environment=env_name,
+                organization="startup-inc",
+                description=f"API project for {env_name}"
+            )
+            for env_name in ["development", "staging", "production"]
+        }
+
+        domain = domain_f.result()
+        for future in cloud_futures:
+            future.result()
+        projects = {env: f.result() for env, f in project_futures.items()}
+
+    for project in projects.values():
         print(f"Created project: {project.name} ({project.project_id})")
 
     # 5. Create infrastructure in each project
@@ -337,75 +337,85 @@ print("CROSS-CLOUD IAM SETUP")
 print("="*60)
 
 def setup_cross_cloud_iam():
-    """Set up IAM across multiple cloud environments"""
-
-    # Create users in different clouds
-    dev_user = mf.iam.create_user(
-        username="dev.user",
-        cloud="dev-cloud",
-        organization="acme-corp"
-    )
-
-    prod_user = mf.iam.create_user(
-        username="prod.user",
-        cloud="prod-cloud",
-        organization="acme-corp"
-    )
-
-    print(f"\n✓ Created cloud-specific users:")
-    print(f"  Dev: {dev_user.username} (cloud: {dev_user.cloud})")
-    print(f"  Prod: {prod_user.username} (cloud: {prod_user.cloud})")
-
-    # Create cloud-specific policies
-    dev_policy = mf.iam.create_policy(
-        policy_name="dev-environment-access",
-        policy_document={
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Effect": "Allow",
-                    "Action": ["*"],
-                    "Resource": "*",
-                    "Condition": {
-                        "StringEquals": {
-                            "aws:RequestedRegion": "us-east-1"
+    """Set up IAM across multiple cloud environments
+
+    All six operations go out in a single mf.batch() call, so the whole
+    setup pays one HTTP round-trip instead of six.
+    """
+
+    ops = [
+        # Create users in different clouds
+        ("POST", "/iam/user", {
+            "username": "dev.user",
+            "path": "/",
+            "organization": "acme-corp",
+            "cloud": "dev-cloud",
+        }),
+        ("POST", "/iam/user", {
+            "username": "prod.user",
+            "path": "/",
+            "organization": "acme-corp",
+            "cloud": "prod-cloud",
+        }),
+        # Create cloud-specific policies
+        ("POST", "/iam/policy", {
+            "policy_name": "dev-environment-access",
+            "policy_document": {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Action": ["*"],
+                        "Resource": "*",
+                        "Condition": {
+                            "StringEquals": {
+                                "aws:RequestedRegion": "us-east-1"
+                            }
                         }
                     }
-                }
-            ]
-        },
-        cloud="dev-cloud"
-    )
-
-    prod_policy = mf.iam.create_policy(
-        policy_name="prod-read-only",
-        policy_document={
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Effect": "Allow",
-                    "Action": [
-                        "ec2:Describe*",
-                        "s3:Get*",
-                        "s3:List*",
-                        "dynamodb:GetItem",
-                        "dynamodb:Query",
-                        "dynamodb:Scan"
-                    ],
-                    "Resource": "*"
-                }
-            ]
-        },
-        cloud="prod-cloud"
-    )
+                ]
+            },
+            "cloud": "dev-cloud",
+        }),
+        ("POST", "/iam/policy", {
+            "policy_name": "prod-read-only",
+            "policy_document": {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Action": [
+                            "ec2:Describe*",
+                            "s3:Get*",
+                            "s3:List*",
+                            "dynamodb:GetItem",
+                            "dynamodb:Query",
+                            "dynamodb:Scan"
+                        ],
+                        "Resource": "*"
+                    }
+                ]
+            },
+            "cloud": "prod-cloud",
+        }),
+        # Attach policies
+        ("POST", "/iam/user/dev.user/policies", {
+            "policy_name": "dev-environment-access",
+        }),
+        ("POST", "/iam/user/prod.user/policies", {
+            "policy_name": "prod-read-only",
+        }),
+    ]
+
+    dev_user, prod_user, dev_policy, prod_policy, _, _ = mf.batch(ops)
 
-    print(f"\n✓ Created cloud-specific policies:")
-    print(f"  {dev_policy.policy_name} (cloud: {dev_policy.cloud})")
-    print(f"  {prod_policy.policy_name} (cloud: {prod_policy.cloud})")
+    print(f"\n✓ Created cloud-specific users:")
+    print(f"  Dev: {dev_user['username']} (cloud: {dev_user['cloud']})")
+    print(f"  Prod: {prod_user['username']} (cloud: {prod_user['cloud']})")
 
-    # Attach policies
-    mf.iam.attach_user_policy(username="dev.user", policy_name="dev-environment-access")
-    mf.iam.attach_user_policy(username="prod.user", policy_name="prod-read-only")
+    print(f"\n✓ Created cloud-specific policies:")
+    print(f"  {dev_policy['policy_name']} (cloud: {dev_policy['cloud']})")
+    print(f"  {prod_policy['policy_name']} (cloud: {prod_policy['cloud']})")
 
     print("\n✓ Attached cloud-specific policies to users")
 
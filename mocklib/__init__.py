@@ -11,126 +11,105 @@ Example:
 
 __version__ = "0.2.0"
 
-from .client import MockFactory
-from .resources import (
-    # AWS core dataclasses
-    VPC,
-    Lambda,
-    DynamoDB,
-    SQS,
-    Storage,
-    EC2Instance,
-    STSIdentity,
-    STSCredentials,
-    HostedZone,
-    SNSTopic,
-    # OCI dataclasses
-    OCIInstance,
-    OCIBucket,
-    OCIVCN,
-    OCIVolume,
-    # GCP dataclasses
-    GCPInstance,
-    GCPNetwork,
-    GCPDisk,
-    # Azure dataclasses
-    AzureResourceGroup,
-    AzureVirtualMachine,
-    AzureDisk,
-    # IAM dataclasses
-    IAMUser,
-    IAMGroup,
-    IAMRole,
-    IAMPolicy,
-    IAMAccessKey,
-    # Org/project dataclasses
-    Organization,
-    Domain,
-    Cloud,
-    Project,
-    # Resource clients
-    VPCResource,
-    LambdaResource,
-    DynamoDBResource,
-    SQSResource,
-    StorageResource,
-    EC2Resource,
-    STSResource,
-    Route53Resource,
-    SNSResource,
-    OCIResource,
-    GCPComputeResource,
-    AzureResource,
-    IAMResource,
-    OrganizationResource,
-    DomainResource,
-    CloudResource,
-    ProjectResource,
-    GeneratorResource,
-    UtilitiesResource,
-)
 from .exceptions import MockFactoryError, APIError, AuthenticationError
 
-__all__ = [
+# Everything else resolves lazily (PEP 562): importing mocklib pays for
+# the exceptions module only, and the large resources module loads on
+# first use of a client or dataclass.
+_LAZY = {
     # Client
-    "MockFactory",
+    "MockFactory": "client",
+    "AsyncMockFactory": "aclient",
+    "run_parallel": "aclient",
+    "AsyncVPCResource": "aclient",
+    "AsyncLambdaResource": "aclient",
+    "AsyncDynamoDBResource": "aclient",
+    "AsyncSQSResource": "aclient",
+    "AsyncStorageResource": "aclient",
+    "AsyncIAMResource": "aclient",
     # AWS core dataclasses
-    "VPC",
-    "Lambda",
-    "DynamoDB",
-    "SQS",
-    "Storage",
-    "EC2Instance",
-    "STSIdentity",
-    "STSCredentials",
-    "HostedZone",
-    "SNSTopic",
+    "VPC": "resources",
+    "VPCTable": "resources",
+    "Lambda": "resources",
+    "DynamoDB": "resources",
+    "SQS": "resources",
+    "Storage": "resources",
+    "EC2Instance": "resources",
+    "STSIdentity": "resources",
+    "STSCredentials": "resources",
+    "HostedZone": "resources",
+    "SNSTopic": "resources",
     # OCI dataclasses
-    "OCIInstance",
-    "OCIBucket",
-    "OCIVCN",
-    "OCIVolume",
+    "OCIInstance": "resources",
+    "OCIBucket": "resources",
+    "OCIVCN": "resources",
+    "OCIVolume": "resources",
     # GCP dataclasses
-    "GCPInstance",
-    "GCPNetwork",
-    "GCPDisk",
+    "GCPInstance": "resources",
+    "GCPNetwork": "resources",
+    "GCPDisk": "resources",
     # Azure dataclasses
-    "AzureResourceGroup",
-    "AzureVirtualMachine",
-    "AzureDisk",
+    "AzureResourceGroup": "resources",
+    "AzureVirtualMachine": "resources",
+    "AzureDisk": "resources",
     # IAM dataclasses
-    "IAMUser",
-    "IAMGroup",
-    "IAMRole",
-    "IAMPolicy",
-    "IAMAccessKey",
+    "IAMUser": "resources",
+    "IAMGroup": "resources",
+    "IAMRole": "resources",
+    "IAMPolicy": "resources",
+    "IAMAccessKey": "resources",
     # Org/project dataclasses
-    "Organization",
-    "Domain",
-    "Cloud",
-    "Project",
+    "Organization": "resources",
+    "Domain": "resources",
+    "Cloud": "resources",
+    "Project": "resources",
     # Resource clients
-    "VPCResource",
-    "LambdaResource",
-    "DynamoDBResource",
-    "SQSResource",
-    "StorageResource",
-    "EC2Resource",
-    "STSResource",
-    "Route53Resource",
-    "SNSResource",
-    "OCIResource",
-    "GCPComputeResource",
-    "AzureResource",
-    "IAMResource",
-    "OrganizationResource",
-    "DomainResource",
-    "CloudResource",
-    "ProjectResource",
-    "GeneratorResource",
-    "UtilitiesResource",
-    # Exceptions
+    "VPCResource": "resources",
+    "LambdaResource": "resources",
+    "DynamoDBResource": "resources",
+    "SQSResource": "resources",
+    "StorageResource": "resources",
+    "EC2Resource": "resources",
+    "STSResource": "resources",
+    "Route53Resource": "resources",
+    "SNSResource": "resources",
+    "OCIResource": "resources",
+    "GCPComputeResource": "resources",
+    "AzureResource": "resources",
+    "IAMResource": "resources",
+    "OrganizationResource": "resources",
+    "DomainResource": "resources",
+    "CloudResource": "resources",
+    "ProjectResource": "resources",
+    "GeneratorResource": "resources",
+    "GeneratorBatch": "resources",
+    "GeneratorBatchResult": "resources",
+    "UtilitiesResource": "resources",
+    # Helpers
+    "CidrIndex": "resources",
+    "optimize_policy": "resources",
+    "match_action": "resources",
+    "ActionMatcher": "resources",
+}
+
+__all__ = [
     "MockFactoryError",
     "APIError",
     "AuthenticationError",
+    *_LAZY,
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache for subsequent lookups
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY})
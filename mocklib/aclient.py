@@ -0,0 +1,672 @@
+"""MockFactory Async API Client"""
+import asyncio
+import os
+from typing import Optional
+
+from .client import _json_dumps, _json_loads
+from .exceptions import APIError, AuthenticationError, MockFactoryError
+
+# httpx is optional (install with mocklib[async]); the sync client does
+# not depend on it.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# Async resource clients, instantiated lazily on first attribute access
+# (mirrors the sync client's _RESOURCES map).
+_ASYNC_RESOURCES = {
+    "vpc": "AsyncVPCResource",
+    "lambda_function": "AsyncLambdaResource",
+    "dynamodb": "AsyncDynamoDBResource",
+    "sqs": "AsyncSQSResource",
+    "storage": "AsyncStorageResource",
+    "iam": "AsyncIAMResource",
+}
+
+
+class AsyncMockFactory:
+    """
+    MockFactory Async API Client
+
+    Mirrors MockFactory but issues requests through httpx.AsyncClient,
+    so independent calls can be dispatched concurrently with
+    asyncio.gather and total latency approaches the slowest call rather
+    than the sum of all calls.
+
+    Args:
+        api_key: MockFactory API key (or set MOCKFACTORY_API_KEY env var)
+        api_url: API base URL (default: https://api.mockfactory.io/v1)
+        environment_id: Optional environment ID to scope all operations
+        timeout: Per-request timeout in seconds (default: 30)
+        http2: Negotiate HTTP/2 so gathered requests multiplex as
+            independent streams on one connection instead of queueing
+            per socket (requires httpx[http2])
+
+    Example:
+        >>> async with AsyncMockFactory(api_key="mf_...") as mf:
+        ...     vpcs = await asyncio.gather(
+        ...         mf.post("/aws/vpc", json={"CidrBlock": "10.0.0.0/16"}),
+        ...         mf.post("/aws/vpc", json={"CidrBlock": "10.1.0.0/16"}),
+        ...     )
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: str = "https://api.mockfactory.io/v1",
+        environment_id: Optional[str] = None,
+        timeout: float = 30.0,
+        http2: bool = False,
+    ):
+        if httpx is None:
+            raise MockFactoryError(
+                "httpx is required for AsyncMockFactory. "
+                "Install it with: pip install mocklib[async]"
+            )
+
+        self.api_key = api_key or os.getenv("MOCKFACTORY_API_KEY")
+        if not self.api_key:
+            raise AuthenticationError(
+                "API key required. Pass api_key= or set MOCKFACTORY_API_KEY env var"
+            )
+
+        self.api_url = api_url.rstrip("/")
+        self.environment_id = environment_id
+        try:
+            self.session = httpx.AsyncClient(
+                base_url=self.api_url,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                    "User-Agent": "mocklib-python/0.2.0",
+                },
+                timeout=timeout,
+                limits=httpx.Limits(max_keepalive_connections=32),
+                http2=http2,
+            )
+        except ImportError:
+            # httpx raises when http2=True without the h2 package
+            raise MockFactoryError(
+                "h2 is required for http2=True. "
+                "Install it with: pip install httpx[http2]"
+            )
+
+    def __getattr__(self, name: str):
+        cls_name = _ASYNC_RESOURCES.get(name)
+        if cls_name is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        resource = globals()[cls_name](self)
+        setattr(self, name, resource)
+        return resource
+
+    def __dir__(self):
+        return [*super().__dir__(), *_ASYNC_RESOURCES]
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+    ) -> dict:
+        """
+        Make authenticated async request to MockFactory API
+
+        Args:
+            method: HTTP method (GET, POST, DELETE, etc.)
+            endpoint: API endpoint (e.g., "/aws/vpc")
+            json: JSON body
+            params: Query parameters
+
+        Returns:
+            Response JSON
+
+        Raises:
+            APIError: If request fails
+        """
+        try:
+            response = await self.session.request(
+                method=method,
+                url=endpoint,
+                content=_json_dumps(json) if json is not None else None,
+                params=params,
+            )
+            response.raise_for_status()
+            return _json_loads(response.content)
+
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+
+            if status_code == 401:
+                raise AuthenticationError("Invalid API key")
+            elif status_code == 429:
+                raise APIError("Rate limit exceeded")
+            elif status_code >= 500:
+                raise APIError(f"Server error: {e.response.text}")
+            else:
+                raise APIError(f"API error ({status_code}): {e.response.text}")
+
+        except httpx.HTTPError as e:
+            raise APIError(f"Request failed: {str(e)}")
+
+    async def get(self, endpoint: str, params: Optional[dict] = None) -> dict:
+        """GET request"""
+        return await self.request("GET", endpoint, params=params)
+
+    async def post(self, endpoint: str, json: Optional[dict] = None) -> dict:
+        """POST request"""
+        return await self.request("POST", endpoint, json=json)
+
+    async def delete(self, endpoint: str, params: Optional[dict] = None) -> dict:
+        """DELETE request"""
+        return await self.request("DELETE", endpoint, params=params)
+
+    async def put(self, endpoint: str, json: Optional[dict] = None) -> dict:
+        """PUT request"""
+        return await self.request("PUT", endpoint, json=json)
+
+    async def patch(self, endpoint: str, json: Optional[dict] = None) -> dict:
+        """PATCH request"""
+        return await self.request("PATCH", endpoint, json=json)
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client"""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncMockFactory":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+
+class AsyncVPCResource:
+    """Async VPC resource client
+
+    Mirrors VPCResource's core methods with async def, so independent
+    calls can be gathered instead of paying one round-trip at a time.
+    Dataclasses and factories are shared with the sync module.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    async def create(
+        self,
+        cidr_block: str,
+        enable_dns_hostnames: bool = True,
+        enable_dns_support: bool = True,
+        tags: Optional[dict] = None,
+    ):
+        """Create a VPC"""
+        from .resources import _vpc_from_api
+
+        response = await self.client.post("/aws/vpc", json={
+            "Action": "CreateVpc",
+            "CidrBlock": cidr_block,
+            "EnableDnsHostnames": enable_dns_hostnames,
+            "EnableDnsSupport": enable_dns_support,
+            "Tags": tags or {},
+        })
+        return _vpc_from_api(response)
+
+    async def delete(self, vpc_id: str) -> bool:
+        """Delete a VPC"""
+        await self.client.post("/aws/vpc", json={
+            "Action": "DeleteVpc",
+            "VpcId": vpc_id,
+        })
+        return True
+
+    async def list(self):
+        """List all VPCs"""
+        from .resources import _vpc_from_api
+
+        response = await self.client.post(
+            "/aws/vpc", json={"Action": "DescribeVpcs"}
+        )
+        return [_vpc_from_api(vpc) for vpc in response.get("Vpcs", [])]
+
+
+class AsyncLambdaResource:
+    """Async Lambda resource client"""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def create(
+        self,
+        function_name: str,
+        runtime: str,
+        handler: str = "index.handler",
+        memory_mb: int = 128,
+        timeout: int = 30,
+        code_zip: Optional[bytes] = None,
+        environment_variables: Optional[dict] = None,
+    ):
+        """Create a Lambda function"""
+        from .resources import Lambda, _b64
+
+        response = await self.client.post("/lambda/2015-03-31/functions", json={
+            "FunctionName": function_name,
+            "Runtime": runtime,
+            "Handler": handler,
+            "MemorySize": memory_mb,
+            "Timeout": timeout,
+            "Code": {
+                "ZipFile": _b64.b64encode(code_zip).decode("ascii") if code_zip else None
+            },
+            "Environment": {
+                "Variables": environment_variables or {}
+            }
+        })
+        return Lambda(
+            id=response["FunctionId"],
+            function_name=response["FunctionName"],
+            runtime=response["Runtime"],
+            memory_mb=response["MemorySize"],
+            timeout=response["Timeout"],
+            state=response["State"],
+            arn=response.get("FunctionArn"),
+        )
+
+    async def list(self) -> list:
+        """List all Lambda functions"""
+        response = await self.client.get("/lambda/2015-03-31/functions")
+        return response.get("Functions", [])
+
+    async def get(self, function_name: str) -> dict:
+        """Get a Lambda function by name"""
+        return await self.client.get(
+            f"/lambda/2015-03-31/functions/{function_name}"
+        )
+
+    async def invoke(
+        self,
+        function_name: str,
+        payload: Optional[dict] = None,
+    ) -> dict:
+        """Invoke a Lambda function"""
+        response = await self.client.post(
+            f"/lambda/2015-03-31/functions/{function_name}/invocations",
+            json=payload or {},
+        )
+        return response.get("Payload", response)
+
+    async def delete(self, function_name: str) -> bool:
+        """Delete a Lambda function"""
+        await self.client.delete(f"/lambda/2015-03-31/functions/{function_name}")
+        return True
+
+
+class AsyncDynamoDBResource:
+    """Async DynamoDB resource client"""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def create_table(
+        self,
+        table_name: str,
+        partition_key: str,
+        partition_key_type: str = "S",
+        sort_key: Optional[str] = None,
+        sort_key_type: str = "S",
+    ):
+        """Create a DynamoDB table"""
+        from .resources import DynamoDB
+
+        response = await self.client.post("/aws/dynamodb", json={
+            "Action": "CreateTable",
+            "TableName": table_name,
+            "PartitionKey": partition_key,
+            "PartitionKeyType": partition_key_type,
+            "SortKey": sort_key,
+            "SortKeyType": sort_key_type,
+        })
+        return DynamoDB(
+            id=response["TableId"],
+            table_name=response["TableName"],
+            partition_key=response["PartitionKey"],
+            partition_key_type=response["PartitionKeyType"],
+            item_count=0,
+            state=response["State"],
+        )
+
+    async def put_item(self, table_name: str, item: dict) -> bool:
+        """Put an item into DynamoDB table"""
+        await self.client.post("/aws/dynamodb", json={
+            "Action": "PutItem",
+            "TableName": table_name,
+            "Item": item,
+        })
+        return True
+
+    async def get_item(self, table_name: str, key: dict) -> Optional[dict]:
+        """Get an item from DynamoDB table"""
+        response = await self.client.post("/aws/dynamodb", json={
+            "Action": "GetItem",
+            "TableName": table_name,
+            "Key": key,
+        })
+        return response.get("Item")
+
+    async def delete_item(self, table_name: str, key: dict) -> bool:
+        """Delete an item from a DynamoDB table"""
+        await self.client.post("/aws/dynamodb", json={
+            "Action": "DeleteItem",
+            "TableName": table_name,
+            "Key": key,
+        })
+        return True
+
+    async def query(
+        self,
+        table_name: str,
+        key_condition_expression: str,
+        expression_attribute_values: Optional[dict] = None,
+        expression_attribute_names: Optional[dict] = None,
+        limit: Optional[int] = None,
+    ) -> list:
+        """Query a DynamoDB table"""
+        body: dict = {
+            "Action": "Query",
+            "TableName": table_name,
+            "KeyConditionExpression": key_condition_expression,
+            "ExpressionAttributeValues": expression_attribute_values or {},
+            "ExpressionAttributeNames": expression_attribute_names or {},
+        }
+        if limit is not None:
+            body["Limit"] = limit
+        response = await self.client.post("/aws/dynamodb", json=body)
+        return response.get("Items", [])
+
+
+class AsyncSQSResource:
+    """Async SQS resource client"""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def create_queue(
+        self,
+        queue_name: str,
+        visibility_timeout: int = 30,
+        message_retention: int = 345600,
+    ):
+        """Create an SQS queue"""
+        from .resources import SQS
+
+        response = await self.client.post("/aws/sqs", json={
+            "Action": "CreateQueue",
+            "QueueName": queue_name,
+            "VisibilityTimeout": visibility_timeout,
+            "MessageRetentionPeriod": message_retention,
+        })
+        return SQS(
+            id=response["QueueId"],
+            queue_name=response["QueueName"],
+            queue_url=response["QueueUrl"],
+            visibility_timeout=visibility_timeout,
+            message_count=0,
+        )
+
+    async def send_message(self, queue_url: str, message_body: str) -> str:
+        """Send a message to SQS queue"""
+        response = await self.client.post("/aws/sqs", json={
+            "Action": "SendMessage",
+            "QueueUrl": queue_url,
+            "MessageBody": message_body,
+        })
+        return response["MessageId"]
+
+    async def receive_messages(
+        self,
+        queue_url: str,
+        max_messages: int = 1,
+    ) -> list:
+        """Receive messages from SQS queue"""
+        response = await self.client.post("/aws/sqs", json={
+            "Action": "ReceiveMessage",
+            "QueueUrl": queue_url,
+            "MaxNumberOfMessages": max_messages,
+        })
+        return response.get("Messages", [])
+
+    async def delete_message(self, queue_url: str, receipt_handle: str) -> bool:
+        """Delete a message from an SQS queue"""
+        await self.client.post("/aws/sqs", json={
+            "Action": "DeleteMessage",
+            "QueueUrl": queue_url,
+            "ReceiptHandle": receipt_handle,
+        })
+        return True
+
+    async def delete_queue(self, queue_url: str) -> bool:
+        """Delete an SQS queue"""
+        await self.client.post("/aws/sqs", json={
+            "Action": "DeleteQueue",
+            "QueueUrl": queue_url,
+        })
+        return True
+
+
+class AsyncStorageResource:
+    """Async storage (S3/GCS/Azure) resource client"""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def create_bucket(
+        self,
+        bucket_name: str,
+        provider: str = "s3",
+        region: str = "us-east-1",
+    ):
+        """Create a storage bucket"""
+        from .resources import Storage
+
+        response = await self.client.post("/storage/bucket", json={
+            "Action": "CreateBucket",
+            "BucketName": bucket_name,
+            "Provider": provider,
+            "Region": region,
+        })
+        return Storage(
+            id=response["BucketId"],
+            bucket_name=response["BucketName"],
+            region=response["Region"],
+            size_bytes=0,
+        )
+
+    async def upload_file(self, bucket_name: str, key: str, data: bytes) -> bool:
+        """Upload file to storage bucket"""
+        from .resources import _b64
+
+        await self.client.post("/storage/object", json={
+            "Action": "PutObject",
+            "BucketName": bucket_name,
+            "Key": key,
+            "Data": _b64.b64encode(data).decode("ascii"),
+        })
+        return True
+
+    async def list_objects(
+        self,
+        bucket_name: str,
+        prefix: Optional[str] = None,
+        max_keys: int = 1000,
+    ) -> list:
+        """List objects in a storage bucket"""
+        body: dict = {
+            "Action": "ListObjects",
+            "BucketName": bucket_name,
+            "MaxKeys": max_keys,
+        }
+        if prefix:
+            body["Prefix"] = prefix
+        response = await self.client.post("/storage/object", json=body)
+        return response.get("Contents", [])
+
+
+class AsyncIAMResource:
+    """Async IAM resource client
+
+    Mirrors IAMResource's core setup methods with async def, so the
+    many independent create/attach calls of a scenario bootstrap can be
+    gathered over the shared keep-alive pool instead of serializing one
+    round-trip at a time.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    async def create_user(
+        self,
+        username: str,
+        path: str = "/",
+        organization: Optional[str] = None,
+        cloud: Optional[str] = None,
+    ):
+        """Create an IAM user"""
+        from .resources import _drop_none, _iam_user_from_api
+
+        response = await self.client.post("/iam/user", json=_drop_none({
+            "username": username,
+            "path": path,
+            "organization": organization,
+            "cloud": cloud,
+        }))
+        return _iam_user_from_api(response)
+
+    async def create_role(
+        self,
+        role_name: str,
+        trust_policy: dict,
+        organization: Optional[str] = None,
+        cloud: Optional[str] = None,
+        description: Optional[str] = None,
+    ):
+        """Create an IAM role"""
+        from .resources import _drop_none, _iam_role_from_api
+
+        response = await self.client.post("/iam/role", json=_drop_none({
+            "role_name": role_name,
+            "trust_policy": trust_policy,
+            "organization": organization,
+            "cloud": cloud,
+            "description": description,
+        }))
+        return _iam_role_from_api(response)
+
+    async def create_policy(
+        self,
+        policy_name: str,
+        policy_document: dict,
+        description: Optional[str] = None,
+        organization: Optional[str] = None,
+        cloud: Optional[str] = None,
+    ):
+        """Create an IAM policy"""
+        from .resources import _drop_none, _iam_policy_from_api, optimize_policy
+
+        if getattr(self.client, "iam_optimize", False):
+            policy_document = optimize_policy(policy_document)
+        response = await self.client.post("/iam/policy", json=_drop_none({
+            "policy_name": policy_name,
+            "policy_document": policy_document,
+            "description": description,
+            "organization": organization,
+            "cloud": cloud,
+        }))
+        return _iam_policy_from_api(response)
+
+    async def bulk_create_policies(self, specs: list) -> list:
+        """
+        Create many policies concurrently
+
+        Args:
+            specs: List of keyword dicts, each accepted by create_policy
+
+        Returns:
+            List of IAMPolicy objects, in input order
+
+        Example:
+            >>> policies = await mf.iam.bulk_create_policies([
+            ...     {"policy_name": "p1", "policy_document": doc1},
+            ...     {"policy_name": "p2", "policy_document": doc2},
+            ... ])
+        """
+        return list(await asyncio.gather(
+            *(self.create_policy(**spec) for spec in specs)
+        ))
+
+    async def attach_user_policy(self, username: str, policy_name: str) -> bool:
+        """Attach a policy to a user"""
+        from .resources import _quote
+
+        await self.client.post(
+            "/iam/user/" + _quote(username, safe="") + "/policies",
+            json={"policy_name": policy_name},
+        )
+        return True
+
+    async def attach_role_policy(self, role_name: str, policy_name: str) -> bool:
+        """Attach a policy to a role"""
+        from .resources import _quote
+
+        await self.client.post(
+            "/iam/role/" + _quote(role_name, safe="") + "/policies",
+            json={"policy_name": policy_name},
+        )
+        return True
+
+    async def attach_group_policy(self, group_name: str, policy_name: str) -> bool:
+        """Attach a policy to a group"""
+        from .resources import _quote
+
+        await self.client.post(
+            "/iam/group/" + _quote(group_name, safe="") + "/policies",
+            json={"policy_name": policy_name},
+        )
+        return True
+
+    async def delete_user(self, username: str) -> bool:
+        """Delete an IAM user"""
+        from .resources import _quote
+
+        await self.client.delete("/iam/user/" + _quote(username, safe=""))
+        return True
+
+    async def delete_policy(self, policy_name: str) -> bool:
+        """Delete an IAM policy"""
+        from .resources import _quote
+
+        await self.client.delete("/iam/policy/" + _quote(policy_name, safe=""))
+        return True
+
+
+def run_parallel(coros):
+    """
+    Run independent coroutines concurrently from synchronous code
+
+    Convenience wrapper for scripts that are otherwise synchronous:
+    spins up a private event loop, gathers the coroutines, and returns
+    their results in order.
+
+    Example:
+        >>> mf = AsyncMockFactory(api_key="mf_...")
+        >>> results = run_parallel([
+        ...     mf.post("/iam/user", json={"UserName": "alice"}),
+        ...     mf.post("/iam/user", json={"UserName": "bob"}),
+        ... ])
+    """
+
+    async def _gather():
+        return await asyncio.gather(*coros)
+
+    return asyncio.run(_gather())
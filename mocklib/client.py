@@ -1,25 +1,261 @@
 """MockFactory API Client"""
 import os
-import requests
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from .resources import (
-    VPCResource, LambdaResource, DynamoDBResource, SQSResource, StorageResource,
-    OrganizationResource, DomainResource, CloudResource, ProjectResource,
-    IAMResource, GeneratorResource, UtilitiesResource,
-    EC2Resource, STSResource, Route53Resource, SNSResource,
-    OCIResource, GCPComputeResource, AzureResource,
+
+import requests
+from urllib3.util.retry import Retry
+from .exceptions import APIError, AuthenticationError, MockFactoryError
+
+# Optional orjson: serializes/deserializes request bodies several times
+# faster than stdlib json. Falls back transparently when not installed.
+try:
+    import orjson as _orjson
+
+    def _json_dumps(obj) -> bytes:
+        return _orjson.dumps(obj)
+
+    def _json_loads(data: bytes):
+        return _orjson.loads(data)
+
+except ImportError:
+    import dataclasses as _dataclasses
+    import json as _stdlib_json
+
+    def _json_default(obj):
+        # orjson serializes dataclasses natively; mirror that here so
+        # payloads behave the same with or without the extra installed.
+        if _dataclasses.is_dataclass(obj):
+            return _dataclasses.asdict(obj)
+        raise TypeError(
+            f"Object of type {type(obj).__name__} is not JSON serializable"
+        )
+
+    def _json_dumps(obj) -> bytes:
+        return _stdlib_json.dumps(obj, default=_json_default).encode("utf-8")
+
+    def _json_loads(data: bytes):
+        return _stdlib_json.loads(data)
+
+
+# Optional msgpack (install with mocklib[msgpack]): bulk endpoints like
+# the generators return large arrays that decode faster and travel
+# smaller as MessagePack. Negotiated via Accept; JSON stays the default
+# and the fallback.
+try:
+    import msgpack as _msgpack
+except ImportError:
+    _msgpack = None
+
+_ACCEPT = (
+    "application/msgpack, application/json;q=0.5"
+    if _msgpack is not None
+    else "application/json"
 )
-from .exceptions import APIError, AuthenticationError
+
+
+def _decode_response(response):
+    """Decode a response body according to its Content-Type"""
+    if (
+        _msgpack is not None
+        and response.headers.get("Content-Type", "").startswith("application/msgpack")
+    ):
+        return _msgpack.unpackb(response.content, raw=False)
+    return _json_loads(response.content)
+
+
+# AWS-style POST bodies carry an "Action"; these prefixes mark pure reads
+_READ_ACTION_PREFIXES = ("Describe", "List", "Get")
+
+# POST endpoints that are reads despite lacking an Action marker:
+# authz checks are hot, idempotent, and safe to serve from cache
+# between mutations (which invalidate by endpoint prefix).
+_READ_POST_ENDPOINTS = frozenset({
+    "/iam/check-permission",
+    "/iam/check-permissions",
+    "/iam/simulate-policy",
+})
+
+
+class _TTLCache:
+    """Small TTL + LRU cache over an OrderedDict
+
+    Entries expire after ttl seconds; when full, the least recently used
+    entry is evicted. Not thread-safe beyond the GIL's dict guarantees,
+    which matches the session's own best-effort thread safety.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate_endpoint(self, endpoint: str) -> None:
+        """Drop cached entries whose endpoint shares a prefix with endpoint"""
+        stale = [
+            key for key in self._data
+            if key[1].startswith(endpoint) or endpoint.startswith(key[1])
+        ]
+        for key in stale:
+            del self._data[key]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Resource clients, instantiated lazily on first attribute access. The
+# class names are resolved against the resources module on demand, so
+# importing this module does not load it.
+_RESOURCES = {
+    "vpc": "VPCResource",
+    "lambda_function": "LambdaResource",
+    "dynamodb": "DynamoDBResource",
+    "sqs": "SQSResource",
+    "storage": "StorageResource",
+    # AWS service clients
+    "ec2": "EC2Resource",
+    "sts": "STSResource",
+    "route53": "Route53Resource",
+    "sns": "SNSResource",
+    # Multi-cloud providers
+    "oci": "OCIResource",
+    "gcp": "GCPComputeResource",
+    "azure": "AzureResource",
+    # Hierarchical resources
+    "organization": "OrganizationResource",
+    "domain": "DomainResource",
+    "cloud": "CloudResource",
+    "project": "ProjectResource",
+    # IAM (Identity and Access Management)
+    "iam": "IAMResource",
+    # Data generation and utilities
+    "generator": "GeneratorResource",
+    "utilities": "UtilitiesResource",
+}
+
+
+# Endpoints hot enough to pre-resolve into absolute URLs at client init
+_COMMON_ENDPOINTS = (
+    "/aws/vpc",
+    "/lambda/2015-03-31/functions",
+    "/aws/dynamodb",
+    "/aws/sqs",
+    "/storage/bucket",
+    "/storage/object",
+    "/iam/user",
+    "/iam/policy",
+)
+
+# Sessions shared across MockFactory instances, keyed on API URL: a
+# per-test fixture that builds a fresh client reuses the existing
+# connection pool (and its DNS/TLS state) instead of re-handshaking.
+_SESSION_CACHE: dict = {}
+
+# Most (url, params) pairs a client re-reads; bounds the per-instance
+# ETag revalidation cache below.
+_ETAG_CACHE_MAX = 256
+
+
+def _raise_for(response) -> None:
+    """Map a non-2xx response onto the SDK exception hierarchy"""
+    status_code = response.status_code
+    if status_code < 400:
+        return
+    if status_code == 401:
+        raise AuthenticationError("Invalid API key")
+    if status_code == 429:
+        raise APIError("Rate limit exceeded")
+    if status_code >= 500:
+        raise APIError(f"Server error: {response.text}")
+    raise APIError(f"API error ({status_code}): {response.text}")
+
+
+def _build_session(
+    retries: int,
+    pool_connections: int = 10,
+    pool_maxsize: int = 32,
+) -> requests.Session:
+    """Build a pooled session with the standard retry policy mounted"""
+    session = requests.Session()
+    # Size the connection pool for concurrent use (e.g. helpers that
+    # fan out over a thread pool) so threads reuse keep-alive
+    # connections instead of opening a socket per request.
+    # Retry transient failures at the transport layer: connection
+    # errors and throttling/gateway statuses back off exponentially
+    # and honor Retry-After. Mutations against the mock API are
+    # idempotent, so POST is safe to retry.
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.1,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=("GET", "POST", "PUT", "DELETE", "PATCH"),
+        respect_retry_after_header=True,
+    ) if retries > 0 else 0
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class MockFactory:
     """
     MockFactory API Client
 
+    Every resource client constructed as Resource(client) issues its
+    HTTP calls through this object, which holds one pooled keep-alive
+    requests.Session for its lifetime (shared across instances pointing
+    at the same API URL). Resource classes must not open their own
+    connections; going through client.get/post/delete is what gives
+    them connection reuse, retries, and response caching uniformly.
+
     Args:
         api_key: MockFactory API key (or set MOCKFACTORY_API_KEY env var)
         api_url: API base URL (default: https://api.mockfactory.io/v1)
         environment_id: Optional environment ID to scope all operations
+        timeout: Per-request timeout in seconds (default: 30)
+        cache_ttl: When > 0, cache idempotent reads (GETs and AWS-style
+            Describe*/List*/Get* POSTs) client-side for this many seconds;
+            mutations and deletes through the same client invalidate
+            affected entries. Read-heavy workflows that resolve the same
+            organization/domain/cloud/project before each subordinate
+            create are served locally after the first lookup
+        retries: Transport-level retries for connection errors and
+            429/502/503/504 responses, with exponential backoff honoring
+            Retry-After (default: 5; 0 disables)
+        iam_optimize: Merge IAM policy statements that differ only in
+            Resource before sending (see resources.optimize_policy)
+        utilities_local: Compute convertible utility helpers (IP, CIDR,
+            hex, base64, ...) locally instead of round-tripping to the
+            API (default: True); UtilitiesResource(local=...) overrides
+            per instance
+        pool_connections: Connection pools kept by the transport
+            (default: 10); like retries, fixed by the first client for
+            a given API URL
+        pool_maxsize: Keep-alive connections per pool (default: 32);
+            raise for heavy thread-pool fan-out
 
     Example:
         >>> mf = MockFactory(api_key="mf_...")
@@ -33,6 +269,13 @@ class MockFactory:
         api_key: Optional[str] = None,
         api_url: str = "https://api.mockfactory.io/v1",
         environment_id: Optional[str] = None,
+        timeout: float = 30.0,
+        cache_ttl: float = 0.0,
+        retries: int = 5,
+        iam_optimize: bool = False,
+        utilities_local: bool = True,
+        pool_connections: int = 10,
+        pool_maxsize: int = 32,
     ):
         self.api_key = api_key or os.getenv("MOCKFACTORY_API_KEY")
         if not self.api_key:
@@ -42,43 +285,66 @@ class MockFactory:
 
         self.api_url = api_url.rstrip("/")
         self.environment_id = environment_id
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.timeout = timeout
+        self._cache = _TTLCache(ttl=cache_ttl) if cache_ttl > 0 else None
+        self.iam_optimize = iam_optimize
+        self.utilities_local = utilities_local
+        # The connection pool is shared per API URL across instances;
+        # auth travels in per-request headers so clients with different
+        # keys can safely share one pool. The first instance for a given
+        # URL fixes the pool's retry policy.
+        session_key = (self.api_url,)
+        session = _SESSION_CACHE.get(session_key)
+        if session is None:
+            session = _SESSION_CACHE[session_key] = _build_session(
+                retries, pool_connections, pool_maxsize
+            )
+        self.session = session
+        self._headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
-            "User-Agent": f"mocklib-python/0.1.0",
-        })
+            # Repetitive JSON (policy documents, list responses)
+            # compresses well; urllib3 decompresses transparently.
+            "Accept-Encoding": "gzip",
+            "Accept": _ACCEPT,
+            "User-Agent": "mocklib-python/0.2.0",
+        }
+        # endpoint -> absolute URL, seeded with the hot endpoints and
+        # extended on first use of any other endpoint
+        self._url_cache = {ep: self.api_url + ep for ep in _COMMON_ENDPOINTS}
+        # (url, params) -> (etag, decoded body) for conditional GETs; a
+        # 304 revalidation reuses the decoded result without
+        # re-transferring or re-parsing the response
+        self._etag_cache: OrderedDict = OrderedDict()
 
-        # Initialize resource clients
-        self.vpc = VPCResource(self)
-        self.lambda_function = LambdaResource(self)
-        self.dynamodb = DynamoDBResource(self)
-        self.sqs = SQSResource(self)
-        self.storage = StorageResource(self)
-
-        # AWS service clients
-        self.ec2 = EC2Resource(self)
-        self.sts = STSResource(self)
-        self.route53 = Route53Resource(self)
-        self.sns = SNSResource(self)
-
-        # Multi-cloud providers
-        self.oci = OCIResource(self)
-        self.gcp = GCPComputeResource(self)
-        self.azure = AzureResource(self)
-
-        # Hierarchical resources
-        self.organization = OrganizationResource(self)
-        self.domain = DomainResource(self)
-        self.cloud = CloudResource(self)
-        self.project = ProjectResource(self)
-
-        # IAM (Identity and Access Management)
-        self.iam = IAMResource(self)
-
-        # Data generation and utilities
-        self.generator = GeneratorResource(self)
-        self.utilities = UtilitiesResource(self)
+    def close(self) -> None:
+        """Close the underlying HTTP session and its connection pool
+
+        The session may be shared with other MockFactory instances
+        pointing at the same API URL; after close() the next client for
+        that URL builds a fresh pool.
+        """
+        key = (self.api_url,)
+        if _SESSION_CACHE.get(key) is self.session:
+            del _SESSION_CACHE[key]
+        self.session.close()
+
+    def __getattr__(self, name: str):
+        # Resource clients are created on first access and cached on the
+        # instance, so constructing a MockFactory stays cheap.
+        cls_name = _RESOURCES.get(name)
+        if cls_name is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        from . import resources
+
+        resource = getattr(resources, cls_name)(self)
+        setattr(self, name, resource)
+        return resource
+
+    def __dir__(self):
+        return [*super().__dir__(), *_RESOURCES]
 
     def request(
         self,
@@ -102,44 +368,248 @@ class MockFactory:
         Raises:
             APIError: If request fails
         """
-        url = f"{self.api_url}{endpoint}"
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = self.api_url + endpoint
+        body = _json_dumps(json) if json is not None else None
+
+        cache_key = None
+        if self._cache is not None:
+            if method == "GET":
+                cacheable = True
+            elif method == "POST" and json is not None:
+                action = json.get("Action", "")
+                cacheable = (
+                    action.startswith(_READ_ACTION_PREFIXES)
+                    or endpoint in _READ_POST_ENDPOINTS
+                )
+            else:
+                cacheable = False
+
+            if cacheable:
+                cache_key = (
+                    method,
+                    endpoint,
+                    tuple(sorted(params.items())) if params else None,
+                    body,
+                )
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    return cached
+            elif method in ("POST", "PUT", "PATCH", "DELETE"):
+                # Mutation: drop stale reads for the same endpoint family
+                self._cache.invalidate_endpoint(endpoint)
+                if endpoint.startswith("/iam/"):
+                    # Any IAM mutation can flip a cached authz decision
+                    for read_endpoint in _READ_POST_ENDPOINTS:
+                        self._cache.invalidate_endpoint(read_endpoint)
 
         try:
+            # Serialize the body ourselves (orjson when available) instead
+            # of letting requests call stdlib json per request.
             response = self.session.request(
                 method=method,
                 url=url,
-                json=json,
+                data=body,
                 params=params,
+                headers=self._headers,
+                timeout=self.timeout,
             )
-            response.raise_for_status()
-            return response.json()
-
-        except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code
-
-            if status_code == 401:
-                raise AuthenticationError("Invalid API key")
-            elif status_code == 429:
-                raise APIError("Rate limit exceeded")
-            elif status_code >= 500:
-                raise APIError(f"Server error: {e.response.text}")
-            else:
-                raise APIError(f"API error ({status_code}): {e.response.text}")
+        except requests.exceptions.RequestException as e:
+            raise APIError(f"Request failed: {str(e)}")
+
+        _raise_for(response)
+        result = _decode_response(response)
+        if cache_key is not None:
+            self._cache.set(cache_key, result)
+        return result
 
+    def put_binary(
+        self,
+        endpoint: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+        chunk_size: int = 65536,
+        params: Optional[dict] = None,
+    ) -> dict:
+        """
+        PUT raw bytes, streamed in chunks
+
+        Unlike the JSON path, the payload is sent as-is: no base64
+        expansion and no serializer copy, so a large upload holds only
+        one copy of the data in memory and streams it in chunk_size
+        pieces.
+
+        Args:
+            endpoint: API endpoint
+            data: Raw payload bytes
+            content_type: Content-Type header for the payload
+            chunk_size: Stream chunk size in bytes (default: 64 KiB)
+            params: Query parameters
+
+        Returns:
+            Response JSON
+
+        Raises:
+            APIError: If request fails
+        """
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = self.api_url + endpoint
+
+        def _chunks():
+            for offset in range(0, len(data), chunk_size):
+                yield data[offset:offset + chunk_size]
+
+        try:
+            response = self.session.put(
+                url,
+                data=_chunks(),
+                params=params,
+                headers={**self._headers, "Content-Type": content_type},
+                timeout=self.timeout,
+            )
         except requests.exceptions.RequestException as e:
             raise APIError(f"Request failed: {str(e)}")
 
+        _raise_for(response)
+        return _decode_response(response)
+
+    def warm_all(self, max_workers: int = 10) -> None:
+        """
+        Prime connections and server caches before timed work starts
+
+        Issues one cheap GET per resource family concurrently through
+        the shared pool, so the first real call doesn't pay DNS, TCP,
+        and TLS setup (or a mock server's first-hit initialization).
+        Errors are swallowed: an endpoint that rejects the probe has
+        still opened its connection, which is all warming needs.
+
+        Example:
+            >>> mf = MockFactory(api_key="mf_...")
+            >>> mf.warm_all()
+        """
+
+        def _warm(endpoint: str) -> None:
+            try:
+                self.get(endpoint)
+            except MockFactoryError:
+                # Auth/404/validation rejections still warmed the
+                # connection, which is all the probe is for
+                pass
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(_warm, _COMMON_ENDPOINTS))
+
+    def batch(self, ops: list) -> list:
+        """
+        Execute several API operations in one HTTP request
+
+        Each op is a (method, endpoint, body) tuple. The server's batch
+        endpoint runs them in order and returns one result per op, so a
+        setup sequence of N small calls pays one round-trip instead of N.
+
+        Args:
+            ops: List of (method, endpoint, body) tuples
+
+        Returns:
+            List of response dicts, one per operation, in order
+
+        Example:
+            >>> users = mf.batch([
+            ...     ("POST", "/iam/user", {"username": "alice"}),
+            ...     ("POST", "/iam/user", {"username": "bob"}),
+            ... ])
+        """
+        response = self.post("/batch", json={
+            "Batch": [
+                {"Method": method, "Endpoint": endpoint, "Body": body}
+                for method, endpoint, body in ops
+            ]
+        })
+        if self._cache is not None:
+            # A batch may touch any endpoint; keep cached reads honest.
+            self._cache.clear()
+        return response["Results"]
+
+    # The verb helpers below are the common path for every resource
+    # client, so they call the session's verb methods directly instead
+    # of funneling through the generic request() dispatch. When response
+    # caching is enabled they fall back to request(), which owns the
+    # cache lookup and invalidation logic.
+
     def get(self, endpoint: str, params: Optional[dict] = None) -> dict:
-        """GET request"""
-        return self.request("GET", endpoint, params=params)
+        """GET request
+
+        Repeat GETs revalidate with If-None-Match when the server sent
+        an ETag: a 304 answer reuses the previously decoded body, so
+        confirm-after-write listings pay headers only.
+        """
+        if self._cache is not None:
+            return self.request("GET", endpoint, params=params)
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = self.api_url + endpoint
+        etag_key = (url, tuple(sorted(params.items())) if params else None)
+        entry = self._etag_cache.get(etag_key)
+        headers = (
+            {**self._headers, "If-None-Match": entry[0]}
+            if entry is not None
+            else self._headers
+        )
+        try:
+            response = self.session.get(
+                url, params=params, headers=headers, timeout=self.timeout
+            )
+        except requests.exceptions.RequestException as e:
+            raise APIError(f"Request failed: {str(e)}")
+        if response.status_code == 304 and entry is not None:
+            self._etag_cache.move_to_end(etag_key)
+            return entry[1]
+        _raise_for(response)
+        result = _decode_response(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[etag_key] = (etag, result)
+            self._etag_cache.move_to_end(etag_key)
+            while len(self._etag_cache) > _ETAG_CACHE_MAX:
+                self._etag_cache.popitem(last=False)
+        return result
 
     def post(self, endpoint: str, json: Optional[dict] = None) -> dict:
         """POST request"""
-        return self.request("POST", endpoint, json=json)
+        if self._cache is not None:
+            return self.request("POST", endpoint, json=json)
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = self.api_url + endpoint
+        try:
+            response = self.session.post(
+                url,
+                data=_json_dumps(json) if json is not None else None,
+                headers=self._headers,
+                timeout=self.timeout,
+            )
+        except requests.exceptions.RequestException as e:
+            raise APIError(f"Request failed: {str(e)}")
+        _raise_for(response)
+        return _decode_response(response)
 
     def delete(self, endpoint: str, params: Optional[dict] = None) -> dict:
         """DELETE request"""
-        return self.request("DELETE", endpoint, params=params)
+        if self._cache is not None:
+            return self.request("DELETE", endpoint, params=params)
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = self.api_url + endpoint
+        try:
+            response = self.session.delete(
+                url, params=params, headers=self._headers, timeout=self.timeout
+            )
+        except requests.exceptions.RequestException as e:
+            raise APIError(f"Request failed: {str(e)}")
+        _raise_for(response)
+        return _decode_response(response)
 
     def put(self, endpoint: str, json: Optional[dict] = None) -> dict:
         """PUT request"""
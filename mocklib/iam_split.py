@@ -0,0 +1,77 @@
+"""Size-based splitting of oversize IAM policy documents"""
+import json
+from typing import Any, Dict, List
+
+from .exceptions import ValidationError
+
+# AWS managed-policy size limit in bytes (serialized, whitespace-free)
+DEFAULT_POLICY_SIZE_LIMIT = 6144
+
+# Serialized bytes consumed by the document envelope around Statement,
+# plus per-statement separators; reserved out of each bin's budget.
+_ENVELOPE_OVERHEAD = 64
+
+
+def _statement_size(statement: Dict[str, Any]) -> int:
+    """Serialized size of one statement in compact JSON bytes"""
+    return len(json.dumps(statement, separators=(",", ":")))
+
+
+def split_policy_document(
+    policy_document: Dict[str, Any],
+    limit: int = DEFAULT_POLICY_SIZE_LIMIT,
+) -> List[Dict[str, Any]]:
+    """Split a policy document into compliant sub-documents
+
+    Uses first-fit-decreasing bin packing on serialized statement sizes:
+    statements are sorted largest-first and each is placed in the first
+    sub-document with room, opening a new one when none fits. Documents
+    already within the limit are returned as a single-element list.
+
+    Args:
+        policy_document: Policy document with a Statement list
+        limit: Maximum serialized size per sub-document in bytes
+
+    Returns:
+        List of policy documents, each within the size limit
+
+    Raises:
+        ValidationError: If a single statement exceeds the limit by itself
+    """
+    if _statement_size(policy_document) <= limit:
+        return [policy_document]
+
+    statements = policy_document.get("Statement")
+    if not isinstance(statements, list) or not statements:
+        raise ValidationError(
+            f"Policy document exceeds {limit} bytes and has no Statement "
+            "list to split"
+        )
+
+    budget = limit - _ENVELOPE_OVERHEAD
+    sized = sorted(
+        ((_statement_size(stmt), stmt) for stmt in statements),
+        key=lambda pair: pair[0],
+        reverse=True,
+    )
+
+    bins: List[List[Dict[str, Any]]] = []
+    remaining: List[int] = []
+    for size, stmt in sized:
+        if size > budget:
+            raise ValidationError(
+                f"A single statement ({size} bytes) exceeds the "
+                f"{limit}-byte policy limit; split its Resource list first"
+            )
+        # +1 for the separator between statements
+        for i, free in enumerate(remaining):
+            if free >= size + 1:
+                bins[i].append(stmt)
+                remaining[i] -= size + 1
+                break
+        else:
+            bins.append([stmt])
+            remaining.append(budget - size)
+
+    envelope = {k: v for k, v in policy_document.items() if k != "Statement"}
+    return [{**envelope, "Statement": chunk} for chunk in bins]
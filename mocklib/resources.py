@@ -1,19 +1,520 @@
 """MockFactory Resource Clients"""
-from typing import Optional, List, Dict, Any
+from __future__ import annotations
+
+import binascii
+import fnmatch
+import functools
+import hashlib
+import ipaddress
+import json
+import os
+import re
+import socket
+import struct
+import sys
+import threading
+import time
+import urllib.parse
+import uuid as _uuid
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any
 from dataclasses import dataclass
 
+from .exceptions import MockFactoryError, ValidationError
+from .iam_split import DEFAULT_POLICY_SIZE_LIMIT, split_policy_document
+
+# Optional pybase64: SIMD-accelerated drop-in for base64, worthwhile for
+# large Lambda zips and storage payloads. Falls back to the stdlib.
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+# Optional PyYAML (install with mocklib[yaml]): YAML helpers run locally
+# when available, preferring the libyaml C loader/dumper, and fall back
+# to the server endpoints otherwise.
+try:
+    import yaml
+
+    try:
+        _YAML_LOADER = yaml.CSafeLoader
+        _YAML_DUMPER = yaml.CSafeDumper
+    except AttributeError:
+        _YAML_LOADER = yaml.SafeLoader
+        _YAML_DUMPER = yaml.SafeDumper
+except ImportError:
+    yaml = None
+    _YAML_LOADER = _YAML_DUMPER = None
+
+# Optional NumPy: bulk CIDR membership checks become one vectorized
+# mask-and-compare over a uint32 array. Falls back to a Python loop.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Optional ada-url: SIMD-accelerated WHATWG URL parser for parse_url.
+# Falls back to urllib.parse.
+try:
+    from ada_url import URL as _AdaURL
+except ImportError:
+    _AdaURL = None
+
+# Optional ciso8601: compiled ISO-8601 parser for parse_time. Falls
+# back to datetime.fromisoformat.
+try:
+    import ciso8601 as _ciso8601
+except ImportError:
+    _ciso8601 = None
+
+# Optional python-dateutil: fallback parser for the exotic formats in
+# parse_time; ISO-8601 input never reaches it.
+try:
+    from dateutil import parser as _dateutil_parser
+except ImportError:
+    _dateutil_parser = None
+
+
+def _ip_to_int(ip: str) -> int:
+    """Convert a dotted-quad IPv4 address to its 32-bit integer value"""
+    try:
+        return struct.unpack(">I", socket.inet_aton(ip))[0]
+    except OSError:
+        raise ValidationError(f"Invalid IPv4 address: {ip}")
+
+
+def _int_to_ip(value: int) -> str:
+    """Convert a 32-bit integer to a dotted-quad IPv4 address"""
+    if not 0 <= value <= 0xFFFFFFFF:
+        raise ValidationError(f"Invalid IPv4 integer: {value}")
+    return socket.inet_ntoa(struct.pack(">I", value))
+
+
+# Precompiled validation patterns (anchored; matched once per call)
+_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[1-5][0-9a-fA-F]{3}"
+    r"-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}\Z"
+)
+_ARN_RE = re.compile(r"arn:[^:]*:[^:]*:[^:]*:[^:]*:.+\Z")
+
+# Slugify: one translate pass maps non-alphanumeric ASCII to "-", then
+# non-ASCII leftovers and runs of dashes are collapsed by regex.
+_SLUG_TABLE = {
+    cp: chr(cp) if chr(cp).isalnum() else "-" for cp in range(128)
+}
+_SLUG_NON_ASCII = re.compile(r"[^a-z0-9-]")
+_SLUG_COLLAPSE = re.compile(r"-{2,}")
+
+# time_ago buckets: (upper bound in seconds, seconds per unit, unit name)
+_TIME_AGO_BUCKETS = [
+    (60, 1, "second"),
+    (3600, 60, "minute"),
+    (86400, 3600, "hour"),
+    (2592000, 86400, "day"),
+    (31536000, 2592000, "month"),
+]
+
+
+# Percent-quoting for names embedded in URL paths; bound once since it
+# runs on every path-parameter call
+_quote = urllib.parse.quote
+
+
+def _drop_none(payload: dict[str, Any]) -> dict[str, Any]:
+    """Strip None-valued keys from an outbound payload
+
+    Unset optional fields would otherwise travel as explicit nulls,
+    inflating the serialized body for nothing.
+    """
+    return {k: v for k, v in payload.items() if v is not None}
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern enum-like response strings so repeats share one object
+
+    Fields like state, organization, or path take a handful of distinct
+    values across thousands of rows; interning deduplicates the string
+    objects and makes later equality checks pointer comparisons.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _rows_to_columns(rows: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """Pivot a list of row dicts into a dict of per-field value lists"""
+    if not rows:
+        return {}
+    return {key: [row.get(key) for row in rows] for key in rows[0]}
+
+
+# Entropy pool for UUIDv4 generation: refill from os.urandom in 2 KiB
+# blocks (128 UUIDs) instead of hitting the CSPRNG once per UUID.
+# The lock keeps concurrent callers (invoke_many, warm_all) from
+# reading the same slice; uncontended it costs far less than the
+# os.urandom call it amortizes.
+_UUID_POOL = bytearray()
+_UUID_POOL_OFFSET = 0
+_UUID_POOL_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_action_pattern(pattern: str):
+    """Compile an IAM action glob ("s3:Get*") to a case-insensitive regex"""
+    return re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+
+
+def match_action(action: str, pattern: str) -> bool:
+    """Check whether an action matches an IAM-style glob pattern
+
+    Compiled patterns are memoized, so evaluating the same policy
+    against many request actions compiles each glob once.
+
+    Args:
+        action: Request action (e.g. "ec2:RunInstances")
+        pattern: Statement pattern (e.g. "ec2:Describe*" or "*")
+
+    Returns:
+        True if the action matches
+
+    Example:
+        >>> match_action("s3:GetObject", "s3:Get*")
+        True
+    """
+    return _compile_action_pattern(pattern).match(action) is not None
+
+
+class ActionMatcher:
+    """Pre-compiled matcher for a fixed set of IAM action patterns
+
+    Compiles every statement pattern up front so repeated permission
+    checks against the same policy skip per-call compilation.
+
+    Example:
+        >>> matcher = ActionMatcher(["s3:Get*", "ec2:Describe*"])
+        >>> matcher.match("s3:GetObject")
+        [0]
+    """
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = list(patterns)
+        self._compiled = [_compile_action_pattern(p) for p in self.patterns]
+        # All patterns also compile into ONE alternation, each as its own
+        # capture group: a single scan answers "any match?" and yields the
+        # first matching index via lastindex, instead of running N regex
+        # machines per action.
+        self._combined = re.compile(
+            "|".join(f"({fnmatch.translate(p)})" for p in self.patterns),
+            re.IGNORECASE,
+        ) if self.patterns else None
+
+    def match(self, action: str) -> list[int]:
+        """Return the indexes of all patterns matching action"""
+        if self._combined is None:
+            return []
+        first = self._combined.match(action)
+        if first is None:
+            return []
+        # The alternation already proved a match at lastindex-1; only the
+        # later patterns still need individual checks.
+        start = first.lastindex - 1
+        return [start] + [
+            i for i in range(start + 1, len(self._compiled))
+            if self._compiled[i].match(action) is not None
+        ]
+
+    def first_match(self, action: str) -> int | None:
+        """Return the index of the first matching pattern, or None"""
+        if self._combined is None:
+            return None
+        found = self._combined.match(action)
+        return found.lastindex - 1 if found else None
+
+    def matches(self, action: str) -> bool:
+        """Return True if any pattern matches action"""
+        return self._combined is not None and self._combined.match(action) is not None
+
+
+def optimize_policy(policy_document: dict[str, Any]) -> dict[str, Any]:
+    """Merge IAM policy statements that differ only in Resource
+
+    Statements with identical Effect, Action, Condition, Principal, and
+    every other non-Resource field are collapsed into one statement with
+    a combined Resource list. The rewrite is permission-preserving: it
+    never changes which (action, resource) pairs a document allows or
+    denies, only how they are grouped. Returns a new document; the input
+    is not modified.
+
+    Example:
+        >>> doc = optimize_policy(doc)  # 40 per-bucket statements -> 1
+    """
+    statements = policy_document.get("Statement")
+    if not isinstance(statements, list) or len(statements) < 2:
+        return policy_document
+
+    merged: list[dict[str, Any]] = []
+    groups: dict[str, dict[str, Any]] = {}
+    for stmt in statements:
+        if not isinstance(stmt, dict) or "Resource" not in stmt:
+            merged.append(stmt)
+            continue
+        # Everything except Resource (and the purely informational Sid)
+        # must match exactly for a merge to be safe.
+        key = json.dumps(
+            {k: v for k, v in stmt.items() if k not in ("Resource", "Sid")},
+            sort_keys=True,
+        )
+        resources = stmt["Resource"]
+        if not isinstance(resources, list):
+            resources = [resources]
+        existing = groups.get(key)
+        if existing is None:
+            new_stmt = dict(stmt)
+            new_stmt["Resource"] = list(resources)
+            groups[key] = new_stmt
+            merged.append(new_stmt)
+        else:
+            existing["Resource"].extend(
+                r for r in resources if r not in existing["Resource"]
+            )
 
-@dataclass
+    # Preserve the scalar form for statements that were never merged
+    for stmt in merged:
+        if isinstance(stmt, dict) and isinstance(stmt.get("Resource"), list):
+            if len(stmt["Resource"]) == 1:
+                stmt["Resource"] = stmt["Resource"][0]
+
+    optimized = dict(policy_document)
+    optimized["Statement"] = merged
+    return optimized
+
+
+class CidrIndex:
+    """Reusable membership index for one or more CIDR blocks
+
+    Parses the CIDRs once, then answers ``ip in index`` with a mask
+    compare per block — no per-check parsing and no HTTP round-trip.
+    Useful when the same ranges are tested thousands of times.
+
+    Example:
+        >>> index = CidrIndex("10.0.0.0/16")
+        >>> "10.0.4.2" in index
+        True
+        >>> "192.168.0.1" in index
+        False
+    """
+
+    def __init__(self, *cidrs: str):
+        if not cidrs:
+            raise ValidationError("At least one CIDR is required")
+        self._blocks = [_parse_cidr(cidr) for cidr in cidrs]
+
+    def __contains__(self, ip) -> bool:
+        value = ip if isinstance(ip, int) else _ip_to_int(ip)
+        return any((value & mask) == base for base, mask in self._blocks)
+
+    def __repr__(self) -> str:
+        return f"CidrIndex(blocks={len(self._blocks)})"
+
+
+# Character sets accepted by random_string/random_strings
+_CHARSETS = {
+    "alphanumeric": "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789",
+    "alpha": "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "numeric": "0123456789",
+    "hex": "0123456789abcdef",
+}
+
+
+# charset -> 256-entry byte table mapping raw entropy to characters, or
+# None where a table draw would be biased; built on first use
+_TRANSLATE_TABLES: dict[str, "bytes | None"] = {}
+
+
+def _charset_table(charset: str) -> "bytes | None":
+    """Build (and cache) a urandom-to-charset translate table
+
+    Only charsets whose size divides 256 map uniformly through a byte
+    table (each character claims the same number of byte values);
+    anything else returns None and keeps rejection sampling.
+    """
+    if charset in _TRANSLATE_TABLES:
+        return _TRANSLATE_TABLES[charset]
+    n = len(charset)
+    table = None
+    if n and 256 % n == 0 and charset.isascii():
+        encoded = charset.encode("ascii")
+        table = bytes(encoded[byte % n] for byte in range(256))
+    _TRANSLATE_TABLES[charset] = table
+    return table
+
+
+def _random_chars(length: int, charset: str) -> str:
+    """Draw characters uniformly from charset using rejection sampling
+
+    Charsets whose size divides 256 skip the rejection loop entirely:
+    one urandom read runs through a cached bytes.translate table, a
+    C-level 256-entry LUT walk.
+    """
+    if length < 1:
+        raise ValidationError("length must be a positive integer")
+    table = _charset_table(charset)
+    if table is not None:
+        return os.urandom(length).translate(table).decode("ascii")
+    n = len(charset)
+    limit = 256 - (256 % n)
+    chars: list[str] = []
+    while len(chars) < length:
+        for byte in os.urandom(length - len(chars) + 8):
+            if byte < limit:
+                chars.append(charset[byte % n])
+                if len(chars) == length:
+                    break
+    return "".join(chars)
+
+
+def _fast_uuid4() -> str:
+    """Generate a UUIDv4 string from the shared entropy pool"""
+    global _UUID_POOL, _UUID_POOL_OFFSET
+    with _UUID_POOL_LOCK:
+        if _UUID_POOL_OFFSET + 16 > len(_UUID_POOL):
+            _UUID_POOL = bytearray(os.urandom(2048))
+            _UUID_POOL_OFFSET = 0
+        raw = _UUID_POOL[_UUID_POOL_OFFSET:_UUID_POOL_OFFSET + 16]
+        _UUID_POOL_OFFSET += 16
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return str(_uuid.UUID(bytes=bytes(raw)))
+
+
+# Pre-initialized hasher templates: copy() memcpys an already
+# initialized digest context, skipping the per-call setup that
+# hashlib.new() pays — a consistent win when hashing many short
+# strings.
+_HASH_TEMPLATES = {
+    "md5": hashlib.md5(),
+    "sha1": hashlib.sha1(),
+    "sha256": hashlib.sha256(),
+    "sha512": hashlib.sha512(),
+}
+
+
+# Distinguishes "not cached" from a cached falsy result
+_MEMO_MISS = object()
+
+
+class _MemoCache:
+    """Small thread-safe LFU memo for pure helper results
+
+    Keys are (method, args) tuples; values are whatever the helper
+    returned. Hash inputs tend to be power-law skewed — a few keys
+    repeat constantly while most appear once — and LFU keeps those hot
+    keys resident where LRU would drop them after any burst of one-off
+    inputs. Eviction removes the coldest eighth in one pass, amortizing
+    the frequency scan across many inserts.
+    """
+
+    __slots__ = ("maxsize", "_data", "_lock")
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: dict = {}  # key -> [value, access_count]
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MEMO_MISS
+            entry[1] += 1
+            return entry[0]
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                entry[0] = value
+                return
+            if len(self._data) >= self.maxsize:
+                coldest = sorted(
+                    self._data.items(), key=lambda item: item[1][1]
+                )[: max(1, self.maxsize // 8)]
+                for cold_key, _ in coldest:
+                    del self._data[cold_key]
+            self._data[key] = [value, 1]
+
+
+def _parse_cidr(cidr: str) -> "tuple":
+    """Parse CIDR notation into (network_base, netmask) 32-bit integers"""
+    ip, sep, prefix_str = cidr.partition("/")
+    if not sep:
+        raise ValidationError(f"Invalid CIDR notation: {cidr}")
+    try:
+        prefix = int(prefix_str)
+    except ValueError:
+        raise ValidationError(f"Invalid CIDR prefix: {cidr}")
+    if not 0 <= prefix <= 32:
+        raise ValidationError(f"Invalid CIDR prefix: {cidr}")
+    mask = (0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF
+    return _ip_to_int(ip) & mask, mask
+
+
+@dataclass(slots=True)
 class VPC:
     """VPC resource"""
     id: str
     cidr_block: str
     state: str
-    oci_vcn_id: Optional[str] = None
-    tags: Optional[Dict[str, str]] = None
+    oci_vcn_id: str | None = None
+    tags: dict[str, str] | None = None
+
+
+def _vpc_from_api(d: dict[str, Any]) -> VPC:
+    """Build a VPC from an API response dict
+
+    Positional construction skips the keyword-matching step of the
+    generated __init__, which adds up in list() over large fleets.
+    """
+    g = d.get
+    return VPC(
+        d["VpcId"],
+        d["CidrBlock"],
+        _intern(d["State"]),
+        g("OciVcnId"),
+        g("Tags"),
+    )
+
+
+@dataclass(slots=True)
+class VPCTable:
+    """Columnar view over many VPCs
+
+    Stores one list per field instead of one object per VPC, which is
+    cheaper to build and to aggregate over (e.g. counting states) for
+    large fleets.
+    """
+    ids: list[str]
+    cidr_blocks: list[str]
+    states: list[str]
+    oci_vcn_ids: list[str | None]
+    tags: list[dict[str, str] | None]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def row(self, index: int) -> "VPC":
+        """Materialize a single row as a VPC object"""
+        return VPC(
+            id=self.ids[index],
+            cidr_block=self.cidr_blocks[index],
+            state=self.states[index],
+            oci_vcn_id=self.oci_vcn_ids[index],
+            tags=self.tags[index],
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Lambda:
     """Lambda function resource"""
     id: str
@@ -22,10 +523,10 @@ class Lambda:
     memory_mb: int
     timeout: int
     state: str
-    arn: Optional[str] = None
+    arn: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamoDB:
     """DynamoDB table resource"""
     id: str
@@ -36,7 +537,7 @@ class DynamoDB:
     state: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SQS:
     """SQS queue resource"""
     id: str
@@ -46,7 +547,7 @@ class SQS:
     message_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Storage:
     """Storage bucket resource"""
     id: str
@@ -58,6 +559,15 @@ class Storage:
 class VPCResource:
     """VPC resource client"""
 
+    # Constant payload templates for the hot actions; each call merges
+    # only its variable fields instead of rebuilding the whole dict.
+    _CREATE_VPC = {"Action": "CreateVpc"}
+    _DELETE_VPC = {"Action": "DeleteVpc"}
+    _DESCRIBE_VPCS = {"Action": "DescribeVpcs"}
+    _CREATE_SUBNET = {"Action": "CreateSubnet"}
+    _DELETE_SUBNET = {"Action": "DeleteSubnet"}
+    _CREATE_SG = {"Action": "CreateSecurityGroup"}
+
     def __init__(self, client):
         self.client = client
 
@@ -66,7 +576,7 @@ class VPCResource:
         cidr_block: str,
         enable_dns_hostnames: bool = True,
         enable_dns_support: bool = True,
-        tags: Optional[Dict[str, str]] = None,
+        tags: dict[str, str] | None = None,
     ) -> VPC:
         """
         Create a VPC
@@ -86,45 +596,57 @@ class VPCResource:
             vpc-abc123
         """
         response = self.client.post("/aws/vpc", json={
-            "Action": "CreateVpc",
+            **self._CREATE_VPC,
             "CidrBlock": cidr_block,
             "EnableDnsHostnames": enable_dns_hostnames,
             "EnableDnsSupport": enable_dns_support,
             "Tags": tags or {},
         })
 
-        return VPC(
-            id=response["VpcId"],
-            cidr_block=response["CidrBlock"],
-            state=response["State"],
-            oci_vcn_id=response.get("OciVcnId"),
-            tags=response.get("Tags"),
-        )
+        return _vpc_from_api(response)
 
     def delete(self, vpc_id: str) -> bool:
         """Delete a VPC"""
         self.client.post("/aws/vpc", json={
-            "Action": "DeleteVpc",
+            **self._DELETE_VPC,
             "VpcId": vpc_id,
         })
         return True
 
-    def list(self) -> List[VPC]:
+    def list(self) -> list[VPC]:
         """List all VPCs"""
-        response = self.client.post("/aws/vpc", json={
-            "Action": "DescribeVpcs",
-        })
+        response = self.client.post("/aws/vpc", json=self._DESCRIBE_VPCS)
 
-        return [
-            VPC(
-                id=vpc["VpcId"],
-                cidr_block=vpc["CidrBlock"],
-                state=vpc["State"],
-                oci_vcn_id=vpc.get("OciVcnId"),
-                tags=vpc.get("Tags"),
-            )
-            for vpc in response.get("Vpcs", [])
-        ]
+        return [_vpc_from_api(vpc) for vpc in response.get("Vpcs", [])]
+
+    def list_iter(self):
+        """Iterate over all VPCs, yielding one at a time
+
+        Generator variant of list(): rows are materialized lazily, so
+        peak memory holds the decoded response plus one VPC object
+        instead of a second full list of dataclasses. Wrap in list() to
+        collect.
+        """
+        response = self.client.post("/aws/vpc", json=self._DESCRIBE_VPCS)
+        for vpc in response.get("Vpcs", []):
+            yield _vpc_from_api(vpc)
+
+    def list_columnar(self) -> VPCTable:
+        """List all VPCs as a columnar VPCTable
+
+        One response pass fills five flat lists rather than allocating a
+        VPC object per row; use VPCTable.row() to materialize individual
+        entries when needed.
+        """
+        response = self.client.post("/aws/vpc", json=self._DESCRIBE_VPCS)
+        vpcs = response.get("Vpcs", [])
+        return VPCTable(
+            ids=[vpc["VpcId"] for vpc in vpcs],
+            cidr_blocks=[vpc["CidrBlock"] for vpc in vpcs],
+            states=[vpc["State"] for vpc in vpcs],
+            oci_vcn_ids=[vpc.get("OciVcnId") for vpc in vpcs],
+            tags=[vpc.get("Tags") for vpc in vpcs],
+        )
 
     # ---- Subnets ----
 
@@ -132,12 +654,12 @@ class VPCResource:
         self,
         vpc_id: str,
         cidr_block: str,
-        availability_zone: Optional[str] = None,
-        tags: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        availability_zone: str | None = None,
+        tags: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
         """Create a subnet in a VPC"""
-        body: Dict[str, Any] = {
-            "Action": "CreateSubnet",
+        body: dict[str, Any] = {
+            **self._CREATE_SUBNET,
             "VpcId": vpc_id,
             "CidrBlock": cidr_block,
             "Tags": tags or {},
@@ -148,11 +670,11 @@ class VPCResource:
 
     def describe_subnets(
         self,
-        subnet_ids: Optional[List[str]] = None,
-        vpc_id: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+        subnet_ids: list[str] | None = None,
+        vpc_id: str | None = None,
+    ) -> list[dict[str, Any]]:
         """Describe subnets"""
-        body: Dict[str, Any] = {"Action": "DescribeSubnets"}
+        body: dict[str, Any] = {"Action": "DescribeSubnets"}
         if subnet_ids:
             body["SubnetIds"] = subnet_ids
         if vpc_id:
@@ -163,7 +685,7 @@ class VPCResource:
     def delete_subnet(self, subnet_id: str) -> bool:
         """Delete a subnet"""
         self.client.post("/aws/vpc", json={
-            "Action": "DeleteSubnet",
+            **self._DELETE_SUBNET,
             "SubnetId": subnet_id,
         })
         return True
@@ -174,12 +696,12 @@ class VPCResource:
         self,
         group_name: str,
         description: str,
-        vpc_id: Optional[str] = None,
-        tags: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        vpc_id: str | None = None,
+        tags: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
         """Create a security group"""
-        body: Dict[str, Any] = {
-            "Action": "CreateSecurityGroup",
+        body: dict[str, Any] = {
+            **self._CREATE_SG,
             "GroupName": group_name,
             "Description": description,
             "Tags": tags or {},
@@ -190,11 +712,11 @@ class VPCResource:
 
     def describe_security_groups(
         self,
-        group_ids: Optional[List[str]] = None,
-        vpc_id: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+        group_ids: list[str] | None = None,
+        vpc_id: str | None = None,
+    ) -> list[dict[str, Any]]:
         """Describe security groups"""
-        body: Dict[str, Any] = {"Action": "DescribeSecurityGroups"}
+        body: dict[str, Any] = {"Action": "DescribeSecurityGroups"}
         if group_ids:
             body["GroupIds"] = group_ids
         if vpc_id:
@@ -213,7 +735,7 @@ class VPCResource:
     def authorize_ingress(
         self,
         group_id: str,
-        ip_permissions: List[Dict[str, Any]],
+        ip_permissions: list[dict[str, Any]],
     ) -> bool:
         """Authorize inbound rules for a security group"""
         self.client.post("/aws/vpc", json={
@@ -226,7 +748,7 @@ class VPCResource:
     def authorize_egress(
         self,
         group_id: str,
-        ip_permissions: List[Dict[str, Any]],
+        ip_permissions: list[dict[str, Any]],
     ) -> bool:
         """Authorize outbound rules for a security group"""
         self.client.post("/aws/vpc", json={
@@ -240,8 +762,8 @@ class VPCResource:
 
     def create_internet_gateway(
         self,
-        tags: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        tags: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
         """Create an internet gateway"""
         return self.client.post("/aws/vpc", json={
             "Action": "CreateInternetGateway",
@@ -250,10 +772,10 @@ class VPCResource:
 
     def describe_internet_gateways(
         self,
-        igw_ids: Optional[List[str]] = None,
-    ) -> List[Dict[str, Any]]:
+        igw_ids: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
         """Describe internet gateways"""
-        body: Dict[str, Any] = {"Action": "DescribeInternetGateways"}
+        body: dict[str, Any] = {"Action": "DescribeInternetGateways"}
         if igw_ids:
             body["InternetGatewayIds"] = igw_ids
         response = self.client.post("/aws/vpc", json=body)
@@ -290,8 +812,8 @@ class VPCResource:
     def create_route_table(
         self,
         vpc_id: str,
-        tags: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        tags: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
         """Create a route table"""
         return self.client.post("/aws/vpc", json={
             "Action": "CreateRouteTable",
@@ -301,11 +823,11 @@ class VPCResource:
 
     def describe_route_tables(
         self,
-        route_table_ids: Optional[List[str]] = None,
-        vpc_id: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+        route_table_ids: list[str] | None = None,
+        vpc_id: str | None = None,
+    ) -> list[dict[str, Any]]:
         """Describe route tables"""
-        body: Dict[str, Any] = {"Action": "DescribeRouteTables"}
+        body: dict[str, Any] = {"Action": "DescribeRouteTables"}
         if route_table_ids:
             body["RouteTableIds"] = route_table_ids
         if vpc_id:
@@ -317,11 +839,11 @@ class VPCResource:
         self,
         route_table_id: str,
         destination_cidr_block: str,
-        gateway_id: Optional[str] = None,
-        instance_id: Optional[str] = None,
+        gateway_id: str | None = None,
+        instance_id: str | None = None,
     ) -> bool:
         """Create a route in a route table"""
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "Action": "CreateRoute",
             "RouteTableId": route_table_id,
             "DestinationCidrBlock": destination_cidr_block,
@@ -355,6 +877,25 @@ class VPCResource:
         return True
 
 
+# Encoded Lambda zips keyed on content digest: deployments create many
+# functions from one artifact, and re-encoding a large zip per function
+# is a copy + encode + decode cycle for identical output.
+_ZIP_B64_CACHE: dict[bytes, str] = {}
+_ZIP_B64_CACHE_MAX = 8
+
+
+def _encode_zip(code_zip: bytes) -> str:
+    """Base64-encode Lambda zip bytes, caching by content digest"""
+    digest = hashlib.blake2b(code_zip, digest_size=16).digest()
+    encoded = _ZIP_B64_CACHE.get(digest)
+    if encoded is None:
+        encoded = _b64.b64encode(code_zip).decode("ascii")
+        if len(_ZIP_B64_CACHE) >= _ZIP_B64_CACHE_MAX:
+            _ZIP_B64_CACHE.pop(next(iter(_ZIP_B64_CACHE)))
+        _ZIP_B64_CACHE[digest] = encoded
+    return encoded
+
+
 class LambdaResource:
     """Lambda resource client"""
 
@@ -368,8 +909,8 @@ class LambdaResource:
         handler: str = "index.handler",
         memory_mb: int = 128,
         timeout: int = 30,
-        code_zip: Optional[bytes] = None,
-        environment_variables: Optional[Dict[str, str]] = None,
+        code_zip: bytes | None = None,
+        environment_variables: dict[str, str] | None = None,
     ) -> Lambda:
         """
         Create a Lambda function
@@ -395,8 +936,6 @@ class LambdaResource:
             >>> print(fn.id)
             lambda-xyz789
         """
-        import base64
-
         response = self.client.post("/lambda/2015-03-31/functions", json={
             "FunctionName": function_name,
             "Runtime": runtime,
@@ -404,7 +943,7 @@ class LambdaResource:
             "MemorySize": memory_mb,
             "Timeout": timeout,
             "Code": {
-                "ZipFile": base64.b64encode(code_zip).decode() if code_zip else None
+                "ZipFile": _encode_zip(code_zip) if code_zip else None
             },
             "Environment": {
                 "Variables": environment_variables or {}
@@ -414,27 +953,27 @@ class LambdaResource:
         return Lambda(
             id=response["FunctionId"],
             function_name=response["FunctionName"],
-            runtime=response["Runtime"],
+            runtime=_intern(response["Runtime"]),
             memory_mb=response["MemorySize"],
             timeout=response["Timeout"],
-            state=response["State"],
+            state=_intern(response["State"]),
             arn=response.get("FunctionArn"),
         )
 
-    def list(self) -> List[Dict[str, Any]]:
+    def list(self) -> list[dict[str, Any]]:
         """List all Lambda functions"""
         response = self.client.get("/lambda/2015-03-31/functions")
         return response.get("Functions", [])
 
-    def get(self, function_name: str) -> Dict[str, Any]:
+    def get(self, function_name: str) -> dict[str, Any]:
         """Get a Lambda function by name"""
         return self.client.get(f"/lambda/2015-03-31/functions/{function_name}")
 
     def invoke(
         self,
         function_name: str,
-        payload: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        payload: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         """
         Invoke a Lambda function
 
@@ -452,6 +991,39 @@ class LambdaResource:
 
         return response.get("Payload", response)
 
+    def invoke_many(
+        self,
+        invocations: list[tuple],
+        max_workers: int = 8,
+    ) -> list[dict[str, Any]]:
+        """
+        Invoke several Lambda functions concurrently
+
+        Each invocation is a (function_name, payload) tuple. The calls
+        fan out over a thread pool sharing the client's pooled session,
+        so total latency approaches the slowest invocation rather than
+        the sum of all of them.
+
+        Args:
+            invocations: List of (function_name, payload) tuples
+            max_workers: Maximum concurrent requests (default: 8)
+
+        Returns:
+            List of function responses, in input order
+
+        Example:
+            >>> results = mf.lambda_function.invoke_many([
+            ...     ("resize-image", {"key": "a.png"}),
+            ...     ("resize-image", {"key": "b.png"}),
+            ... ])
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(self.invoke, name, payload)
+                for name, payload in invocations
+            ]
+            return [future.result() for future in futures]
+
     def delete(self, function_name: str) -> bool:
         """Delete a Lambda function"""
         self.client.delete(f"/lambda/2015-03-31/functions/{function_name}")
@@ -461,6 +1033,12 @@ class LambdaResource:
 class DynamoDBResource:
     """DynamoDB resource client"""
 
+    # Constant payload templates for the hot item operations; each call
+    # merges only its variable fields (same pattern as VPCResource).
+    _PUT_ITEM = {"Action": "PutItem"}
+    _GET_ITEM = {"Action": "GetItem"}
+    _DELETE_ITEM = {"Action": "DeleteItem"}
+
     def __init__(self, client):
         self.client = client
 
@@ -469,7 +1047,7 @@ class DynamoDBResource:
         table_name: str,
         partition_key: str,
         partition_key_type: str = "S",
-        sort_key: Optional[str] = None,
+        sort_key: str | None = None,
         sort_key_type: str = "S",
     ) -> DynamoDB:
         """
@@ -506,11 +1084,11 @@ class DynamoDBResource:
     def put_item(
         self,
         table_name: str,
-        item: Dict[str, Any],
+        item: dict[str, Any],
     ) -> bool:
         """Put an item into DynamoDB table"""
         self.client.post("/aws/dynamodb", json={
-            "Action": "PutItem",
+            **self._PUT_ITEM,
             "TableName": table_name,
             "Item": item,
         })
@@ -519,11 +1097,11 @@ class DynamoDBResource:
     def get_item(
         self,
         table_name: str,
-        key: Dict[str, Any],
-    ) -> Optional[Dict[str, Any]]:
+        key: dict[str, Any],
+    ) -> dict[str, Any] | None:
         """Get an item from DynamoDB table"""
         response = self.client.post("/aws/dynamodb", json={
-            "Action": "GetItem",
+            **self._GET_ITEM,
             "TableName": table_name,
             "Key": key,
         })
@@ -532,11 +1110,11 @@ class DynamoDBResource:
     def update_item(
         self,
         table_name: str,
-        key: Dict[str, Any],
+        key: dict[str, Any],
         update_expression: str,
-        expression_attribute_values: Optional[Dict[str, Any]] = None,
-        expression_attribute_names: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        expression_attribute_values: dict[str, Any] | None = None,
+        expression_attribute_names: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
         """Update an item in a DynamoDB table"""
         response = self.client.post("/aws/dynamodb", json={
             "Action": "UpdateItem",
@@ -551,11 +1129,11 @@ class DynamoDBResource:
     def delete_item(
         self,
         table_name: str,
-        key: Dict[str, Any],
+        key: dict[str, Any],
     ) -> bool:
         """Delete an item from a DynamoDB table"""
         self.client.post("/aws/dynamodb", json={
-            "Action": "DeleteItem",
+            **self._DELETE_ITEM,
             "TableName": table_name,
             "Key": key,
         })
@@ -565,12 +1143,12 @@ class DynamoDBResource:
         self,
         table_name: str,
         key_condition_expression: str,
-        expression_attribute_values: Optional[Dict[str, Any]] = None,
-        expression_attribute_names: Optional[Dict[str, str]] = None,
-        limit: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
+        expression_attribute_values: dict[str, Any] | None = None,
+        expression_attribute_names: dict[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
         """Query a DynamoDB table"""
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "Action": "Query",
             "TableName": table_name,
             "KeyConditionExpression": key_condition_expression,
@@ -585,12 +1163,12 @@ class DynamoDBResource:
     def scan(
         self,
         table_name: str,
-        filter_expression: Optional[str] = None,
-        expression_attribute_values: Optional[Dict[str, Any]] = None,
-        limit: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
+        filter_expression: str | None = None,
+        expression_attribute_values: dict[str, Any] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
         """Scan a DynamoDB table"""
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "Action": "Scan",
             "TableName": table_name,
         }
@@ -605,8 +1183,8 @@ class DynamoDBResource:
 
     def batch_write_item(
         self,
-        request_items: Dict[str, List[Dict[str, Any]]],
-    ) -> Dict[str, Any]:
+        request_items: dict[str, list[dict[str, Any]]],
+    ) -> dict[str, Any]:
         """Batch write items to one or more DynamoDB tables"""
         response = self.client.post("/aws/dynamodb", json={
             "Action": "BatchWriteItem",
@@ -616,8 +1194,8 @@ class DynamoDBResource:
 
     def batch_get_item(
         self,
-        request_items: Dict[str, Dict[str, Any]],
-    ) -> Dict[str, List[Dict[str, Any]]]:
+        request_items: dict[str, dict[str, Any]],
+    ) -> dict[str, list[dict[str, Any]]]:
         """Batch get items from one or more DynamoDB tables"""
         response = self.client.post("/aws/dynamodb", json={
             "Action": "BatchGetItem",
@@ -629,6 +1207,11 @@ class DynamoDBResource:
 class SQSResource:
     """SQS resource client"""
 
+    # Constant payload templates for the hot message operations
+    _SEND_MESSAGE = {"Action": "SendMessage"}
+    _RECEIVE_MESSAGE = {"Action": "ReceiveMessage"}
+    _DELETE_MESSAGE = {"Action": "DeleteMessage"}
+
     def __init__(self, client):
         self.client = client
 
@@ -671,20 +1254,60 @@ class SQSResource:
     ) -> str:
         """Send a message to SQS queue"""
         response = self.client.post("/aws/sqs", json={
-            "Action": "SendMessage",
+            **self._SEND_MESSAGE,
             "QueueUrl": queue_url,
             "MessageBody": message_body,
         })
         return response["MessageId"]
 
+    def send_message_batch(
+        self,
+        queue_url: str,
+        message_bodies: list[str],
+    ) -> list[str]:
+        """
+        Send messages to an SQS queue in batches of 10
+
+        One SendMessageBatch round-trip carries up to 10 messages, so N
+        messages cost ceil(N / 10) requests instead of N.
+
+        Args:
+            queue_url: Queue URL
+            message_bodies: Message bodies to send
+
+        Returns:
+            Message IDs, in input order
+
+        Example:
+            >>> ids = mf.sqs.send_message_batch(
+            ...     queue_url=queue.queue_url,
+            ...     message_bodies=[f"job-{i}" for i in range(25)],
+            ... )
+        """
+        message_ids: list[str] = []
+        for start in range(0, len(message_bodies), 10):
+            chunk = message_bodies[start:start + 10]
+            response = self.client.post("/aws/sqs", json={
+                "Action": "SendMessageBatch",
+                "QueueUrl": queue_url,
+                "Entries": [
+                    {"Id": str(i), "MessageBody": body}
+                    for i, body in enumerate(chunk)
+                ],
+            })
+            message_ids.extend(
+                entry["MessageId"] for entry in response.get("Successful", [])
+            )
+        return message_ids
+
     def receive_messages(
         self,
         queue_url: str,
         max_messages: int = 1,
-    ) -> List[Dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         """Receive messages from SQS queue"""
         response = self.client.post("/aws/sqs", json={
-            "Action": "ReceiveMessage",
+            **self._RECEIVE_MESSAGE,
             "QueueUrl": queue_url,
             "MaxNumberOfMessages": max_messages,
         })
@@ -693,7 +1316,7 @@ class SQSResource:
     def delete_message(self, queue_url: str, receipt_handle: str) -> bool:
         """Delete a message from an SQS queue"""
         self.client.post("/aws/sqs", json={
-            "Action": "DeleteMessage",
+            **self._DELETE_MESSAGE,
             "QueueUrl": queue_url,
             "ReceiptHandle": receipt_handle,
         })
@@ -710,8 +1333,8 @@ class SQSResource:
     def get_queue_attributes(
         self,
         queue_url: str,
-        attribute_names: Optional[List[str]] = None,
-    ) -> Dict[str, str]:
+        attribute_names: list[str] | None = None,
+    ) -> dict[str, str]:
         """Get attributes of an SQS queue"""
         response = self.client.post("/aws/sqs", json={
             "Action": "GetQueueAttributes",
@@ -773,24 +1396,55 @@ class StorageResource:
         data: bytes,
     ) -> bool:
         """Upload file to storage bucket"""
-        import base64
-
         self.client.post("/storage/object", json={
             "Action": "PutObject",
             "BucketName": bucket_name,
             "Key": key,
-            "Data": base64.b64encode(data).decode(),
+            "Data": _b64.b64encode(data).decode("ascii"),
         })
         return True
 
+    def upload_file_raw(
+        self,
+        bucket_name: str,
+        key: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> bool:
+        """
+        Upload a file as raw octets, bypassing base64 and JSON
+
+        upload_file() base64-encodes the payload into a JSON body, which
+        inflates a large blob by a third and copies it twice more during
+        serialization. This path streams the bytes as-is with the bucket
+        and key in query parameters, so a 100 MiB upload holds one copy
+        of the data in memory.
+
+        Args:
+            bucket_name: Bucket name
+            key: Object key
+            data: Object data as bytes
+            content_type: Content-Type of the payload
+
+        Returns:
+            True on success
+        """
+        self.client.put_binary(
+            "/storage/object/raw",
+            data,
+            content_type=content_type,
+            params={"bucket": bucket_name, "key": key},
+        )
+        return True
+
     def list_objects(
         self,
         bucket_name: str,
-        prefix: Optional[str] = None,
+        prefix: str | None = None,
         max_keys: int = 1000,
-    ) -> List[Dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         """List objects in a storage bucket"""
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "Action": "ListObjects",
             "BucketName": bucket_name,
             "MaxKeys": max_keys,
@@ -806,15 +1460,13 @@ class StorageResource:
         key: str,
     ) -> bytes:
         """Download an object from a storage bucket"""
-        import base64
-
         response = self.client.post("/storage/object", json={
             "Action": "GetObject",
             "BucketName": bucket_name,
             "Key": key,
         })
         encoded = response.get("Body", "")
-        return base64.b64decode(encoded) if encoded else b""
+        return _b64.b64decode(encoded) if encoded else b""
 
     def delete_object(
         self,
@@ -833,7 +1485,7 @@ class StorageResource:
         self,
         bucket_name: str,
         key: str,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Get metadata for an object without downloading it"""
         response = self.client.post("/storage/object", json={
             "Action": "HeadObject",
@@ -864,16 +1516,16 @@ class StorageResource:
 # AWS EC2
 # ==============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class EC2Instance:
     """EC2 instance resource"""
     instance_id: str
     instance_type: str
     state: str
-    image_id: Optional[str] = None
-    public_ip: Optional[str] = None
-    private_ip: Optional[str] = None
-    tags: Optional[Dict[str, str]] = None
+    image_id: str | None = None
+    public_ip: str | None = None
+    private_ip: str | None = None
+    tags: dict[str, str] | None = None
 
 
 class EC2Resource:
@@ -888,11 +1540,11 @@ class EC2Resource:
         instance_type: str,
         min_count: int = 1,
         max_count: int = 1,
-        key_name: Optional[str] = None,
-        security_group_ids: Optional[List[str]] = None,
-        subnet_id: Optional[str] = None,
-        tags: Optional[Dict[str, str]] = None,
-    ) -> List[EC2Instance]:
+        key_name: str | None = None,
+        security_group_ids: list[str] | None = None,
+        subnet_id: str | None = None,
+        tags: dict[str, str] | None = None,
+    ) -> list[EC2Instance]:
         """
         Launch one or more EC2 instances
 
@@ -909,7 +1561,7 @@ class EC2Resource:
         Returns:
             List of EC2Instance objects
         """
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "Action": "RunInstances",
             "ImageId": image_id,
             "InstanceType": instance_type,
@@ -928,8 +1580,8 @@ class EC2Resource:
         return [
             EC2Instance(
                 instance_id=inst["InstanceId"],
-                instance_type=inst["InstanceType"],
-                state=inst.get("State", {}).get("Name", inst.get("State", "pending")),
+                instance_type=_intern(inst["InstanceType"]),
+                state=_intern(inst.get("State", {}).get("Name", inst.get("State", "pending"))),
                 image_id=inst.get("ImageId"),
                 public_ip=inst.get("PublicIpAddress"),
                 private_ip=inst.get("PrivateIpAddress"),
@@ -940,10 +1592,10 @@ class EC2Resource:
 
     def describe_instances(
         self,
-        instance_ids: Optional[List[str]] = None,
-    ) -> List[EC2Instance]:
+        instance_ids: list[str] | None = None,
+    ) -> list[EC2Instance]:
         """Describe EC2 instances"""
-        body: Dict[str, Any] = {"Action": "DescribeInstances"}
+        body: dict[str, Any] = {"Action": "DescribeInstances"}
         if instance_ids:
             body["InstanceIds"] = instance_ids
         response = self.client.post("/ec2/", json=body)
@@ -952,8 +1604,8 @@ class EC2Resource:
             for inst in reservation.get("Instances", []):
                 instances.append(EC2Instance(
                     instance_id=inst["InstanceId"],
-                    instance_type=inst["InstanceType"],
-                    state=inst.get("State", {}).get("Name", inst.get("State", "")),
+                    instance_type=_intern(inst["InstanceType"]),
+                    state=_intern(inst.get("State", {}).get("Name", inst.get("State", ""))),
                     image_id=inst.get("ImageId"),
                     public_ip=inst.get("PublicIpAddress"),
                     private_ip=inst.get("PrivateIpAddress"),
@@ -961,7 +1613,7 @@ class EC2Resource:
                 ))
         return instances
 
-    def start_instances(self, instance_ids: List[str]) -> List[Dict[str, Any]]:
+    def start_instances(self, instance_ids: list[str]) -> list[dict[str, Any]]:
         """Start stopped EC2 instances"""
         response = self.client.post("/ec2/", json={
             "Action": "StartInstances",
@@ -971,9 +1623,9 @@ class EC2Resource:
 
     def stop_instances(
         self,
-        instance_ids: List[str],
+        instance_ids: list[str],
         force: bool = False,
-    ) -> List[Dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         """Stop running EC2 instances"""
         response = self.client.post("/ec2/", json={
             "Action": "StopInstances",
@@ -982,7 +1634,7 @@ class EC2Resource:
         })
         return response.get("StoppingInstances", [])
 
-    def terminate_instances(self, instance_ids: List[str]) -> List[Dict[str, Any]]:
+    def terminate_instances(self, instance_ids: list[str]) -> list[dict[str, Any]]:
         """Terminate EC2 instances"""
         response = self.client.post("/ec2/", json={
             "Action": "TerminateInstances",
@@ -992,11 +1644,11 @@ class EC2Resource:
 
     def describe_images(
         self,
-        image_ids: Optional[List[str]] = None,
-        owners: Optional[List[str]] = None,
-    ) -> List[Dict[str, Any]]:
+        image_ids: list[str] | None = None,
+        owners: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
         """Describe AMI images"""
-        body: Dict[str, Any] = {"Action": "DescribeImages"}
+        body: dict[str, Any] = {"Action": "DescribeImages"}
         if image_ids:
             body["ImageIds"] = image_ids
         if owners:
@@ -1004,17 +1656,17 @@ class EC2Resource:
         response = self.client.post("/ec2/", json=body)
         return response.get("Images", [])
 
-    def describe_availability_zones(self) -> List[Dict[str, Any]]:
+    def describe_availability_zones(self) -> list[dict[str, Any]]:
         """Describe availability zones"""
         response = self.client.post("/ec2/", json={"Action": "DescribeAvailabilityZones"})
         return response.get("AvailabilityZones", [])
 
     def describe_instance_types(
         self,
-        instance_types: Optional[List[str]] = None,
-    ) -> List[Dict[str, Any]]:
+        instance_types: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
         """Describe EC2 instance types"""
-        body: Dict[str, Any] = {"Action": "DescribeInstanceTypes"}
+        body: dict[str, Any] = {"Action": "DescribeInstanceTypes"}
         if instance_types:
             body["InstanceTypes"] = instance_types
         response = self.client.post("/ec2/", json=body)
@@ -1025,7 +1677,7 @@ class EC2Resource:
 # AWS STS
 # ==============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class STSIdentity:
     """STS caller identity"""
     account: str
@@ -1033,7 +1685,7 @@ class STSIdentity:
     user_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class STSCredentials:
     """STS temporary credentials"""
     access_key_id: str
@@ -1067,7 +1719,7 @@ class STSResource:
         role_arn: str,
         role_session_name: str,
         duration_seconds: int = 3600,
-        external_id: Optional[str] = None,
+        external_id: str | None = None,
     ) -> STSCredentials:
         """
         Assume an IAM role and return temporary credentials
@@ -1081,7 +1733,7 @@ class STSResource:
         Returns:
             STSCredentials object
         """
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "Action": "AssumeRole",
             "RoleArn": role_arn,
             "RoleSessionName": role_session_name,
@@ -1101,8 +1753,8 @@ class STSResource:
     def get_session_token(
         self,
         duration_seconds: int = 43200,
-        serial_number: Optional[str] = None,
-        token_code: Optional[str] = None,
+        serial_number: str | None = None,
+        token_code: str | None = None,
     ) -> STSCredentials:
         """
         Return temporary credentials for the current IAM user
@@ -1115,7 +1767,7 @@ class STSResource:
         Returns:
             STSCredentials object
         """
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "Action": "GetSessionToken",
             "DurationSeconds": duration_seconds,
         }
@@ -1137,14 +1789,14 @@ class STSResource:
 # AWS Route53
 # ==============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class HostedZone:
     """Route53 hosted zone"""
     id: str
     name: str
     private_zone: bool
-    record_count: Optional[int] = None
-    comment: Optional[str] = None
+    record_count: int | None = None
+    comment: str | None = None
 
 
 class Route53Resource:
@@ -1157,7 +1809,7 @@ class Route53Resource:
         self,
         name: str,
         private_zone: bool = False,
-        comment: Optional[str] = None,
+        comment: str | None = None,
     ) -> HostedZone:
         """
         Create a hosted zone
@@ -1170,7 +1822,7 @@ class Route53Resource:
         Returns:
             HostedZone object
         """
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "Action": "CreateHostedZone",
             "Name": name,
             "PrivateZone": private_zone,
@@ -1187,7 +1839,7 @@ class Route53Resource:
             comment=zone.get("Config", {}).get("Comment"),
         )
 
-    def list_hosted_zones(self) -> List[HostedZone]:
+    def list_hosted_zones(self) -> list[HostedZone]:
         """List all hosted zones"""
         response = self.client.post("/route53/", json={"Action": "ListHostedZones"})
         return [
@@ -1219,8 +1871,8 @@ class Route53Resource:
     def change_resource_record_sets(
         self,
         zone_id: str,
-        changes: List[Dict[str, Any]],
-    ) -> Dict[str, Any]:
+        changes: list[dict[str, Any]],
+    ) -> dict[str, Any]:
         """
         Create, update, or delete DNS resource record sets
 
@@ -1241,12 +1893,12 @@ class Route53Resource:
     def list_resource_record_sets(
         self,
         zone_id: str,
-        start_record_name: Optional[str] = None,
-        start_record_type: Optional[str] = None,
+        start_record_name: str | None = None,
+        start_record_type: str | None = None,
         max_items: int = 300,
-    ) -> List[Dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         """List DNS resource record sets in a hosted zone"""
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "Action": "ListResourceRecordSets",
             "HostedZoneId": zone_id,
             "MaxItems": max_items,
@@ -1258,7 +1910,7 @@ class Route53Resource:
         response = self.client.post("/route53/", json=body)
         return response.get("ResourceRecordSets", [])
 
-    def get_change(self, change_id: str) -> Dict[str, Any]:
+    def get_change(self, change_id: str) -> dict[str, Any]:
         """Get the status of a change batch"""
         response = self.client.post("/route53/", json={
             "Action": "GetChange",
@@ -1271,11 +1923,11 @@ class Route53Resource:
 # AWS SNS
 # ==============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SNSTopic:
     """SNS topic resource"""
     topic_arn: str
-    name: Optional[str] = None
+    name: str | None = None
 
 
 class SNSResource:
@@ -1287,8 +1939,8 @@ class SNSResource:
     def create_topic(
         self,
         name: str,
-        attributes: Optional[Dict[str, str]] = None,
-        tags: Optional[Dict[str, str]] = None,
+        attributes: dict[str, str] | None = None,
+        tags: dict[str, str] | None = None,
     ) -> SNSTopic:
         """
         Create an SNS topic
@@ -1312,7 +1964,7 @@ class SNSResource:
             name=name,
         )
 
-    def list_topics(self) -> List[SNSTopic]:
+    def list_topics(self) -> list[SNSTopic]:
         """List all SNS topics"""
         response = self.client.post("/sns/", json={"Action": "ListTopics"})
         return [
@@ -1324,8 +1976,8 @@ class SNSResource:
         self,
         topic_arn: str,
         message: str,
-        subject: Optional[str] = None,
-        message_attributes: Optional[Dict[str, Any]] = None,
+        subject: str | None = None,
+        message_attributes: dict[str, Any] | None = None,
     ) -> str:
         """
         Publish a message to an SNS topic
@@ -1339,7 +1991,7 @@ class SNSResource:
         Returns:
             MessageId string
         """
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "Action": "Publish",
             "TopicArn": topic_arn,
             "Message": message,
@@ -1356,7 +2008,7 @@ class SNSResource:
         topic_arn: str,
         protocol: str,
         endpoint: str,
-        attributes: Optional[Dict[str, str]] = None,
+        attributes: dict[str, str] | None = None,
     ) -> str:
         """
         Subscribe an endpoint to an SNS topic
@@ -1370,7 +2022,7 @@ class SNSResource:
         Returns:
             SubscriptionArn string
         """
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "Action": "Subscribe",
             "TopicArn": topic_arn,
             "Protocol": protocol,
@@ -1386,43 +2038,43 @@ class SNSResource:
 # OCI (Oracle Cloud Infrastructure)
 # ==============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class OCIInstance:
     """OCI compute instance"""
     id: str
     display_name: str
     lifecycle_state: str
-    shape: Optional[str] = None
-    compartment_id: Optional[str] = None
-    availability_domain: Optional[str] = None
+    shape: str | None = None
+    compartment_id: str | None = None
+    availability_domain: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OCIBucket:
     """OCI Object Storage bucket"""
     name: str
     namespace: str
-    compartment_id: Optional[str] = None
+    compartment_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OCIVCN:
     """OCI Virtual Cloud Network"""
     id: str
     display_name: str
     cidr_block: str
     lifecycle_state: str
-    compartment_id: Optional[str] = None
+    compartment_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OCIVolume:
     """OCI block volume"""
     id: str
     display_name: str
     lifecycle_state: str
-    size_in_gbs: Optional[int] = None
-    availability_domain: Optional[str] = None
+    size_in_gbs: int | None = None
+    availability_domain: str | None = None
 
 
 class OCIResource:
@@ -1438,7 +2090,7 @@ class OCIResource:
         response = self.client.get("/n")
         return response.get("value", response) if isinstance(response, dict) else response
 
-    def list_buckets(self, namespace: str, compartment_id: str) -> List[OCIBucket]:
+    def list_buckets(self, namespace: str, compartment_id: str) -> list[OCIBucket]:
         """
         List buckets in a namespace
 
@@ -1518,13 +2170,11 @@ class OCIResource:
         Returns:
             True on success
         """
-        import base64
-
         self.client.request(
             "PUT",
             f"/n/{namespace}/b/{bucket}/o/{object_name}",
             json={
-                "data": base64.b64encode(data).decode(),
+                "data": _b64.b64encode(data).decode("ascii"),
                 "contentType": content_type,
             },
         )
@@ -1532,11 +2182,9 @@ class OCIResource:
 
     def get_object(self, namespace: str, bucket: str, object_name: str) -> bytes:
         """Download an object from OCI Object Storage"""
-        import base64
-
         response = self.client.get(f"/n/{namespace}/b/{bucket}/o/{object_name}")
         encoded = response.get("data", "") if isinstance(response, dict) else response
-        return base64.b64decode(encoded) if encoded else b""
+        return _b64.b64decode(encoded) if encoded else b""
 
     def delete_object(self, namespace: str, bucket: str, object_name: str) -> bool:
         """Delete an object from OCI Object Storage"""
@@ -1547,11 +2195,11 @@ class OCIResource:
         self,
         namespace: str,
         bucket: str,
-        prefix: Optional[str] = None,
+        prefix: str | None = None,
         limit: int = 1000,
-    ) -> List[Dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         """List objects in an OCI bucket"""
-        params: Dict[str, Any] = {"limit": limit}
+        params: dict[str, Any] = {"limit": limit}
         if prefix:
             params["prefix"] = prefix
         response = self.client.get(f"/n/{namespace}/b/{bucket}/o", params=params)
@@ -1566,9 +2214,9 @@ class OCIResource:
         availability_domain: str,
         shape: str,
         display_name: str,
-        subnet_id: Optional[str] = None,
-        image_id: Optional[str] = None,
-        metadata: Optional[Dict[str, str]] = None,
+        subnet_id: str | None = None,
+        image_id: str | None = None,
+        metadata: dict[str, str] | None = None,
     ) -> OCIInstance:
         """
         Create an OCI compute instance
@@ -1585,7 +2233,7 @@ class OCIResource:
         Returns:
             OCIInstance object
         """
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "compartmentId": compartment_id,
             "availabilityDomain": availability_domain,
             "shape": shape,
@@ -1611,7 +2259,7 @@ class OCIResource:
     def list_instances(
         self,
         compartment_id: str,
-    ) -> List[OCIInstance]:
+    ) -> list[OCIInstance]:
         """List OCI compute instances"""
         response = self.client.get(
             "/20160918/instances",
@@ -1694,7 +2342,7 @@ class OCIResource:
             compartment_id=response.get("compartmentId", compartment_id),
         )
 
-    def list_vcns(self, compartment_id: str) -> List[OCIVCN]:
+    def list_vcns(self, compartment_id: str) -> list[OCIVCN]:
         """List OCI Virtual Cloud Networks"""
         response = self.client.get(
             "/20160918/vcns",
@@ -1734,10 +2382,10 @@ class OCIResource:
         vcn_id: str,
         cidr_block: str,
         display_name: str,
-        availability_domain: Optional[str] = None,
-    ) -> Dict[str, Any]:
+        availability_domain: str | None = None,
+    ) -> dict[str, Any]:
         """Create an OCI subnet"""
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "compartmentId": compartment_id,
             "vcnId": vcn_id,
             "cidrBlock": cidr_block,
@@ -1747,9 +2395,9 @@ class OCIResource:
             body["availabilityDomain"] = availability_domain
         return self.client.post("/20160918/subnets", json=body)
 
-    def list_subnets(self, compartment_id: str, vcn_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_subnets(self, compartment_id: str, vcn_id: str | None = None) -> list[dict[str, Any]]:
         """List OCI subnets"""
-        params: Dict[str, Any] = {"compartmentId": compartment_id}
+        params: dict[str, Any] = {"compartmentId": compartment_id}
         if vcn_id:
             params["vcnId"] = vcn_id
         response = self.client.get("/20160918/subnets", params=params)
@@ -1761,7 +2409,7 @@ class OCIResource:
         vcn_id: str,
         display_name: str,
         is_enabled: bool = True,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Create an OCI internet gateway"""
         return self.client.post("/20160918/internetGateways", json={
             "compartmentId": compartment_id,
@@ -1775,8 +2423,8 @@ class OCIResource:
         compartment_id: str,
         vcn_id: str,
         display_name: str,
-        route_rules: Optional[List[Dict[str, Any]]] = None,
-    ) -> Dict[str, Any]:
+        route_rules: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
         """Create an OCI route table"""
         return self.client.post("/20160918/routeTables", json={
             "compartmentId": compartment_id,
@@ -1790,9 +2438,9 @@ class OCIResource:
         compartment_id: str,
         vcn_id: str,
         display_name: str,
-        ingress_security_rules: Optional[List[Dict[str, Any]]] = None,
-        egress_security_rules: Optional[List[Dict[str, Any]]] = None,
-    ) -> Dict[str, Any]:
+        ingress_security_rules: list[dict[str, Any]] | None = None,
+        egress_security_rules: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
         """Create an OCI security list"""
         return self.client.post("/20160918/securityLists", json={
             "compartmentId": compartment_id,
@@ -1804,7 +2452,7 @@ class OCIResource:
 
     # ---- Identity ----
 
-    def get_tenancy(self, tenancy_id: str) -> Dict[str, Any]:
+    def get_tenancy(self, tenancy_id: str) -> dict[str, Any]:
         """Get tenancy details"""
         return self.client.get(f"/20160918/tenancy/{tenancy_id}")
 
@@ -1813,7 +2461,7 @@ class OCIResource:
         compartment_id: str,
         name: str,
         description: str,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Create a compartment"""
         return self.client.post("/20160918/compartments", json={
             "compartmentId": compartment_id,
@@ -1821,7 +2469,7 @@ class OCIResource:
             "description": description,
         })
 
-    def list_compartments(self, compartment_id: str) -> List[Dict[str, Any]]:
+    def list_compartments(self, compartment_id: str) -> list[dict[str, Any]]:
         """List compartments"""
         response = self.client.get(
             "/20160918/compartments",
@@ -1834,10 +2482,10 @@ class OCIResource:
         compartment_id: str,
         name: str,
         description: str,
-        email: Optional[str] = None,
-    ) -> Dict[str, Any]:
+        email: str | None = None,
+    ) -> dict[str, Any]:
         """Create an OCI IAM user"""
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "compartmentId": compartment_id,
             "name": name,
             "description": description,
@@ -1846,7 +2494,7 @@ class OCIResource:
             body["email"] = email
         return self.client.post("/20160918/users", json=body)
 
-    def list_users(self, compartment_id: str) -> List[Dict[str, Any]]:
+    def list_users(self, compartment_id: str) -> list[dict[str, Any]]:
         """List OCI IAM users"""
         response = self.client.get(
             "/20160918/users",
@@ -1859,7 +2507,7 @@ class OCIResource:
         compartment_id: str,
         name: str,
         description: str,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Create an OCI IAM group"""
         return self.client.post("/20160918/groups", json={
             "compartmentId": compartment_id,
@@ -1872,8 +2520,8 @@ class OCIResource:
         compartment_id: str,
         name: str,
         description: str,
-        statements: List[str],
-    ) -> Dict[str, Any]:
+        statements: list[str],
+    ) -> dict[str, Any]:
         """Create an OCI IAM policy"""
         return self.client.post("/20160918/policies", json={
             "compartmentId": compartment_id,
@@ -1917,7 +2565,7 @@ class OCIResource:
             availability_domain=response.get("availabilityDomain", availability_domain),
         )
 
-    def list_volumes(self, compartment_id: str) -> List[OCIVolume]:
+    def list_volumes(self, compartment_id: str) -> list[OCIVolume]:
         """List OCI block volumes"""
         response = self.client.get(
             "/20160918/volumes",
@@ -1956,10 +2604,10 @@ class OCIResource:
         instance_id: str,
         volume_id: str,
         attachment_type: str = "iscsi",
-        display_name: Optional[str] = None,
-    ) -> Dict[str, Any]:
+        display_name: str | None = None,
+    ) -> dict[str, Any]:
         """Attach a volume to an instance"""
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "instanceId": instance_id,
             "volumeId": volume_id,
             "type": attachment_type,
@@ -1970,7 +2618,7 @@ class OCIResource:
 
     # ---- Container Registry ----
 
-    def list_repositories(self, compartment_id: str) -> List[Dict[str, Any]]:
+    def list_repositories(self, compartment_id: str) -> list[dict[str, Any]]:
         """List OCI container repositories"""
         response = self.client.get(
             "/20180917/repositories",
@@ -1983,7 +2631,7 @@ class OCIResource:
         compartment_id: str,
         display_name: str,
         is_public: bool = False,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Create an OCI container repository"""
         return self.client.post("/20180917/repositories", json={
             "compartmentId": compartment_id,
@@ -1991,7 +2639,7 @@ class OCIResource:
             "isPublic": is_public,
         })
 
-    def get_repository(self, repository_id: str) -> Dict[str, Any]:
+    def get_repository(self, repository_id: str) -> dict[str, Any]:
         """Get an OCI container repository by ID"""
         return self.client.get(f"/20180917/repositories/{repository_id}")
 
@@ -2005,33 +2653,33 @@ class OCIResource:
 # GCP Compute
 # ==============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class GCPInstance:
     """GCP Compute Engine instance"""
     name: str
     zone: str
     status: str
-    machine_type: Optional[str] = None
-    network_interfaces: Optional[List[Dict[str, Any]]] = None
-    disks: Optional[List[Dict[str, Any]]] = None
+    machine_type: str | None = None
+    network_interfaces: list[dict[str, Any]] | None = None
+    disks: list[dict[str, Any]] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GCPNetwork:
     """GCP VPC network"""
     name: str
-    self_link: Optional[str] = None
-    auto_create_subnetworks: Optional[bool] = None
+    self_link: str | None = None
+    auto_create_subnetworks: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GCPDisk:
     """GCP persistent disk"""
     name: str
     zone: str
     status: str
-    size_gb: Optional[int] = None
-    disk_type: Optional[str] = None
+    size_gb: int | None = None
+    disk_type: str | None = None
 
 
 class GCPComputeResource:
@@ -2040,7 +2688,7 @@ class GCPComputeResource:
     def __init__(self, client):
         self.client = client
 
-    def list_zones(self, project: str) -> List[Dict[str, Any]]:
+    def list_zones(self, project: str) -> list[dict[str, Any]]:
         """
         List all zones for a GCP project
 
@@ -2053,14 +2701,14 @@ class GCPComputeResource:
         response = self.client.get(f"/gcp/compute/v1/projects/{project}/zones")
         return response.get("items", [])
 
-    def list_machine_types(self, project: str, zone: str) -> List[Dict[str, Any]]:
+    def list_machine_types(self, project: str, zone: str) -> list[dict[str, Any]]:
         """List machine types available in a zone"""
         response = self.client.get(
             f"/gcp/compute/v1/projects/{project}/zones/{zone}/machineTypes"
         )
         return response.get("items", [])
 
-    def list_images(self, project: str) -> List[Dict[str, Any]]:
+    def list_images(self, project: str) -> list[dict[str, Any]]:
         """List images available in a project"""
         response = self.client.get(
             f"/gcp/compute/v1/projects/{project}/global/images"
@@ -2073,10 +2721,10 @@ class GCPComputeResource:
         zone: str,
         name: str,
         machine_type: str,
-        network_interfaces: Optional[List[Dict[str, Any]]] = None,
-        disks: Optional[List[Dict[str, Any]]] = None,
-        metadata: Optional[Dict[str, Any]] = None,
-        tags: Optional[List[str]] = None,
+        network_interfaces: list[dict[str, Any]] | None = None,
+        disks: list[dict[str, Any]] | None = None,
+        metadata: dict[str, Any] | None = None,
+        tags: list[str] | None = None,
     ) -> GCPInstance:
         """
         Create a GCP Compute Engine instance
@@ -2094,7 +2742,7 @@ class GCPComputeResource:
         Returns:
             GCPInstance object
         """
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "name": name,
             "machineType": f"zones/{zone}/machineTypes/{machine_type}",
             "networkInterfaces": network_interfaces or [{"network": "global/networks/default"}],
@@ -2118,7 +2766,7 @@ class GCPComputeResource:
             disks=response.get("disks"),
         )
 
-    def list_instances(self, project: str, zone: str) -> List[GCPInstance]:
+    def list_instances(self, project: str, zone: str) -> list[GCPInstance]:
         """List GCP Compute Engine instances in a zone"""
         response = self.client.get(
             f"/gcp/compute/v1/projects/{project}/zones/{zone}/instances"
@@ -2135,12 +2783,12 @@ class GCPComputeResource:
             for inst in response.get("items", [])
         ]
 
-    def list_all_instances(self, project: str) -> Dict[str, List[GCPInstance]]:
+    def list_all_instances(self, project: str) -> dict[str, list[GCPInstance]]:
         """List all GCP Compute Engine instances aggregated across zones"""
         response = self.client.get(
             f"/gcp/compute/v1/projects/{project}/aggregated/instances"
         )
-        result: Dict[str, List[GCPInstance]] = {}
+        result: dict[str, list[GCPInstance]] = {}
         for zone_key, zone_data in response.get("items", {}).items():
             zone_instances = zone_data.get("instances", [])
             zone_name = zone_key.replace("zones/", "")
@@ -2171,21 +2819,21 @@ class GCPComputeResource:
             disks=response.get("disks"),
         )
 
-    def start_instance(self, project: str, zone: str, instance: str) -> Dict[str, Any]:
+    def start_instance(self, project: str, zone: str, instance: str) -> dict[str, Any]:
         """Start a GCP Compute Engine instance"""
         return self.client.post(
             f"/gcp/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/start",
             json={},
         )
 
-    def stop_instance(self, project: str, zone: str, instance: str) -> Dict[str, Any]:
+    def stop_instance(self, project: str, zone: str, instance: str) -> dict[str, Any]:
         """Stop a GCP Compute Engine instance"""
         return self.client.post(
             f"/gcp/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/stop",
             json={},
         )
 
-    def reset_instance(self, project: str, zone: str, instance: str) -> Dict[str, Any]:
+    def reset_instance(self, project: str, zone: str, instance: str) -> dict[str, Any]:
         """Reset a GCP Compute Engine instance"""
         return self.client.post(
             f"/gcp/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/reset",
@@ -2206,7 +2854,7 @@ class GCPComputeResource:
         project: str,
         name: str,
         auto_create_subnetworks: bool = True,
-        description: Optional[str] = None,
+        description: str | None = None,
     ) -> GCPNetwork:
         """
         Create a GCP VPC network
@@ -2220,7 +2868,7 @@ class GCPComputeResource:
         Returns:
             GCPNetwork object
         """
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "name": name,
             "autoCreateSubnetworks": auto_create_subnetworks,
         }
@@ -2236,7 +2884,7 @@ class GCPComputeResource:
             auto_create_subnetworks=response.get("autoCreateSubnetworks", auto_create_subnetworks),
         )
 
-    def list_networks(self, project: str) -> List[GCPNetwork]:
+    def list_networks(self, project: str) -> list[GCPNetwork]:
         """List GCP VPC networks"""
         response = self.client.get(
             f"/gcp/compute/v1/projects/{project}/global/networks"
@@ -2264,10 +2912,10 @@ class GCPComputeResource:
         name: str,
         network: str,
         ip_cidr_range: str,
-        description: Optional[str] = None,
-    ) -> Dict[str, Any]:
+        description: str | None = None,
+    ) -> dict[str, Any]:
         """Create a GCP subnetwork"""
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "name": name,
             "network": f"global/networks/{network}",
             "ipCidrRange": ip_cidr_range,
@@ -2279,7 +2927,7 @@ class GCPComputeResource:
             json=body,
         )
 
-    def list_subnetworks(self, project: str, region: str) -> List[Dict[str, Any]]:
+    def list_subnetworks(self, project: str, region: str) -> list[dict[str, Any]]:
         """List GCP subnetworks in a region"""
         response = self.client.get(
             f"/gcp/compute/v1/projects/{project}/regions/{region}/subnetworks"
@@ -2293,11 +2941,11 @@ class GCPComputeResource:
         project: str,
         name: str,
         network: str,
-        allowed: List[Dict[str, Any]],
-        source_ranges: Optional[List[str]] = None,
-        target_tags: Optional[List[str]] = None,
-        description: Optional[str] = None,
-    ) -> Dict[str, Any]:
+        allowed: list[dict[str, Any]],
+        source_ranges: list[str] | None = None,
+        target_tags: list[str] | None = None,
+        description: str | None = None,
+    ) -> dict[str, Any]:
         """
         Create a GCP firewall rule
 
@@ -2313,7 +2961,7 @@ class GCPComputeResource:
         Returns:
             Firewall rule dict
         """
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "name": name,
             "network": f"global/networks/{network}",
             "allowed": allowed,
@@ -2329,7 +2977,7 @@ class GCPComputeResource:
             json=body,
         )
 
-    def list_firewalls(self, project: str) -> List[Dict[str, Any]]:
+    def list_firewalls(self, project: str) -> list[dict[str, Any]]:
         """List GCP firewall rules"""
         response = self.client.get(
             f"/gcp/compute/v1/projects/{project}/global/firewalls"
@@ -2340,8 +2988,8 @@ class GCPComputeResource:
         self,
         project: str,
         firewall: str,
-        updates: Dict[str, Any],
-    ) -> Dict[str, Any]:
+        updates: dict[str, Any],
+    ) -> dict[str, Any]:
         """Update a GCP firewall rule"""
         return self.client.request(
             "PATCH",
@@ -2365,7 +3013,7 @@ class GCPComputeResource:
         name: str,
         size_gb: int,
         disk_type: str = "pd-standard",
-        source_image: Optional[str] = None,
+        source_image: str | None = None,
     ) -> GCPDisk:
         """
         Create a GCP persistent disk
@@ -2381,7 +3029,7 @@ class GCPComputeResource:
         Returns:
             GCPDisk object
         """
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "name": name,
             "sizeGb": str(size_gb),
             "type": f"zones/{zone}/diskTypes/{disk_type}",
@@ -2400,7 +3048,7 @@ class GCPComputeResource:
             disk_type=disk_type,
         )
 
-    def list_disks(self, project: str, zone: str) -> List[GCPDisk]:
+    def list_disks(self, project: str, zone: str) -> list[GCPDisk]:
         """List GCP persistent disks in a zone"""
         response = self.client.get(
             f"/gcp/compute/v1/projects/{project}/zones/{zone}/disks"
@@ -2428,38 +3076,38 @@ class GCPComputeResource:
 # Azure
 # ==============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AzureResourceGroup:
     """Azure resource group"""
     name: str
     location: str
     subscription_id: str
-    provisioning_state: Optional[str] = None
-    tags: Optional[Dict[str, str]] = None
+    provisioning_state: str | None = None
+    tags: dict[str, str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AzureVirtualMachine:
     """Azure virtual machine"""
     name: str
     resource_group: str
     location: str
     subscription_id: str
-    vm_size: Optional[str] = None
-    provisioning_state: Optional[str] = None
-    os_type: Optional[str] = None
+    vm_size: str | None = None
+    provisioning_state: str | None = None
+    os_type: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AzureDisk:
     """Azure managed disk"""
     name: str
     resource_group: str
     location: str
     subscription_id: str
-    size_gb: Optional[int] = None
-    sku: Optional[str] = None
-    provisioning_state: Optional[str] = None
+    size_gb: int | None = None
+    sku: str | None = None
+    provisioning_state: str | None = None
 
 
 class AzureResource:
@@ -2475,7 +3123,7 @@ class AzureResource:
         subscription_id: str,
         name: str,
         location: str,
-        tags: Optional[Dict[str, str]] = None,
+        tags: dict[str, str] | None = None,
     ) -> AzureResourceGroup:
         """
         Create an Azure resource group
@@ -2505,7 +3153,7 @@ class AzureResource:
     def list_resource_groups(
         self,
         subscription_id: str,
-    ) -> List[AzureResourceGroup]:
+    ) -> list[AzureResourceGroup]:
         """List Azure resource groups"""
         response = self.client.get(
             f"/azure/subscriptions/{subscription_id}/resourceGroups"
@@ -2529,9 +3177,9 @@ class AzureResource:
         resource_group: str,
         vnet_name: str,
         location: str,
-        address_prefixes: List[str],
-        tags: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        address_prefixes: list[str],
+        tags: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
         """
         Create an Azure Virtual Network
 
@@ -2564,7 +3212,7 @@ class AzureResource:
         subscription_id: str,
         resource_group: str,
         vnet_name: str,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Get an Azure Virtual Network"""
         return self.client.get(
             f"/azure/subscriptions/{subscription_id}/resourceGroups/{resource_group}"
@@ -2575,7 +3223,7 @@ class AzureResource:
         self,
         subscription_id: str,
         resource_group: str,
-    ) -> List[Dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         """List Azure Virtual Networks in a resource group"""
         response = self.client.get(
             f"/azure/subscriptions/{subscription_id}/resourceGroups/{resource_group}"
@@ -2603,7 +3251,7 @@ class AzureResource:
         vnet_name: str,
         subnet_name: str,
         address_prefix: str,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Create an Azure subnet"""
         return self.client.request(
             "PUT",
@@ -2618,7 +3266,7 @@ class AzureResource:
         resource_group: str,
         vnet_name: str,
         subnet_name: str,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Get an Azure subnet"""
         return self.client.get(
             f"/azure/subscriptions/{subscription_id}/resourceGroups/{resource_group}"
@@ -2633,8 +3281,8 @@ class AzureResource:
         resource_group: str,
         nsg_name: str,
         location: str,
-        tags: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        tags: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
         """Create an Azure Network Security Group"""
         return self.client.request(
             "PUT",
@@ -2648,7 +3296,7 @@ class AzureResource:
         subscription_id: str,
         resource_group: str,
         nsg_name: str,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Get an Azure Network Security Group"""
         return self.client.get(
             f"/azure/subscriptions/{subscription_id}/resourceGroups/{resource_group}"
@@ -2669,7 +3317,7 @@ class AzureResource:
         destination_address_prefix: str = "*",
         source_port_range: str = "*",
         destination_port_range: str = "*",
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """
         Create an Azure NSG security rule
 
@@ -2718,19 +3366,19 @@ class AzureResource:
         nic_name: str,
         location: str,
         subnet_id: str,
-        public_ip_id: Optional[str] = None,
-        nsg_id: Optional[str] = None,
-        tags: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        public_ip_id: str | None = None,
+        nsg_id: str | None = None,
+        tags: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
         """Create an Azure Network Interface"""
-        ip_config: Dict[str, Any] = {
+        ip_config: dict[str, Any] = {
             "name": "ipconfig1",
             "properties": {"subnet": {"id": subnet_id}},
         }
         if public_ip_id:
             ip_config["properties"]["publicIPAddress"] = {"id": public_ip_id}
 
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "location": location,
             "tags": tags or {},
             "properties": {
@@ -2752,7 +3400,7 @@ class AzureResource:
         subscription_id: str,
         resource_group: str,
         nic_name: str,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Get an Azure Network Interface"""
         return self.client.get(
             f"/azure/subscriptions/{subscription_id}/resourceGroups/{resource_group}"
@@ -2769,8 +3417,8 @@ class AzureResource:
         location: str,
         allocation_method: str = "Dynamic",
         sku: str = "Basic",
-        tags: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        tags: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
         """Create an Azure Public IP Address"""
         return self.client.request(
             "PUT",
@@ -2791,7 +3439,7 @@ class AzureResource:
         subscription_id: str,
         resource_group: str,
         pip_name: str,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Get an Azure Public IP Address"""
         return self.client.get(
             f"/azure/subscriptions/{subscription_id}/resourceGroups/{resource_group}"
@@ -2808,8 +3456,8 @@ class AzureResource:
         location: str,
         size_gb: int,
         sku: str = "Standard_LRS",
-        os_type: Optional[str] = None,
-        tags: Optional[Dict[str, str]] = None,
+        os_type: str | None = None,
+        tags: dict[str, str] | None = None,
     ) -> AzureDisk:
         """
         Create an Azure managed disk
@@ -2827,7 +3475,7 @@ class AzureResource:
         Returns:
             AzureDisk object
         """
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "location": location,
             "sku": {"name": sku},
             "tags": tags or {},
@@ -2877,7 +3525,7 @@ class AzureResource:
         self,
         subscription_id: str,
         resource_group: str,
-    ) -> List[AzureDisk]:
+    ) -> list[AzureDisk]:
         """List Azure managed disks in a resource group"""
         response = self.client.get(
             f"/azure/subscriptions/{subscription_id}/resourceGroups/{resource_group}"
@@ -2920,11 +3568,11 @@ class AzureResource:
         vm_size: str,
         admin_username: str,
         nic_id: str,
-        image_reference: Optional[Dict[str, str]] = None,
+        image_reference: dict[str, str] | None = None,
         os_disk_type: str = "Standard_LRS",
-        admin_password: Optional[str] = None,
-        ssh_public_key: Optional[str] = None,
-        tags: Optional[Dict[str, str]] = None,
+        admin_password: str | None = None,
+        ssh_public_key: str | None = None,
+        tags: dict[str, str] | None = None,
     ) -> AzureVirtualMachine:
         """
         Create an Azure Virtual Machine
@@ -2946,7 +3594,7 @@ class AzureResource:
         Returns:
             AzureVirtualMachine object
         """
-        os_profile: Dict[str, Any] = {
+        os_profile: dict[str, Any] = {
             "computerName": vm_name,
             "adminUsername": admin_username,
         }
@@ -2963,7 +3611,7 @@ class AzureResource:
                 },
             }
 
-        body: Dict[str, Any] = {
+        body: dict[str, Any] = {
             "location": location,
             "tags": tags or {},
             "properties": {
@@ -3026,7 +3674,7 @@ class AzureResource:
         self,
         subscription_id: str,
         resource_group: str,
-    ) -> List[AzureVirtualMachine]:
+    ) -> list[AzureVirtualMachine]:
         """List Azure Virtual Machines in a resource group"""
         response = self.client.get(
             f"/azure/subscriptions/{subscription_id}/resourceGroups/{resource_group}"
@@ -3118,7 +3766,7 @@ class AzureResource:
         subscription_id: str,
         resource_group: str,
         vm_name: str,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Get the instance view of an Azure Virtual Machine"""
         return self.client.get(
             f"/azure/subscriptions/{subscription_id}/resourceGroups/{resource_group}"
@@ -3126,29 +3774,29 @@ class AzureResource:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Organization:
     """Organization resource"""
     id: str
     org_id: str
     name: str
     plan: str
-    owner: Optional[str] = None
-    description: Optional[str] = None
+    owner: str | None = None
+    description: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Domain:
     """Domain resource"""
     id: str
     domain_id: str
     domain: str
     verified: bool
-    organization: Optional[str] = None
-    dns_records: Optional[List[str]] = None
+    organization: str | None = None
+    dns_records: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Cloud:
     """Cloud environment resource"""
     id: str
@@ -3156,23 +3804,76 @@ class Cloud:
     name: str
     provider: str
     region: str
-    organization: Optional[str] = None
+    organization: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Project resource"""
     id: str
     project_id: str
     name: str
     environment: str
-    organization: Optional[str] = None
-    description: Optional[str] = None
+    organization: str | None = None
+    description: str | None = None
+
+
+def _org_from_api(d: dict[str, Any]) -> Organization:
+    """Build an Organization positionally from an API response dict"""
+    g = d.get
+    return Organization(
+        d["id"],
+        d["org_id"],
+        d["name"],
+        _intern(d["plan"]),
+        g("owner"),
+        g("description"),
+    )
+
+
+def _domain_from_api(d: dict[str, Any]) -> Domain:
+    """Build a Domain positionally from an API response dict"""
+    g = d.get
+    return Domain(
+        d["id"],
+        d["domain_id"],
+        d["domain"],
+        d["verified"],
+        _intern(g("organization")),
+        g("dns_records"),
+    )
+
+
+def _cloud_from_api(d: dict[str, Any]) -> Cloud:
+    """Build a Cloud positionally from an API response dict"""
+    return Cloud(
+        d["id"],
+        d["cloud_id"],
+        d["name"],
+        _intern(d["provider"]),
+        _intern(d["region"]),
+        _intern(d.get("organization")),
+    )
+
+
+def _project_from_api(d: dict[str, Any]) -> Project:
+    """Build a Project positionally from an API response dict"""
+    g = d.get
+    return Project(
+        d["id"],
+        d["project_id"],
+        d["name"],
+        _intern(d["environment"]),
+        _intern(g("organization")),
+        g("description"),
+    )
 
 
 class OrganizationResource:
     """Organization resource client"""
 
+    _ORG_URL = "/mock/organization/"
+
     def __init__(self, client):
         self.client = client
 
@@ -3180,8 +3881,8 @@ class OrganizationResource:
         self,
         name: str,
         plan: str = "free",
-        description: Optional[str] = None,
-        owner: Optional[str] = None,
+        description: str | None = None,
+        owner: str | None = None,
     ) -> Organization:
         """
         Create an organization
@@ -3204,59 +3905,47 @@ class OrganizationResource:
             >>> print(org.org_id)
             550e8400-e29b-41d4-a716-446655440000
         """
-        response = self.client.post("/mock/organization", json={
+        response = self.client.post("/mock/organization", json=_drop_none({
             "name": name,
             "plan": plan,
             "description": description,
             "owner": owner,
-        })
+        }))
 
-        return Organization(
-            id=response["id"],
-            org_id=response["org_id"],
-            name=response["name"],
-            plan=response["plan"],
-            owner=response.get("owner"),
-            description=response.get("description"),
-        )
+        return _org_from_api(response)
 
-    def list(self, plan: Optional[str] = None) -> List[Organization]:
+    def list(self, plan: str | None = None) -> list[Organization]:
         """List all organizations"""
         response = self.client.get("/mock/organization", params={"plan": plan} if plan else {})
 
-        return [
-            Organization(
-                id=org["id"],
-                org_id=org["org_id"],
-                name=org["name"],
-                plan=org["plan"],
-                owner=org.get("owner"),
-                description=org.get("description"),
-            )
-            for org in response.get("organizations", [])
-        ]
+        return [_org_from_api(org) for org in response.get("organizations", [])]
+
+    def list_iter(self, plan: str | None = None):
+        """Iterate over all organizations, yielding one at a time
+
+        Generator variant of list(): avoids building a second full list
+        of dataclasses alongside the decoded response.
+        """
+        response = self.client.get(
+            "/mock/organization", params={"plan": plan} if plan else {}
+        )
+        for org in response.get("organizations", []):
+            yield _org_from_api(org)
 
     def get(self, name: str) -> Organization:
         """Get organization by name"""
-        response = self.client.get(f"/mock/organization/{name}")
+        response = self.client.get(self._ORG_URL + _quote(name, safe=""))
 
-        return Organization(
-            id=response["id"],
-            org_id=response["org_id"],
-            name=response["name"],
-            plan=response["plan"],
-            owner=response.get("owner"),
-            description=response.get("description"),
-        )
+        return _org_from_api(response)
 
     def delete(self, name: str) -> bool:
         """Delete an organization"""
-        self.client.delete(f"/mock/organization/{name}")
+        self.client.delete(self._ORG_URL + _quote(name, safe=""))
         return True
 
     def add_user(self, org_name: str, username: str, role: str = "member") -> bool:
         """Add a user to an organization"""
-        self.client.post(f"/mock/organization/{org_name}/users", json={
+        self.client.post(self._ORG_URL + _quote(org_name, safe="") + "/users", json={
             "username": username,
             "role": role,
         })
@@ -3264,22 +3953,24 @@ class OrganizationResource:
 
     def remove_user(self, org_name: str, username: str) -> bool:
         """Remove a user from an organization"""
-        self.client.delete(f"/mock/organization/{org_name}/users/{username}")
+        self.client.delete(self._ORG_URL + _quote(org_name, safe="") + "/users/" + _quote(username, safe=""))
         return True
 
 
 class DomainResource:
     """Domain resource client"""
 
+    _DOMAIN_URL = "/mock/domain/"
+
     def __init__(self, client):
         self.client = client
 
     def create(
         self,
         domain: str,
-        organization: Optional[str] = None,
+        organization: str | None = None,
         verified: bool = False,
-        dns_records: Optional[List[str]] = None,
+        dns_records: list[str] | None = None,
     ) -> Domain:
         """
         Create a domain
@@ -3302,27 +3993,20 @@ class DomainResource:
             >>> print(domain.domain_id)
             550e8400-e29b-41d4-a716-446655440001
         """
-        response = self.client.post("/mock/domain", json={
+        response = self.client.post("/mock/domain", json=_drop_none({
             "domain": domain,
             "organization": organization,
             "verified": verified,
             "dns_records": dns_records or [],
-        })
+        }))
 
-        return Domain(
-            id=response["id"],
-            domain_id=response["domain_id"],
-            domain=response["domain"],
-            verified=response["verified"],
-            organization=response.get("organization"),
-            dns_records=response.get("dns_records"),
-        )
+        return _domain_from_api(response)
 
     def list(
         self,
-        organization: Optional[str] = None,
-        verified: Optional[bool] = None,
-    ) -> List[Domain]:
+        organization: str | None = None,
+        verified: bool | None = None,
+    ) -> list[Domain]:
         """List all domains"""
         params = {}
         if organization:
@@ -3332,45 +4016,30 @@ class DomainResource:
 
         response = self.client.get("/mock/domain", params=params)
 
-        return [
-            Domain(
-                id=dom["id"],
-                domain_id=dom["domain_id"],
-                domain=dom["domain"],
-                verified=dom["verified"],
-                organization=dom.get("organization"),
-                dns_records=dom.get("dns_records"),
-            )
-            for dom in response.get("domains", [])
-        ]
+        return [_domain_from_api(dom) for dom in response.get("domains", [])]
 
     def get(self, domain: str) -> Domain:
         """Get domain by name"""
-        response = self.client.get(f"/mock/domain/{domain}")
+        response = self.client.get(self._DOMAIN_URL + _quote(domain, safe=""))
 
-        return Domain(
-            id=response["id"],
-            domain_id=response["domain_id"],
-            domain=response["domain"],
-            verified=response["verified"],
-            organization=response.get("organization"),
-            dns_records=response.get("dns_records"),
-        )
+        return _domain_from_api(response)
 
     def verify(self, domain: str) -> bool:
         """Verify a domain"""
-        self.client.post(f"/mock/domain/{domain}/verify")
+        self.client.post(self._DOMAIN_URL + _quote(domain, safe="") + "/verify")
         return True
 
     def delete(self, domain: str) -> bool:
         """Delete a domain"""
-        self.client.delete(f"/mock/domain/{domain}")
+        self.client.delete(self._DOMAIN_URL + _quote(domain, safe=""))
         return True
 
 
 class CloudResource:
     """Cloud environment resource client"""
 
+    _CLOUD_URL = "/mock/cloud/"
+
     def __init__(self, client):
         self.client = client
 
@@ -3379,7 +4048,7 @@ class CloudResource:
         name: str,
         provider: str = "aws",
         region: str = "us-east-1",
-        organization: Optional[str] = None,
+        organization: str | None = None,
     ) -> Cloud:
         """
         Create a cloud environment
@@ -3403,27 +4072,20 @@ class CloudResource:
             >>> print(cloud.cloud_id)
             550e8400-e29b-41d4-a716-446655440002
         """
-        response = self.client.post("/mock/cloud", json={
+        response = self.client.post("/mock/cloud", json=_drop_none({
             "name": name,
             "provider": provider,
             "region": region,
             "organization": organization,
-        })
+        }))
 
-        return Cloud(
-            id=response["id"],
-            cloud_id=response["cloud_id"],
-            name=response["name"],
-            provider=response["provider"],
-            region=response["region"],
-            organization=response.get("organization"),
-        )
+        return _cloud_from_api(response)
 
     def list(
         self,
-        provider: Optional[str] = None,
-        organization: Optional[str] = None,
-    ) -> List[Cloud]:
+        provider: str | None = None,
+        organization: str | None = None,
+    ) -> list[Cloud]:
         """List all cloud environments"""
         params = {}
         if provider:
@@ -3433,40 +4095,25 @@ class CloudResource:
 
         response = self.client.get("/mock/cloud", params=params)
 
-        return [
-            Cloud(
-                id=cld["id"],
-                cloud_id=cld["cloud_id"],
-                name=cld["name"],
-                provider=cld["provider"],
-                region=cld["region"],
-                organization=cld.get("organization"),
-            )
-            for cld in response.get("clouds", [])
-        ]
+        return [_cloud_from_api(cld) for cld in response.get("clouds", [])]
 
     def get(self, name: str) -> Cloud:
         """Get cloud environment by name"""
-        response = self.client.get(f"/mock/cloud/{name}")
+        response = self.client.get(self._CLOUD_URL + _quote(name, safe=""))
 
-        return Cloud(
-            id=response["id"],
-            cloud_id=response["cloud_id"],
-            name=response["name"],
-            provider=response["provider"],
-            region=response["region"],
-            organization=response.get("organization"),
-        )
+        return _cloud_from_api(response)
 
     def delete(self, name: str) -> bool:
         """Delete a cloud environment"""
-        self.client.delete(f"/mock/cloud/{name}")
+        self.client.delete(self._CLOUD_URL + _quote(name, safe=""))
         return True
 
 
 class ProjectResource:
     """Project resource client"""
 
+    _PROJECT_URL = "/mock/project/"
+
     def __init__(self, client):
         self.client = client
 
@@ -3474,8 +4121,8 @@ class ProjectResource:
         self,
         name: str,
         environment: str = "development",
-        organization: Optional[str] = None,
-        description: Optional[str] = None,
+        organization: str | None = None,
+        description: str | None = None,
     ) -> Project:
         """
         Create a project
@@ -3498,27 +4145,20 @@ class ProjectResource:
             >>> print(project.project_id)
             550e8400-e29b-41d4-a716-446655440003
         """
-        response = self.client.post("/mock/project", json={
+        response = self.client.post("/mock/project", json=_drop_none({
             "name": name,
             "environment": environment,
             "organization": organization,
             "description": description,
-        })
+        }))
 
-        return Project(
-            id=response["id"],
-            project_id=response["project_id"],
-            name=response["name"],
-            environment=response["environment"],
-            organization=response.get("organization"),
-            description=response.get("description"),
-        )
+        return _project_from_api(response)
 
     def list(
         self,
-        organization: Optional[str] = None,
-        environment: Optional[str] = None,
-    ) -> List[Project]:
+        organization: str | None = None,
+        environment: str | None = None,
+    ) -> list[Project]:
         """List all projects"""
         params = {}
         if organization:
@@ -3528,30 +4168,41 @@ class ProjectResource:
 
         response = self.client.get("/mock/project", params=params)
 
-        return [
-            Project(
-                id=proj["id"],
-                project_id=proj["project_id"],
-                name=proj["name"],
-                environment=proj["environment"],
-                organization=proj.get("organization"),
-                description=proj.get("description"),
-            )
-            for proj in response.get("projects", [])
-        ]
+        return [_project_from_api(proj) for proj in response.get("projects", [])]
+
+    def iter(
+        self,
+        organization: str | None = None,
+        environment: str | None = None,
+        page_size: int = 500,
+    ):
+        """
+        Iterate over projects with server-side pagination
+
+        Pages through /mock/project following next_token, yielding one
+        Project at a time; memory stays bounded by page_size and early
+        break skips the remaining pages.
+        """
+        params: dict[str, Any] = {"max_results": page_size}
+        if organization:
+            params["organization"] = organization
+        if environment:
+            params["environment"] = environment
+
+        while True:
+            response = self.client.get("/mock/project", params=params)
+            for proj in response.get("projects", []):
+                yield _project_from_api(proj)
+            token = response.get("next_token")
+            if not token:
+                return
+            params["next_token"] = token
 
     def get(self, project_id: str) -> Project:
         """Get project by ID"""
-        response = self.client.get(f"/mock/project/{project_id}")
+        response = self.client.get(self._PROJECT_URL + _quote(project_id, safe=""))
 
-        return Project(
-            id=response["id"],
-            project_id=response["project_id"],
-            name=response["name"],
-            environment=response["environment"],
-            organization=response.get("organization"),
-            description=response.get("description"),
-        )
+        return _project_from_api(response)
 
     def bind_resource(
         self,
@@ -3560,12 +4211,45 @@ class ProjectResource:
         resource_id: str,
     ) -> bool:
         """Bind a resource to a project"""
-        self.client.post(f"/mock/project/{project_id}/resources", json={
+        self.client.post(self._PROJECT_URL + _quote(project_id, safe="") + "/resources", json={
             "resource_type": resource_type,
             "resource_id": resource_id,
         })
         return True
 
+    def bind_resources(
+        self,
+        project_id: str,
+        resources: list[tuple],
+    ) -> bool:
+        """
+        Bind several resources to a project in one request
+
+        Each entry is a (resource_type, resource_id) tuple; the whole
+        set goes out as a single POST instead of one round-trip per
+        binding.
+
+        Args:
+            project_id: Project ID
+            resources: List of (resource_type, resource_id) tuples
+
+        Example:
+            >>> mf.project.bind_resources("proj-1", [
+            ...     ("vpc", vpc.id),
+            ...     ("lambda", fn.id),
+            ... ])
+        """
+        self.client.post(
+            self._PROJECT_URL + _quote(project_id, safe="") + "/resources/batch",
+            json={
+                "resources": [
+                    {"resource_type": rtype, "resource_id": rid}
+                    for rtype, rid in resources
+                ]
+            },
+        )
+        return True
+
     def unbind_resource(
         self,
         project_id: str,
@@ -3574,70 +4258,70 @@ class ProjectResource:
     ) -> bool:
         """Unbind a resource from a project"""
         self.client.delete(
-            f"/mock/project/{project_id}/resources/{resource_type}/{resource_id}"
+            self._PROJECT_URL + _quote(project_id, safe="") + "/resources/" + _quote(resource_type, safe="") + "/" + _quote(resource_id, safe="")
         )
         return True
 
     def delete(self, project_id: str, delete_resources: bool = False) -> bool:
         """Delete a project"""
         self.client.delete(
-            f"/mock/project/{project_id}",
+            self._PROJECT_URL + _quote(project_id, safe=""),
             params={"delete_resources": delete_resources}
         )
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class IAMUser:
     """IAM User resource"""
     id: str
     username: str
     path: str
     arn: str
-    organization: Optional[str] = None
-    cloud: Optional[str] = None
-    policies: Optional[List[str]] = None
+    organization: str | None = None
+    cloud: str | None = None
+    policies: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IAMGroup:
     """IAM Group resource"""
     id: str
     group_name: str
     arn: str
-    organization: Optional[str] = None
-    cloud: Optional[str] = None
-    description: Optional[str] = None
-    policies: Optional[List[str]] = None
+    organization: str | None = None
+    cloud: str | None = None
+    description: str | None = None
+    policies: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IAMRole:
     """IAM Role resource"""
     id: str
     role_name: str
     arn: str
-    trust_policy: Dict[str, Any]
-    organization: Optional[str] = None
-    cloud: Optional[str] = None
-    description: Optional[str] = None
-    policies: Optional[List[str]] = None
+    trust_policy: dict[str, Any]
+    organization: str | None = None
+    cloud: str | None = None
+    description: str | None = None
+    policies: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IAMPolicy:
     """IAM Policy resource"""
     id: str
     policy_name: str
     policy_arn: str
-    policy_document: Dict[str, Any]
-    description: Optional[str] = None
-    organization: Optional[str] = None
-    cloud: Optional[str] = None
-    attached_to: Optional[List[str]] = None
+    policy_document: dict[str, Any]
+    description: str | None = None
+    organization: str | None = None
+    cloud: str | None = None
+    attached_to: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IAMAccessKey:
     """IAM Access Key resource"""
     access_key_id: str
@@ -3647,11 +4331,97 @@ class IAMAccessKey:
     created_date: str
 
 
+def _iam_user_from_api(d: dict[str, Any]) -> IAMUser:
+    """Build an IAMUser positionally from an API response dict
+
+    The path, organization, and cloud fields repeat across large user
+    lists, so they are interned to share one string object per value.
+    """
+    g = d.get
+    return IAMUser(
+        d["id"],
+        d["username"],
+        _intern(d["path"]),
+        d["arn"],
+        _intern(g("organization")),
+        _intern(g("cloud")),
+        g("policies", []),
+    )
+
+
+def _iam_group_from_api(d: dict[str, Any]) -> IAMGroup:
+    """Build an IAMGroup positionally from an API response dict"""
+    g = d.get
+    return IAMGroup(
+        d["id"],
+        d["group_name"],
+        d["arn"],
+        _intern(g("organization")),
+        _intern(g("cloud")),
+        g("description"),
+        g("policies", []),
+    )
+
+
+def _iam_role_from_api(d: dict[str, Any]) -> IAMRole:
+    """Build an IAMRole positionally from an API response dict"""
+    g = d.get
+    return IAMRole(
+        d["id"],
+        d["role_name"],
+        d["arn"],
+        d["trust_policy"],
+        _intern(g("organization")),
+        _intern(g("cloud")),
+        g("description"),
+        g("policies", []),
+    )
+
+
+def _iam_access_key_from_api(d: dict[str, Any]) -> IAMAccessKey:
+    """Build an IAMAccessKey positionally from an API response dict"""
+    return IAMAccessKey(
+        d["access_key_id"],
+        d["secret_access_key"],
+        d["username"],
+        _intern(d["status"]),
+        d["created_date"],
+    )
+
+
+def _iam_policy_from_api(d: dict[str, Any]) -> IAMPolicy:
+    """Build an IAMPolicy positionally from an API response dict"""
+    g = d.get
+    return IAMPolicy(
+        d["id"],
+        d["policy_name"],
+        d["policy_arn"],
+        d["policy_document"],
+        g("description"),
+        _intern(g("organization")),
+        _intern(g("cloud")),
+        g("attached_to", []),
+    )
+
+
 class IAMResource:
     """IAM (Identity and Access Management) resource client"""
 
+    # URL prefixes for path-parameter endpoints; paths are formed by
+    # concatenation with percent-quoted names rather than f-strings
+    _USER_URL = "/iam/user/"
+    _GROUP_URL = "/iam/group/"
+    _ROLE_URL = "/iam/role/"
+    _POLICY_URL = "/iam/policy/"
+    _RESOURCE_POLICY_URL = "/iam/resource-policy/"
+
     def __init__(self, client):
         self.client = client
+        # Bind the hot verb helpers once; the attach/detach loops below
+        # then skip two attribute lookups per call.
+        self._get = client.get
+        self._post = client.post
+        self._delete = client.delete
 
     # ========================================================================
     # IAM Users
@@ -3661,8 +4431,8 @@ class IAMResource:
         self,
         username: str,
         path: str = "/",
-        organization: Optional[str] = None,
-        cloud: Optional[str] = None,
+        organization: str | None = None,
+        cloud: str | None = None,
     ) -> IAMUser:
         """
         Create an IAM user
@@ -3685,67 +4455,78 @@ class IAMResource:
             >>> print(user.arn)
             arn:aws:iam::123456789:user/john.smith
         """
-        response = self.client.post("/iam/user", json={
+        response = self._post("/iam/user", json=_drop_none({
             "username": username,
             "path": path,
             "organization": organization,
             "cloud": cloud,
-        })
+        }))
 
-        return IAMUser(
-            id=response["id"],
-            username=response["username"],
-            path=response["path"],
-            arn=response["arn"],
-            organization=response.get("organization"),
-            cloud=response.get("cloud"),
-            policies=response.get("policies", []),
-        )
+        return _iam_user_from_api(response)
 
     def list_users(
         self,
-        organization: Optional[str] = None,
-        cloud: Optional[str] = None,
-    ) -> List[IAMUser]:
+        organization: str | None = None,
+        cloud: str | None = None,
+    ) -> list[IAMUser]:
         """List IAM users"""
-        params = {}
+        params = {
+            k: v
+            for k, v in (("organization", organization), ("cloud", cloud))
+            if v is not None
+        }
+
+        response = self._get("/iam/user", params=params)
+
+        return [_iam_user_from_api(user) for user in response.get("users", [])]
+
+    def iter_users(
+        self,
+        organization: str | None = None,
+        cloud: str | None = None,
+        page_size: int = 500,
+    ):
+        """
+        Iterate over IAM users with server-side pagination
+
+        Fetches pages of page_size users and yields them one at a time,
+        following the response's next_token until exhausted. Peak memory
+        stays at one page regardless of fleet size, and callers can
+        break out early without paying for the remaining pages.
+
+        Args:
+            organization: Filter by organization
+            cloud: Filter by cloud environment
+            page_size: Users per page (default: 500)
+
+        Example:
+            >>> for user in mf.iam.iter_users(organization="acme-corp"):
+            ...     print(user.username)
+        """
+        params: dict[str, Any] = {"max_results": page_size}
         if organization:
             params["organization"] = organization
         if cloud:
             params["cloud"] = cloud
 
-        response = self.client.get("/iam/user", params=params)
-
-        return [
-            IAMUser(
-                id=user["id"],
-                username=user["username"],
-                path=user["path"],
-                arn=user["arn"],
-                organization=user.get("organization"),
-                cloud=user.get("cloud"),
-                policies=user.get("policies", []),
-            )
-            for user in response.get("users", [])
-        ]
+        while True:
+            response = self._get("/iam/user", params=params)
+            for user in response.get("users", []):
+                yield _iam_user_from_api(user)
+            token = response.get("next_token")
+            if not token:
+                return
+            params["next_token"] = token
 
     def get_user(self, username: str) -> IAMUser:
         """Get IAM user by username"""
-        response = self.client.get(f"/iam/user/{username}")
+        response = self._get(self._USER_URL + _quote(username, safe=""))
 
-        return IAMUser(
-            id=response["id"],
-            username=response["username"],
-            path=response["path"],
-            arn=response["arn"],
-            organization=response.get("organization"),
-            cloud=response.get("cloud"),
-            policies=response.get("policies", []),
-        )
+        return _iam_user_from_api(response)
 
     def delete_user(self, username: str) -> bool:
         """Delete an IAM user"""
-        self.client.delete(f"/iam/user/{username}")
+        self._delete(self._USER_URL + _quote(username, safe=""))
         return True
 
     # ========================================================================
@@ -3755,9 +4536,9 @@ class IAMResource:
     def create_group(
         self,
         group_name: str,
-        organization: Optional[str] = None,
-        cloud: Optional[str] = None,
-        description: Optional[str] = None,
+        organization: str | None = None,
+        cloud: str | None = None,
+        description: str | None = None,
     ) -> IAMGroup:
         """
         Create an IAM group
@@ -3778,33 +4559,48 @@ class IAMResource:
             ...     description="Development team"
             ... )
         """
-        response = self.client.post("/iam/group", json={
+        response = self._post("/iam/group", json=_drop_none({
             "group_name": group_name,
             "organization": organization,
             "cloud": cloud,
             "description": description,
-        })
+        }))
 
-        return IAMGroup(
-            id=response["id"],
-            group_name=response["group_name"],
-            arn=response["arn"],
-            organization=response.get("organization"),
-            cloud=response.get("cloud"),
-            description=response.get("description"),
-            policies=response.get("policies", []),
-        )
+        return _iam_group_from_api(response)
 
     def add_user_to_group(self, username: str, group_name: str) -> bool:
         """Add an IAM user to a group"""
-        self.client.post(f"/iam/group/{group_name}/users", json={
+        self._post(self._GROUP_URL + _quote(group_name, safe="") + "/users", json={
             "username": username
         })
         return True
 
+    def add_users_to_group(self, usernames: list[str], group_name: str) -> bool:
+        """
+        Add several IAM users to a group in one request
+
+        Onboarding N users costs one POST instead of N; the server
+        applies the whole list atomically.
+
+        Args:
+            usernames: Usernames to add
+            group_name: Target group name
+
+        Example:
+            >>> mf.iam.add_users_to_group(
+            ...     usernames=[u.username for u in users],
+            ...     group_name="developers",
+            ... )
+        """
+        self._post(
+            self._GROUP_URL + _quote(group_name, safe="") + "/users/batch",
+            json={"usernames": usernames},
+        )
+        return True
+
     def remove_user_from_group(self, username: str, group_name: str) -> bool:
         """Remove an IAM user from a group"""
-        self.client.delete(f"/iam/group/{group_name}/users/{username}")
+        self._delete(self._GROUP_URL + _quote(group_name, safe="") + "/users/" + _quote(username, safe=""))
         return True
 
     # ========================================================================
@@ -3814,10 +4610,10 @@ class IAMResource:
     def create_role(
         self,
         role_name: str,
-        trust_policy: Dict[str, Any],
-        organization: Optional[str] = None,
-        cloud: Optional[str] = None,
-        description: Optional[str] = None,
+        trust_policy: dict[str, Any],
+        organization: str | None = None,
+        cloud: str | None = None,
+        description: str | None = None,
     ) -> IAMRole:
         """
         Create an IAM role
@@ -3839,24 +4635,15 @@ class IAMResource:
             ...     cloud="prod-cloud"
             ... )
         """
-        response = self.client.post("/iam/role", json={
+        response = self._post("/iam/role", json=_drop_none({
             "role_name": role_name,
             "trust_policy": trust_policy,
             "organization": organization,
             "cloud": cloud,
             "description": description,
-        })
+        }))
 
-        return IAMRole(
-            id=response["id"],
-            role_name=response["role_name"],
-            arn=response["arn"],
-            trust_policy=response["trust_policy"],
-            organization=response.get("organization"),
-            cloud=response.get("cloud"),
-            description=response.get("description"),
-            policies=response.get("policies", []),
-        )
+        return _iam_role_from_api(response)
 
     # ========================================================================
     # IAM Policies
@@ -3865,10 +4652,10 @@ class IAMResource:
     def create_policy(
         self,
         policy_name: str,
-        policy_document: Dict[str, Any],
-        description: Optional[str] = None,
-        organization: Optional[str] = None,
-        cloud: Optional[str] = None,
+        policy_document: dict[str, Any],
+        description: str | None = None,
+        organization: str | None = None,
+        cloud: str | None = None,
     ) -> IAMPolicy:
         """
         Create an IAM policy
@@ -3896,71 +4683,123 @@ class IAMResource:
             ...     }
             ... )
         """
-        response = self.client.post("/iam/policy", json={
+        if getattr(self.client, "iam_optimize", False):
+            policy_document = optimize_policy(policy_document)
+        response = self._post("/iam/policy", json=_drop_none({
             "policy_name": policy_name,
             "policy_document": policy_document,
             "description": description,
             "organization": organization,
             "cloud": cloud,
-        })
+        }))
 
-        return IAMPolicy(
-            id=response["id"],
-            policy_name=response["policy_name"],
-            policy_arn=response["policy_arn"],
-            policy_document=response["policy_document"],
-            description=response.get("description"),
-            organization=response.get("organization"),
-            cloud=response.get("cloud"),
-            attached_to=response.get("attached_to", []),
-        )
+        return _iam_policy_from_api(response)
 
     def list_policies(
         self,
-        organization: Optional[str] = None,
-        cloud: Optional[str] = None,
-    ) -> List[IAMPolicy]:
+        organization: str | None = None,
+        cloud: str | None = None,
+    ) -> list[IAMPolicy]:
         """List IAM policies"""
-        params = {}
+        params = {
+            k: v
+            for k, v in (("organization", organization), ("cloud", cloud))
+            if v is not None
+        }
+
+        response = self._get("/iam/policy", params=params)
+
+        return [_iam_policy_from_api(pol) for pol in response.get("policies", [])]
+
+    def iter_policies(
+        self,
+        organization: str | None = None,
+        cloud: str | None = None,
+        page_size: int = 500,
+    ):
+        """
+        Iterate over IAM policies with server-side pagination
+
+        Fetches pages of page_size policies and yields them one at a
+        time, following the response's next_token until exhausted. Peak
+        memory stays at one page regardless of tenant size, and callers
+        can break out early without paying for the remaining pages.
+
+        Args:
+            organization: Filter by organization
+            cloud: Filter by cloud environment
+            page_size: Policies per page (default: 500)
+
+        Example:
+            >>> for policy in mf.iam.iter_policies(organization="acme-corp"):
+            ...     print(policy.policy_name)
+        """
+        params: dict[str, Any] = {"max_results": page_size}
         if organization:
             params["organization"] = organization
         if cloud:
             params["cloud"] = cloud
 
-        response = self.client.get("/iam/policy", params=params)
-
-        return [
-            IAMPolicy(
-                id=pol["id"],
-                policy_name=pol["policy_name"],
-                policy_arn=pol["policy_arn"],
-                policy_document=pol["policy_document"],
-                description=pol.get("description"),
-                organization=pol.get("organization"),
-                cloud=pol.get("cloud"),
-                attached_to=pol.get("attached_to", []),
-            )
-            for pol in response.get("policies", [])
-        ]
+        while True:
+            response = self._get("/iam/policy", params=params)
+            for policy in response.get("policies", []):
+                yield _iam_policy_from_api(policy)
+            token = response.get("next_token")
+            if not token:
+                return
+            params["next_token"] = token
 
     def get_policy(self, policy_name: str) -> IAMPolicy:
         """Get IAM policy by name"""
-        response = self.client.get(f"/iam/policy/{policy_name}")
+        response = self._get(self._POLICY_URL + _quote(policy_name, safe=""))
 
-        return IAMPolicy(
-            id=response["id"],
-            policy_name=response["policy_name"],
-            policy_arn=response["policy_arn"],
-            policy_document=response["policy_document"],
-            description=response.get("description"),
-            organization=response.get("organization"),
-            cloud=response.get("cloud"),
-            attached_to=response.get("attached_to", []),
-        )
+        return _iam_policy_from_api(response)
+
+    def create_policies_split(
+        self,
+        policy_name: str,
+        policy_document: dict[str, Any],
+        description: str | None = None,
+        organization: str | None = None,
+        cloud: str | None = None,
+        size_limit: int = DEFAULT_POLICY_SIZE_LIMIT,
+    ) -> list[IAMPolicy]:
+        """
+        Create a policy, auto-splitting documents over the size limit
+
+        Documents within the limit behave exactly like create_policy and
+        return a single-element list. Oversize documents are bin-packed
+        into compliant sub-policies (first-fit-decreasing on serialized
+        statement size) named "<policy_name>-1", "<policy_name>-2", ...
+
+        Args:
+            policy_name: Base policy name
+            policy_document: Policy document JSON
+            description: Policy description
+            organization: Organization to bind to
+            cloud: Cloud environment to bind to
+            size_limit: Maximum serialized bytes per policy
+
+        Returns:
+            List of created IAMPolicy objects
+        """
+        documents = split_policy_document(policy_document, limit=size_limit)
+        if len(documents) == 1:
+            return [self.create_policy(
+                policy_name, documents[0],
+                description=description, organization=organization, cloud=cloud,
+            )]
+        return [
+            self.create_policy(
+                f"{policy_name}-{i}", doc,
+                description=description, organization=organization, cloud=cloud,
+            )
+            for i, doc in enumerate(documents, start=1)
+        ]
 
     def delete_policy(self, policy_name: str) -> bool:
         """Delete an IAM policy"""
-        self.client.delete(f"/iam/policy/{policy_name}")
+        self._delete(self._POLICY_URL + _quote(policy_name, safe=""))
         return True
 
     # ========================================================================
@@ -3969,38 +4808,95 @@ class IAMResource:
 
     def attach_user_policy(self, username: str, policy_name: str) -> bool:
         """Attach a policy to an IAM user"""
-        self.client.post(f"/iam/user/{username}/policies", json={
+        self._post(self._USER_URL + _quote(username, safe="") + "/policies", json={
             "policy_name": policy_name
         })
         return True
 
     def detach_user_policy(self, username: str, policy_name: str) -> bool:
         """Detach a policy from an IAM user"""
-        self.client.delete(f"/iam/user/{username}/policies/{policy_name}")
+        self._delete(self._USER_URL + _quote(username, safe="") + "/policies/" + _quote(policy_name, safe=""))
         return True
 
     def attach_group_policy(self, group_name: str, policy_name: str) -> bool:
         """Attach a policy to an IAM group"""
-        self.client.post(f"/iam/group/{group_name}/policies", json={
+        self._post(self._GROUP_URL + _quote(group_name, safe="") + "/policies", json={
             "policy_name": policy_name
         })
         return True
 
     def detach_group_policy(self, group_name: str, policy_name: str) -> bool:
         """Detach a policy from an IAM group"""
-        self.client.delete(f"/iam/group/{group_name}/policies/{policy_name}")
+        self._delete(self._GROUP_URL + _quote(group_name, safe="") + "/policies/" + _quote(policy_name, safe=""))
         return True
 
     def attach_role_policy(self, role_name: str, policy_name: str) -> bool:
         """Attach a policy to an IAM role"""
-        self.client.post(f"/iam/role/{role_name}/policies", json={
+        self._post(self._ROLE_URL + _quote(role_name, safe="") + "/policies", json={
             "policy_name": policy_name
         })
         return True
 
     def detach_role_policy(self, role_name: str, policy_name: str) -> bool:
         """Detach a policy from an IAM role"""
-        self.client.delete(f"/iam/role/{role_name}/policies/{policy_name}")
+        self._delete(self._ROLE_URL + _quote(role_name, safe="") + "/policies/" + _quote(policy_name, safe=""))
+        return True
+
+    def attach_user_policies(self, username: str, policy_names: list[str]) -> bool:
+        """Attach several policies to an IAM user in one request
+
+        Attaching N policies costs one POST instead of N round-trips.
+
+        Example:
+            >>> mf.iam.attach_user_policies("john.smith", [
+            ...     "s3-read-only",
+            ...     "dynamodb-read-only",
+            ... ])
+        """
+        self._post(
+            self._USER_URL + _quote(username, safe="") + "/policies:attach",
+            json={"policy_names": policy_names},
+        )
+        return True
+
+    def detach_user_policies(self, username: str, policy_names: list[str]) -> bool:
+        """Detach several policies from an IAM user in one request"""
+        self._post(
+            self._USER_URL + _quote(username, safe="") + "/policies:detach",
+            json={"policy_names": policy_names},
+        )
+        return True
+
+    def attach_group_policies(self, group_name: str, policy_names: list[str]) -> bool:
+        """Attach several policies to an IAM group in one request"""
+        self._post(
+            self._GROUP_URL + _quote(group_name, safe="") + "/policies:attach",
+            json={"policy_names": policy_names},
+        )
+        return True
+
+    def detach_group_policies(self, group_name: str, policy_names: list[str]) -> bool:
+        """Detach several policies from an IAM group in one request"""
+        self._post(
+            self._GROUP_URL + _quote(group_name, safe="") + "/policies:detach",
+            json={"policy_names": policy_names},
+        )
+        return True
+
+    def attach_role_policies(self, role_name: str, policy_names: list[str]) -> bool:
+        """Attach several policies to an IAM role in one request"""
+        self._post(
+            self._ROLE_URL + _quote(role_name, safe="") + "/policies:attach",
+            json={"policy_names": policy_names},
+        )
+        return True
+
+    def detach_role_policies(self, role_name: str, policy_names: list[str]) -> bool:
+        """Detach several policies from an IAM role in one request"""
+        self._post(
+            self._ROLE_URL + _quote(role_name, safe="") + "/policies:detach",
+            json={"policy_names": policy_names},
+        )
         return True
 
     # ========================================================================
@@ -4010,7 +4906,7 @@ class IAMResource:
     def create_access_key(
         self,
         username: str,
-        description: Optional[str] = None,
+        description: str | None = None,
     ) -> IAMAccessKey:
         """
         Create an access key for an IAM user
@@ -4030,26 +4926,20 @@ class IAMResource:
             >>> print(f"Key ID: {key.access_key_id}")
             >>> print(f"Secret: {key.secret_access_key}")
         """
-        response = self.client.post(f"/iam/user/{username}/access-keys", json={
+        response = self._post(self._USER_URL + _quote(username, safe="") + "/access-keys", json={
             "description": description
         })
 
-        return IAMAccessKey(
-            access_key_id=response["access_key_id"],
-            secret_access_key=response["secret_access_key"],
-            username=response["username"],
-            status=response["status"],
-            created_date=response["created_date"],
-        )
+        return _iam_access_key_from_api(response)
 
-    def list_access_keys(self, username: str) -> List[Dict[str, Any]]:
+    def list_access_keys(self, username: str) -> list[dict[str, Any]]:
         """List access keys for an IAM user (without secrets)"""
-        response = self.client.get(f"/iam/user/{username}/access-keys")
+        response = self._get(self._USER_URL + _quote(username, safe="") + "/access-keys")
         return response.get("access_keys", [])
 
     def delete_access_key(self, username: str, access_key_id: str) -> bool:
         """Delete an access key"""
-        self.client.delete(f"/iam/user/{username}/access-keys/{access_key_id}")
+        self._delete(self._USER_URL + _quote(username, safe="") + "/access-keys/" + _quote(access_key_id, safe=""))
         return True
 
     # ========================================================================
@@ -4061,8 +4951,8 @@ class IAMResource:
         username: str,
         action: str,
         resource: str,
-        cloud: Optional[str] = None,
-    ) -> Dict[str, Any]:
+        cloud: str | None = None,
+    ) -> dict[str, Any]:
         """
         Check if a user has permission for an action on a resource
 
@@ -4084,7 +4974,7 @@ class IAMResource:
             >>> print(result["allowed"])
             True
         """
-        response = self.client.post("/iam/check-permission", json={
+        response = self._post("/iam/check-permission", json={
             "username": username,
             "action": action,
             "resource": resource,
@@ -4093,13 +4983,53 @@ class IAMResource:
 
         return response
 
+    def check_permissions(
+        self,
+        username: str,
+        checks: list[tuple[str, str]],
+        cloud: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Check many (action, resource) pairs for one user in a single call
+
+        Authorization UIs typically evaluate a screenful of pairs at
+        once; batching them collapses N check-permission round-trips
+        into one.
+
+        Args:
+            username: IAM username
+            checks: List of (action, resource) pairs
+            cloud: Cloud environment
+
+        Returns:
+            List of permission check results, one per pair, in order
+
+        Example:
+            >>> results = mf.iam.check_permissions("john.smith", [
+            ...     ("s3:GetObject", "my-bucket/key.txt"),
+            ...     ("s3:PutObject", "my-bucket/key.txt"),
+            ... ])
+            >>> print(results[0]["allowed"])
+            True
+        """
+        response = self._post("/iam/check-permissions", json=_drop_none({
+            "username": username,
+            "cloud": cloud,
+            "checks": [
+                {"action": action, "resource": resource}
+                for action, resource in checks
+            ],
+        }))
+
+        return response["results"]
+
     def simulate_policy(
         self,
         policy_name: str,
         action: str,
         resource: str,
-        username: Optional[str] = None,
-    ) -> Dict[str, Any]:
+        username: str | None = None,
+    ) -> dict[str, Any]:
         """
         Simulate IAM policy evaluation
 
@@ -4121,7 +5051,7 @@ class IAMResource:
             >>> print(result["decision"])
             "allowed"
         """
-        response = self.client.post("/iam/simulate-policy", json={
+        response = self._post("/iam/simulate-policy", json={
             "policy_name": policy_name,
             "action": action,
             "resource": resource,
@@ -4138,7 +5068,7 @@ class IAMResource:
         self,
         resource_type: str,
         resource_id: str,
-        policy_document: Dict[str, Any],
+        policy_document: dict[str, Any],
     ) -> bool:
         """
         Attach a resource-based policy to a resource
@@ -4162,7 +5092,9 @@ class IAMResource:
             ...     }
             ... )
         """
-        self.client.post(f"/iam/resource-policy/{resource_type}/{resource_id}", json={
+        if getattr(self.client, "iam_optimize", False):
+            policy_document = optimize_policy(policy_document)
+        self._post(self._RESOURCE_POLICY_URL + _quote(resource_type, safe="") + "/" + _quote(resource_id, safe=""), json={
             "policy_document": policy_document
         })
         return True
@@ -4171,9 +5103,9 @@ class IAMResource:
         self,
         resource_type: str,
         resource_id: str,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Get resource-based policy"""
-        response = self.client.get(f"/iam/resource-policy/{resource_type}/{resource_id}")
+        response = self._get(self._RESOURCE_POLICY_URL + _quote(resource_type, safe="") + "/" + _quote(resource_id, safe=""))
         return response.get("policy_document", {})
 
     def delete_resource_policy(
@@ -4182,24 +5114,149 @@ class IAMResource:
         resource_id: str,
     ) -> bool:
         """Delete resource-based policy"""
-        self.client.delete(f"/iam/resource-policy/{resource_type}/{resource_id}")
+        self._delete(self._RESOURCE_POLICY_URL + _quote(resource_type, safe="") + "/" + _quote(resource_id, safe=""))
         return True
 
 
+class GeneratorBatchResult:
+    """Deferred result of a call queued on a :class:`GeneratorBatch`"""
+
+    def __init__(self, batch, index):
+        self._batch = batch
+        self._index = index
+
+    def result(self) -> Any:
+        """Return the resolved value (valid after the batch block exits)"""
+        if self._batch._results is None:
+            raise MockFactoryError(
+                "Batch has not been executed yet. "
+                "Read .result() after the 'with' block exits."
+            )
+        return self._batch._results[self._index]
+
+
+class GeneratorBatch:
+    """
+    Collects generator calls and sends them in a single HTTP request
+
+    Each generate_* call queues an operation and returns a
+    GeneratorBatchResult immediately. On exiting the context manager, all
+    queued operations are POSTed to /generator/batch in one round-trip and
+    results are resolved in order.
+
+    Example:
+        >>> with mf.generator.batch() as batch:
+        ...     users = batch.generate_users(count=10)
+        ...     orgs = batch.generate_organizations(count=5)
+        >>> print(len(users.result()))
+        10
+    """
+
+    # Key to unwrap from each per-op response, mirroring the scalar methods
+    _RESULT_KEYS = {
+        "generate_users": "users",
+        "generate_employees": "employees",
+        "generate_organizations": "organizations",
+        "generate_network_config": None,
+        "generate_iam_policies": "policies",
+        "generate_test_scenario": None,
+    }
+
+    def __init__(self, client):
+        self.client = client
+        self._ops: list[dict[str, Any]] = []
+        self._results: list[Any] | None = None
+
+    def _enqueue(self, op: str, args: dict[str, Any]) -> GeneratorBatchResult:
+        future = GeneratorBatchResult(self, len(self._ops))
+        self._ops.append({"op": op, "args": args})
+        return future
+
+    def generate_users(self, **kwargs) -> GeneratorBatchResult:
+        """Queue a generate_users call (same arguments as GeneratorResource)"""
+        return self._enqueue("generate_users", kwargs)
+
+    def generate_employees(self, **kwargs) -> GeneratorBatchResult:
+        """Queue a generate_employees call"""
+        return self._enqueue("generate_employees", kwargs)
+
+    def generate_organizations(self, **kwargs) -> GeneratorBatchResult:
+        """Queue a generate_organizations call"""
+        return self._enqueue("generate_organizations", kwargs)
+
+    def generate_network_config(self, **kwargs) -> GeneratorBatchResult:
+        """Queue a generate_network_config call"""
+        return self._enqueue("generate_network_config", kwargs)
+
+    def generate_iam_policies(self, **kwargs) -> GeneratorBatchResult:
+        """Queue a generate_iam_policies call"""
+        return self._enqueue("generate_iam_policies", kwargs)
+
+    def generate_test_scenario(self, **kwargs) -> GeneratorBatchResult:
+        """Queue a generate_test_scenario call"""
+        return self._enqueue("generate_test_scenario", kwargs)
+
+    def execute(self) -> list[Any]:
+        """Send all queued operations in one request and resolve results"""
+        if not self._ops:
+            self._results = []
+            return self._results
+
+        response = self.client.post("/generator/batch", json={
+            "ops": self._ops,
+        })
+
+        raw_results = response.get("results", [])
+        results = []
+        for op, raw in zip(self._ops, raw_results):
+            key = self._RESULT_KEYS.get(op["op"])
+            results.append(raw.get(key, []) if key else raw)
+        self._results = results
+        return results
+
+    def __enter__(self) -> "GeneratorBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.execute()
+
+
 class GeneratorResource:
     """Data generation utilities for creating realistic test data"""
 
     def __init__(self, client):
         self.client = client
 
+    def batch(self) -> GeneratorBatch:
+        """
+        Start a batched generator session
+
+        All generate_* calls made on the returned object are collected and
+        sent to the server in a single HTTP round-trip when the context
+        manager exits.
+
+        Returns:
+            GeneratorBatch object
+
+        Example:
+            >>> with mf.generator.batch() as batch:
+            ...     users = batch.generate_users(count=10)
+            ...     employees = batch.generate_employees(count=50)
+            >>> print(len(users.result()), len(employees.result()))
+            10 50
+        """
+        return GeneratorBatch(self.client)
+
     def generate_users(
         self,
         count: int = 10,
         role: str = "mixed",
-        organization: Optional[str] = None,
-        cloud: Optional[str] = None,
-        domain: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+        organization: str | None = None,
+        cloud: str | None = None,
+        domain: str | None = None,
+        as_columns: bool = False,
+    ) -> Any:
         """
         Generate realistic user data
 
@@ -4209,9 +5266,11 @@ class GeneratorResource:
             organization: Organization to bind users to
             cloud: Cloud environment to bind to
             domain: Email domain
+            as_columns: Return a dict of field -> list of values instead
+                of a list of dicts (cheaper to aggregate over)
 
         Returns:
-            List of user dictionaries
+            List of user dictionaries, or a columnar dict if as_columns
 
         Example:
             >>> users = mf.generator.generate_users(
@@ -4231,14 +5290,18 @@ class GeneratorResource:
             "domain": domain,
         })
 
-        return response.get("users", [])
+        users = response.get("users", [])
+        if as_columns:
+            return _rows_to_columns(users)
+        return users
 
     def generate_employees(
         self,
         count: int = 10,
-        organization: Optional[str] = None,
-        departments: Optional[List[str]] = None,
-    ) -> List[Dict[str, Any]]:
+        organization: str | None = None,
+        departments: list[str] | None = None,
+        as_columns: bool = False,
+    ) -> Any:
         """
         Generate realistic employee data with job titles and departments
 
@@ -4246,9 +5309,11 @@ class GeneratorResource:
             count: Number of employees to generate
             organization: Organization to bind employees to
             departments: List of departments (default: Engineering, Sales, Marketing, HR, Finance, Operations)
+            as_columns: Return a dict of field -> list of values instead
+                of a list of dicts (cheaper to aggregate over)
 
         Returns:
-            List of employee dictionaries
+            List of employee dictionaries, or a columnar dict if as_columns
 
         Example:
             >>> employees = mf.generator.generate_employees(
@@ -4265,12 +5330,15 @@ class GeneratorResource:
             "departments": departments,
         })
 
-        return response.get("employees", [])
+        employees = response.get("employees", [])
+        if as_columns:
+            return _rows_to_columns(employees)
+        return employees
 
     def generate_organizations(
         self,
         count: int = 5,
-    ) -> List[Dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         """
         Generate realistic organization structures
 
@@ -4293,10 +5361,10 @@ class GeneratorResource:
 
     def generate_network_config(
         self,
-        cloud: Optional[str] = None,
+        cloud: str | None = None,
         vpc_cidr: str = "10.0.0.0/16",
         subnets: int = 3,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """
         Generate realistic network configuration
 
@@ -4330,8 +5398,8 @@ class GeneratorResource:
     def generate_iam_policies(
         self,
         policy_type: str = "common",
-        services: Optional[List[str]] = None,
-    ) -> List[Dict[str, Any]]:
+        services: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
         """
         Generate common IAM policy templates
 
@@ -4360,7 +5428,7 @@ class GeneratorResource:
     def generate_test_scenario(
         self,
         scenario: str = "startup",
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """
         Generate complete test scenarios with all resources
 
@@ -4390,10 +5458,105 @@ class GeneratorResource:
 
 
 class UtilitiesResource:
-    """Utility helpers for common transformations and operations"""
-
-    def __init__(self, client):
+    """Utility helpers for common transformations and operations
+
+    Convertible helpers (IP, CIDR, hex, base64, JSON, ...) are computed
+    locally by default — a round-trip costs orders of magnitude more
+    than the stdlib conversion it would return. Pass ``local=False``
+    here or ``MockFactory(utilities_local=False)`` to route them through
+    the API instead. ``verify_parity=True`` runs the deterministic
+    dual-path helpers both ways and warns when the local result drifts
+    from the server's — a CI guard for the local fast paths, not
+    something to enable in production (it reintroduces every
+    round-trip).
+    """
+
+    # Reusable CIDR membership index (see CidrIndex docstring)
+    CidrIndex = CidrIndex
+
+    def __init__(
+        self,
+        client,
+        local: bool | None = None,
+        verify_parity: bool = False,
+    ):
         self.client = client
+        self.local = (
+            getattr(client, "utilities_local", True) if local is None else local
+        )
+        self.verify_parity = verify_parity
+        # Memo for the pure hash helpers: repeats of the same input hit
+        # a dict probe instead of hashlib (or, with local=False, an
+        # HTTP round-trip)
+        self._memo = _MemoCache()
+        # (length, charset) -> deque of pre-generated strings; single
+        # random_string calls draw from a batch made _RAND_BATCH at a
+        # time, amortizing the entropy pass (or, with local=False, the
+        # round-trip) across many tokens
+        self._rand_buffers: dict = {}
+
+    def _check_parity(self, name, local_result, endpoint, payload, key):
+        """Compare a local result against the server's; warn on drift
+
+        Used by the dual-path helpers when verify_parity is set. The
+        local result is returned either way so CI failures come from
+        the warning filter, not a behavior flip.
+        """
+        response = self.client.post(endpoint, json=payload)
+        remote_result = response[key] if key else response
+        if remote_result != local_result:
+            warnings.warn(
+                f"utilities.{name}: local result diverges from server "
+                f"({local_result!r} != {remote_result!r})",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+        return local_result
+
+    def cidr_index(self, *cidrs: str) -> CidrIndex:
+        """
+        Build a reusable membership index for one or more CIDR blocks
+
+        Args:
+            cidrs: CIDR notations to index
+
+        Returns:
+            CidrIndex supporting ``ip in index`` for str or int IPs
+
+        Example:
+            >>> index = mf.utilities.cidr_index("10.0.0.0/16")
+            >>> "10.0.4.2" in index
+            True
+        """
+        return CidrIndex(*cidrs)
+
+    def batch(self, ops: list[tuple[str, dict]]) -> list[Any]:
+        """
+        Execute several utility operations in one HTTP request
+
+        Each op is an (operation, args) pair naming a utility endpoint
+        and its JSON arguments. The server runs them in order and
+        returns one result per op, so a mixed sequence of N server-side
+        helper calls pays one round-trip instead of N. Helpers that
+        compute locally don't need this; it exists for the server-only
+        operations and for local=False configurations.
+
+        Args:
+            ops: List of (operation, args) pairs
+
+        Returns:
+            List of results, one per operation, in order
+
+        Example:
+            >>> results = mf.utilities.batch([
+            ...     ("md5", {"data": "Hello"}),
+            ...     ("generate-uuid", {"version": 5}),
+            ... ])
+        """
+        response = self.client.post("/utilities/batch", json={
+            "ops": [{"op": op, "args": args} for op, args in ops]
+        })
+        return response["results"]
 
     # ========================================================================
     # Binary/Hex Conversion
@@ -4413,6 +5576,17 @@ class UtilitiesResource:
             >>> mf.utilities.bin2hex("11010101")
             "d5"
         """
+        if self.local:
+            try:
+                result = f"{int(binary, 2):x}"
+            except ValueError as e:
+                raise ValidationError(f"Invalid binary string: {binary}") from e
+            if self.verify_parity:
+                return self._check_parity(
+                    "bin2hex", result, "/utilities/bin2hex",
+                    {"binary": binary}, "hex",
+                )
+            return result
         response = self.client.post("/utilities/bin2hex", json={"binary": binary})
         return response["hex"]
 
@@ -4430,6 +5604,18 @@ class UtilitiesResource:
             >>> mf.utilities.hex2bin("d5")
             "11010101"
         """
+        if self.local:
+            try:
+                # Pad to four bits per hex digit so leading zeros survive
+                result = f"{int(hex_string, 16):0{4 * len(hex_string)}b}"
+            except ValueError as e:
+                raise ValidationError(f"Invalid hex string: {hex_string}") from e
+            if self.verify_parity:
+                return self._check_parity(
+                    "hex2bin", result, "/utilities/hex2bin",
+                    {"hex": hex_string}, "binary",
+                )
+            return result
         response = self.client.post("/utilities/hex2bin", json={"hex": hex_string})
         return response["binary"]
 
@@ -4451,6 +5637,13 @@ class UtilitiesResource:
             >>> mf.utilities.ip2bin("192.168.1.1")
             "11000000101010000000000100000001"
         """
+        if self.local:
+            result = f"{_ip_to_int(ip):032b}"
+            if self.verify_parity:
+                return self._check_parity(
+                    "ip2bin", result, "/utilities/ip2bin", {"ip": ip}, "binary"
+                )
+            return result
         response = self.client.post("/utilities/ip2bin", json={"ip": ip})
         return response["binary"]
 
@@ -4468,6 +5661,18 @@ class UtilitiesResource:
             >>> mf.utilities.bin2ip("11000000101010000000000100000001")
             "192.168.1.1"
         """
+        if self.local:
+            try:
+                value = int(binary, 2)
+            except ValueError as e:
+                raise ValidationError(f"Invalid binary string: {binary}") from e
+            result = _int_to_ip(value)
+            if self.verify_parity:
+                return self._check_parity(
+                    "bin2ip", result, "/utilities/bin2ip",
+                    {"binary": binary}, "ip",
+                )
+            return result
         response = self.client.post("/utilities/bin2ip", json={"binary": binary})
         return response["ip"]
 
@@ -4485,6 +5690,13 @@ class UtilitiesResource:
             >>> mf.utilities.ip2long("192.168.1.1")
             3232235777
         """
+        if self.local:
+            result = _ip_to_int(ip)
+            if self.verify_parity:
+                return self._check_parity(
+                    "ip2long", result, "/utilities/ip2long", {"ip": ip}, "long"
+                )
+            return result
         response = self.client.post("/utilities/ip2long", json={"ip": ip})
         return response["long"]
 
@@ -4502,9 +5714,87 @@ class UtilitiesResource:
             >>> mf.utilities.long2ip(3232235777)
             "192.168.1.1"
         """
+        if self.local:
+            result = _int_to_ip(long_int)
+            if self.verify_parity:
+                return self._check_parity(
+                    "long2ip", result, "/utilities/long2ip",
+                    {"long": long_int}, "ip",
+                )
+            return result
         response = self.client.post("/utilities/long2ip", json={"long": long_int})
         return response["ip"]
 
+    # ========================================================================
+    # Bulk IP Conversion (computed locally, no round-trip per value)
+    # ========================================================================
+
+    def ip2long_bulk(self, ips: list[str]) -> list[int]:
+        """
+        Convert many IP addresses to long integers in one pass
+
+        Computed locally with integer math — no HTTP round-trip per value.
+
+        Args:
+            ips: List of IP addresses
+
+        Returns:
+            List of long integer representations
+
+        Example:
+            >>> mf.utilities.ip2long_bulk(["192.168.1.1", "10.0.0.1"])
+            [3232235777, 167772161]
+        """
+        return [_ip_to_int(ip) for ip in ips]
+
+    def long2ip_bulk(self, longs: list[int]) -> list[str]:
+        """
+        Convert many long integers to IP addresses in one pass
+
+        Args:
+            longs: List of long integers
+
+        Returns:
+            List of IP addresses
+        """
+        return [_int_to_ip(value) for value in longs]
+
+    def ip_in_cidr_bulk(self, ips: list[str], cidr: str) -> list[bool]:
+        """
+        Check many IP addresses against a single CIDR range
+
+        The network base and mask are computed once; each IP is then a
+        single mask-and-compare, making this suitable for validating
+        thousands of addresses. With NumPy installed, large inputs are
+        packed into one uint32 array and checked with a single
+        vectorized AND-and-compare.
+
+        Args:
+            ips: List of IP addresses
+            cidr: CIDR notation (e.g., "10.0.0.0/24")
+
+        Returns:
+            List of booleans, one per input IP
+
+        Example:
+            >>> mf.utilities.ip_in_cidr_bulk(["10.0.0.5", "10.1.0.5"], "10.0.0.0/24")
+            [True, False]
+        """
+        base, mask = _parse_cidr(cidr)
+        if _np is not None and len(ips) >= 64:
+            try:
+                packed = b"".join(map(socket.inet_aton, ips))
+            except OSError:
+                pass  # invalid address; the scalar loop raises ValidationError
+            else:
+                arr = _np.frombuffer(packed, dtype=">u4")
+                return ((arr & mask) == base).tolist()
+        return [(_ip_to_int(ip) & mask) == base for ip in ips]
+
+    def ip_in_cidr_many(self, ips: list[str], cidr: str) -> list[bool]:
+        """Alias for ip_in_cidr_bulk"""
+        return self.ip_in_cidr_bulk(ips, cidr)
+
     # ========================================================================
     # IPv6 Helpers
     # ========================================================================
@@ -4523,6 +5813,17 @@ class UtilitiesResource:
             >>> mf.utilities.expand_ipv6("2001:db8::1")
             "2001:0db8:0000:0000:0000:0000:0000:0001"
         """
+        if self.local:
+            try:
+                result = ipaddress.IPv6Address(ipv6).exploded
+            except ValueError as e:
+                raise ValidationError(f"Invalid IPv6 address: {ipv6}") from e
+            if self.verify_parity:
+                return self._check_parity(
+                    "expand_ipv6", result, "/utilities/expand-ipv6",
+                    {"ipv6": ipv6}, "expanded",
+                )
+            return result
         response = self.client.post("/utilities/expand-ipv6", json={"ipv6": ipv6})
         return response["expanded"]
 
@@ -4540,6 +5841,17 @@ class UtilitiesResource:
             >>> mf.utilities.compress_ipv6("2001:0db8:0000:0000:0000:0000:0000:0001")
             "2001:db8::1"
         """
+        if self.local:
+            try:
+                result = ipaddress.IPv6Address(ipv6).compressed
+            except ValueError as e:
+                raise ValidationError(f"Invalid IPv6 address: {ipv6}") from e
+            if self.verify_parity:
+                return self._check_parity(
+                    "compress_ipv6", result, "/utilities/compress-ipv6",
+                    {"ipv6": ipv6}, "compressed",
+                )
+            return result
         response = self.client.post("/utilities/compress-ipv6", json={"ipv6": ipv6})
         return response["compressed"]
 
@@ -4557,6 +5869,21 @@ class UtilitiesResource:
             >>> mf.utilities.is_valid_ipv6("2001:db8::1")
             True
         """
+        if self.local:
+            # inet_pton is a C-level parse; orders of magnitude cheaper
+            # than constructing an IPv6Address just to discard it
+            try:
+                socket.inet_pton(socket.AF_INET6, ipv6)
+            except OSError:
+                result = False
+            else:
+                result = True
+            if self.verify_parity:
+                return self._check_parity(
+                    "is_valid_ipv6", result, "/utilities/validate-ipv6",
+                    {"ipv6": ipv6}, "valid",
+                )
+            return result
         response = self.client.post("/utilities/validate-ipv6", json={"ipv6": ipv6})
         return response["valid"]
 
@@ -4564,7 +5891,7 @@ class UtilitiesResource:
     # CIDR Helpers
     # ========================================================================
 
-    def cidr_to_range(self, cidr: str) -> Dict[str, str]:
+    def cidr_to_range(self, cidr: str) -> dict[str, str]:
         """
         Convert CIDR notation to IP range
 
@@ -4579,8 +5906,21 @@ class UtilitiesResource:
             >>> print(f"{result['start_ip']} - {result['end_ip']}")
             10.0.0.0 - 10.0.0.255
         """
-        response = self.client.post("/utilities/cidr-to-range", json={"cidr": cidr})
-        return response
+        if self.local:
+            base, mask = _parse_cidr(cidr)
+            size = (mask ^ 0xFFFFFFFF) + 1
+            result = {
+                "start_ip": _int_to_ip(base),
+                "end_ip": _int_to_ip(base + size - 1),
+                "total_ips": size,
+            }
+            if self.verify_parity:
+                return self._check_parity(
+                    "cidr_to_range", result, "/utilities/cidr-to-range",
+                    {"cidr": cidr}, None,
+                )
+            return result
+        return self.client.post("/utilities/cidr-to-range", json={"cidr": cidr})
 
     def ip_in_cidr(self, ip: str, cidr: str) -> bool:
         """
@@ -4597,6 +5937,15 @@ class UtilitiesResource:
             >>> mf.utilities.ip_in_cidr("10.0.0.50", "10.0.0.0/24")
             True
         """
+        if self.local:
+            base, mask = _parse_cidr(cidr)
+            result = (_ip_to_int(ip) & mask) == base
+            if self.verify_parity:
+                return self._check_parity(
+                    "ip_in_cidr", result, "/utilities/ip-in-cidr",
+                    {"ip": ip, "cidr": cidr}, "in_range",
+                )
+            return result
         response = self.client.post("/utilities/ip-in-cidr", json={"ip": ip, "cidr": cidr})
         return response["in_range"]
 
@@ -4615,17 +5964,56 @@ class UtilitiesResource:
             >>> mf.utilities.cidr_overlap("10.0.0.0/24", "10.0.0.128/25")
             True
         """
+        if self.local:
+            base1, mask1 = _parse_cidr(cidr1)
+            base2, mask2 = _parse_cidr(cidr2)
+            # Two ranges overlap iff one contains the other's base under
+            # the wider (smaller) mask.
+            shared = mask1 & mask2
+            result = (base1 & shared) == (base2 & shared)
+            if self.verify_parity:
+                return self._check_parity(
+                    "cidr_overlap", result, "/utilities/cidr-overlap",
+                    {"cidr1": cidr1, "cidr2": cidr2}, "overlap",
+                )
+            return result
         response = self.client.post("/utilities/cidr-overlap", json={
             "cidr1": cidr1,
             "cidr2": cidr2
         })
         return response["overlap"]
 
+    def cidr_overlap_bulk(self, pairs: list[tuple[str, str]]) -> list[bool]:
+        """
+        Check many CIDR pairs for overlap in one local pass
+
+        Args:
+            pairs: List of (cidr1, cidr2) pairs
+
+        Returns:
+            List of booleans, one per pair
+
+        Example:
+            >>> mf.utilities.cidr_overlap_bulk([("10.0.0.0/24", "10.0.0.128/25")])
+            [True]
+        """
+        results = []
+        for cidr1, cidr2 in pairs:
+            base1, mask1 = _parse_cidr(cidr1)
+            base2, mask2 = _parse_cidr(cidr2)
+            shared = mask1 & mask2
+            results.append((base1 & shared) == (base2 & shared))
+        return results
+
+    def cidr_overlap_many(self, pairs: list[tuple[str, str]]) -> list[bool]:
+        """Alias for cidr_overlap_bulk"""
+        return self.cidr_overlap_bulk(pairs)
+
     # ========================================================================
     # YAML Helpers
     # ========================================================================
 
-    def yaml_to_json(self, yaml_str: str) -> Dict[str, Any]:
+    def yaml_to_json(self, yaml_str: str) -> dict[str, Any]:
         """
         Convert YAML to JSON
 
@@ -4641,10 +6029,15 @@ class UtilitiesResource:
             >>> print(json_obj["name"])
             John
         """
+        if yaml is not None:
+            try:
+                return yaml.load(yaml_str, Loader=_YAML_LOADER)
+            except yaml.YAMLError as e:
+                raise ValidationError(f"Invalid YAML: {e}") from e
         response = self.client.post("/utilities/yaml-to-json", json={"yaml": yaml_str})
         return response["json"]
 
-    def json_to_yaml(self, json_obj: Dict[str, Any]) -> str:
+    def json_to_yaml(self, json_obj: dict[str, Any]) -> str:
         """
         Convert JSON to YAML
 
@@ -4661,10 +6054,14 @@ class UtilitiesResource:
             name: John
             age: 30
         """
+        if yaml is not None:
+            return yaml.dump(
+                json_obj, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False
+            )
         response = self.client.post("/utilities/json-to-yaml", json={"json": json_obj})
         return response["yaml"]
 
-    def validate_yaml(self, yaml_str: str) -> Dict[str, Any]:
+    def validate_yaml(self, yaml_str: str) -> dict[str, Any]:
         """
         Validate YAML syntax
 
@@ -4679,6 +6076,12 @@ class UtilitiesResource:
             >>> print(result["valid"])
             True
         """
+        if yaml is not None:
+            try:
+                yaml.load(yaml_str, Loader=_YAML_LOADER)
+            except yaml.YAMLError as e:
+                return {"valid": False, "errors": [str(e)]}
+            return {"valid": True, "errors": []}
         response = self.client.post("/utilities/validate-yaml", json={"yaml": yaml_str})
         return response
 
@@ -4701,6 +6104,18 @@ class UtilitiesResource:
             >>> print(minified)
             {"name":"John","age":30}
         """
+        if self.local:
+            try:
+                obj = json.loads(json_str)
+            except (ValueError, TypeError) as e:
+                raise ValidationError(f"Invalid JSON: {e}") from e
+            result = json.dumps(obj, separators=(",", ":"))
+            if self.verify_parity:
+                return self._check_parity(
+                    "minify_json", result, "/utilities/minify-json",
+                    {"json": json_str}, "minified",
+                )
+            return result
         response = self.client.post("/utilities/minify-json", json={"json": json_str})
         return response["minified"]
 
@@ -4723,13 +6138,25 @@ class UtilitiesResource:
               "age": 30
             }
         """
+        if self.local:
+            try:
+                obj = json.loads(json_str)
+            except (ValueError, TypeError) as e:
+                raise ValidationError(f"Invalid JSON: {e}") from e
+            result = json.dumps(obj, indent=indent)
+            if self.verify_parity:
+                return self._check_parity(
+                    "pretty_json", result, "/utilities/pretty-json",
+                    {"json": json_str, "indent": indent}, "formatted",
+                )
+            return result
         response = self.client.post("/utilities/pretty-json", json={
             "json": json_str,
             "indent": indent
         })
         return response["formatted"]
 
-    def validate_json(self, json_str: str) -> Dict[str, Any]:
+    def validate_json(self, json_str: str) -> dict[str, Any]:
         """
         Validate JSON syntax
 
@@ -4744,8 +6171,17 @@ class UtilitiesResource:
             >>> print(result["valid"])
             True
         """
-        response = self.client.post("/utilities/validate-json", json={"json": json_str})
-        return response
+        if self.local:
+            # No parity check here: the error strings are CPython's, not
+            # the server's, so they diverge by construction
+            try:
+                json.loads(json_str)
+            except json.JSONDecodeError as e:
+                return {"valid": False, "errors": [str(e)], "pos": e.pos}
+            except (ValueError, TypeError) as e:
+                return {"valid": False, "errors": [str(e)]}
+            return {"valid": True, "errors": []}
+        return self.client.post("/utilities/validate-json", json={"json": json_str})
 
     # ========================================================================
     # Base64 Helpers
@@ -4766,9 +6202,33 @@ class UtilitiesResource:
             >>> print(encoded)
             SGVsbG8gV29ybGQ=
         """
+        if self.local:
+            result = self.base64_encode_bytes(data.encode("utf-8")).decode("ascii")
+            if self.verify_parity:
+                return self._check_parity(
+                    "base64_encode", result, "/utilities/base64-encode",
+                    {"data": data}, "encoded",
+                )
+            return result
         response = self.client.post("/utilities/base64-encode", json={"data": data})
         return response["encoded"]
 
+    def base64_encode_bytes(self, data: bytes) -> bytes:
+        """
+        Encode raw bytes to Base64 bytes
+
+        Bytes-in/bytes-out variant for binary payloads: no UTF-8
+        round-trip on either side, just the C encoder (pybase64's SIMD
+        path when installed).
+
+        Args:
+            data: Bytes to encode
+
+        Returns:
+            Base64 encoded bytes
+        """
+        return _b64.b64encode(data)
+
     def base64_decode(self, encoded: str) -> str:
         """
         Decode Base64 string
@@ -4784,14 +6244,46 @@ class UtilitiesResource:
             >>> print(decoded)
             Hello World
         """
+        if self.local:
+            try:
+                result = self.base64_decode_bytes(encoded).decode("utf-8")
+            except UnicodeDecodeError as e:
+                raise ValidationError(f"Invalid Base64 input: {e}") from e
+            if self.verify_parity:
+                return self._check_parity(
+                    "base64_decode", result, "/utilities/base64-decode",
+                    {"encoded": encoded}, "decoded",
+                )
+            return result
         response = self.client.post("/utilities/base64-decode", json={"encoded": encoded})
         return response["decoded"]
 
+    def base64_decode_bytes(self, encoded: bytes | str) -> bytes:
+        """
+        Decode Base64 to raw bytes
+
+        Bytes-out variant for binary payloads; accepts str or bytes
+        input.
+
+        Args:
+            encoded: Base64 encoded data
+
+        Returns:
+            Decoded bytes
+
+        Raises:
+            ValidationError: If the input is not valid Base64
+        """
+        try:
+            return _b64.b64decode(encoded)
+        except (binascii.Error, ValueError) as e:
+            raise ValidationError(f"Invalid Base64 input: {e}") from e
+
     # ========================================================================
     # URL Helpers
     # ========================================================================
 
-    def parse_url(self, url: str) -> Dict[str, Any]:
+    def parse_url(self, url: str) -> dict[str, Any]:
         """
         Parse URL into components
 
@@ -4806,16 +6298,47 @@ class UtilitiesResource:
             >>> print(result["host"])
             api.example.com
         """
-        response = self.client.post("/utilities/parse-url", json={"url": url})
-        return response
+        if self.local:
+            result = None
+            if _AdaURL is not None:
+                try:
+                    u = _AdaURL(url)
+                except ValueError:
+                    pass  # not an absolute WHATWG URL; urlsplit still handles it
+                else:
+                    result = {
+                        "scheme": u.protocol.rstrip(":"),
+                        "host": u.hostname,
+                        "port": int(u.port) if u.port else None,
+                        "path": u.pathname,
+                        "query": u.search.lstrip("?"),
+                        "fragment": u.hash.lstrip("#"),
+                    }
+            if result is None:
+                parsed = urllib.parse.urlsplit(url)
+                result = {
+                    "scheme": parsed.scheme,
+                    "host": parsed.hostname or "",
+                    "port": parsed.port,
+                    "path": parsed.path,
+                    "query": parsed.query,
+                    "fragment": parsed.fragment,
+                }
+            if self.verify_parity:
+                return self._check_parity(
+                    "parse_url", result, "/utilities/parse-url",
+                    {"url": url}, None,
+                )
+            return result
+        return self.client.post("/utilities/parse-url", json={"url": url})
 
     def build_url(
         self,
         scheme: str,
         host: str,
-        path: Optional[str] = None,
-        query: Optional[Dict[str, str]] = None,
-        port: Optional[int] = None,
+        path: str | None = None,
+        query: dict[str, str] | None = None,
+        port: int | None = None,
     ) -> str:
         """
         Build URL from components
@@ -4840,6 +6363,28 @@ class UtilitiesResource:
             >>> print(url)
             https://api.example.com/v1/users?page=1
         """
+        if self.local:
+            netloc = host if port is None else f"{host}:{port}"
+            result = urllib.parse.urlunsplit((
+                scheme,
+                netloc,
+                path or "",
+                urllib.parse.urlencode(query) if query else "",
+                "",
+            ))
+            if self.verify_parity:
+                return self._check_parity(
+                    "build_url", result, "/utilities/build-url",
+                    {
+                        "scheme": scheme,
+                        "host": host,
+                        "path": path,
+                        "query": query,
+                        "port": port,
+                    },
+                    "url",
+                )
+            return result
         response = self.client.post("/utilities/build-url", json={
             "scheme": scheme,
             "host": host,
@@ -4864,6 +6409,14 @@ class UtilitiesResource:
             >>> print(encoded)
             hello%20world%20%26%20stuff
         """
+        if self.local:
+            result = urllib.parse.quote(data, safe="")
+            if self.verify_parity:
+                return self._check_parity(
+                    "url_encode", result, "/utilities/url-encode",
+                    {"data": data}, "encoded",
+                )
+            return result
         response = self.client.post("/utilities/url-encode", json={"data": data})
         return response["encoded"]
 
@@ -4882,6 +6435,14 @@ class UtilitiesResource:
             >>> print(decoded)
             hello world & stuff
         """
+        if self.local:
+            result = urllib.parse.unquote(encoded)
+            if self.verify_parity:
+                return self._check_parity(
+                    "url_decode", result, "/utilities/url-decode",
+                    {"encoded": encoded}, "decoded",
+                )
+            return result
         response = self.client.post("/utilities/url-decode", json={"encoded": encoded})
         return response["decoded"]
 
@@ -4889,6 +6450,38 @@ class UtilitiesResource:
     # Hash Helpers
     # ========================================================================
 
+    # Below this input length a local hash costs less than the memo's
+    # probe-plus-insert, so tiny inputs bypass the cache rather than
+    # thrash it out of its hot entries.
+    _MEMO_MIN_LEN = 64
+
+    def _hash(self, algo: str, data: str) -> str:
+        """Memoized scalar hash; computes locally or via the server"""
+        if self.verify_parity and self.local:
+            hasher = _HASH_TEMPLATES[algo].copy()
+            hasher.update(data.encode("utf-8"))
+            return self._check_parity(
+                algo, hasher.hexdigest(), f"/utilities/{algo}",
+                {"data": data}, "hash",
+            )
+        if self.local and len(data) < self._MEMO_MIN_LEN:
+            hasher = _HASH_TEMPLATES[algo].copy()
+            hasher.update(data.encode("utf-8"))
+            return hasher.hexdigest()
+        key = (algo, data)
+        cached = self._memo.get(key)
+        if cached is not _MEMO_MISS:
+            return cached
+        if self.local:
+            hasher = _HASH_TEMPLATES[algo].copy()
+            hasher.update(data.encode("utf-8"))
+            result = hasher.hexdigest()
+        else:
+            response = self.client.post(f"/utilities/{algo}", json={"data": data})
+            result = response["hash"]
+        self._memo.set(key, result)
+        return result
+
     def md5(self, data: str) -> str:
         """
         Generate MD5 hash
@@ -4904,34 +6497,115 @@ class UtilitiesResource:
             >>> print(hash_value)
             b10a8db164e0754105b7a99be72e3fe5
         """
-        response = self.client.post("/utilities/md5", json={"data": data})
-        return response["hash"]
+        return self._hash("md5", data)
 
     def sha1(self, data: str) -> str:
         """Generate SHA1 hash"""
-        response = self.client.post("/utilities/sha1", json={"data": data})
-        return response["hash"]
+        return self._hash("sha1", data)
 
     def sha256(self, data: str) -> str:
         """Generate SHA256 hash"""
-        response = self.client.post("/utilities/sha256", json={"data": data})
-        return response["hash"]
+        return self._hash("sha256", data)
 
     def sha512(self, data: str) -> str:
         """Generate SHA512 hash"""
-        response = self.client.post("/utilities/sha512", json={"data": data})
-        return response["hash"]
+        return self._hash("sha512", data)
+
+    def hash_many(
+        self,
+        items: list[str],
+        algorithms: list[str] | None = None,
+    ) -> dict[str, list[str]]:
+        """
+        Hash many strings with one or more algorithms in a single call
+
+        Inputs are encoded once and hashed locally via hashlib (which uses
+        OpenSSL's hardware-accelerated implementations where available),
+        avoiding one HTTP round-trip per string per algorithm.
+
+        Args:
+            items: Strings to hash
+            algorithms: Algorithm names (md5, sha1, sha256, sha512);
+                defaults to ["sha256"]
+
+        Returns:
+            Dictionary mapping algorithm name to list of hex digests,
+            in input order
+
+        Example:
+            >>> hashes = mf.utilities.hash_many(
+            ...     ["Hello World"],
+            ...     algorithms=["md5", "sha256"]
+            ... )
+            >>> print(hashes["md5"][0])
+            b10a8db164e0754105b7a99be72e3fe5
+        """
+        if algorithms is None:
+            algorithms = ["sha256"]
+        encoded = [item.encode("utf-8") for item in items]
+        results: dict[str, list[str]] = {}
+        for algo in algorithms:
+            template = _HASH_TEMPLATES.get(algo)
+            if template is None:
+                results[algo] = [
+                    hashlib.new(algo, data).hexdigest() for data in encoded
+                ]
+                continue
+            digests = []
+            for data in encoded:
+                hasher = template.copy()
+                hasher.update(data)
+                digests.append(hasher.hexdigest())
+            results[algo] = digests
+        return results
+
+    def sha256_many(self, items: list[str]) -> list[str]:
+        """
+        SHA256-hash many strings in one pass
+
+        Convenience wrapper over hash_many for the most common bulk
+        case: inputs are encoded once and hashed in a single tight loop
+        over copied hasher templates.
+
+        Args:
+            items: Strings to hash
+
+        Returns:
+            List of hex digests, in input order
+
+        Example:
+            >>> digests = mf.utilities.sha256_many(["a", "b"])
+            >>> len(digests)
+            2
+        """
+        return self.hash_many(items, algorithms=["sha256"])["sha256"]
 
     # ========================================================================
     # UUID Helpers
     # ========================================================================
 
-    def generate_uuid(self, version: int = 4) -> str:
+    def generate_uuid(
+        self,
+        version: int = 4,
+        disable_entropy_cache: bool = False,
+        namespace: str | None = None,
+        name: str | None = None,
+    ) -> str:
         """
         Generate UUID
 
+        Version 4 UUIDs are generated locally from a cached entropy pool
+        (refilled from os.urandom in 2 KiB blocks), amortizing the CSPRNG
+        cost across ~128 UUIDs. Version 1 and version 5 (given namespace
+        and name) are computed locally via the uuid module; only a v5
+        request without its inputs goes to the server.
+
         Args:
             version: UUID version (1, 4, or 5)
+            disable_entropy_cache: Draw fresh entropy per UUID instead of
+                using the shared pool
+            namespace: Namespace UUID string for version 5
+            name: Name within the namespace for version 5
 
         Returns:
             UUID string
@@ -4941,6 +6615,18 @@ class UtilitiesResource:
             >>> print(uuid)
             550e8400-e29b-41d4-a716-446655440000
         """
+        if version == 4:
+            if disable_entropy_cache:
+                return str(_uuid.uuid4())
+            return _fast_uuid4()
+        if version == 1:
+            return str(_uuid.uuid1())
+        if version == 5 and namespace is not None and name is not None:
+            try:
+                ns = _uuid.UUID(namespace)
+            except ValueError as e:
+                raise ValidationError(f"Invalid namespace UUID: {namespace}") from e
+            return str(_uuid.uuid5(ns, name))
         response = self.client.post("/utilities/generate-uuid", json={"version": version})
         return response["uuid"]
 
@@ -4959,9 +6645,30 @@ class UtilitiesResource:
             >>> print(valid)
             True
         """
+        if self.local:
+            result = _UUID_RE.match(uuid_str) is not None
+            if self.verify_parity:
+                return self._check_parity(
+                    "validate_uuid", result, "/utilities/validate-uuid",
+                    {"uuid": uuid_str}, "valid",
+                )
+            return result
         response = self.client.post("/utilities/validate-uuid", json={"uuid": uuid_str})
         return response["valid"]
 
+    def validate_uuids(self, uuid_strs: list[str]) -> list[bool]:
+        """
+        Validate many UUIDs in one local pass
+
+        Args:
+            uuid_strs: UUID strings to validate
+
+        Returns:
+            List of booleans, one per input UUID
+        """
+        match = _UUID_RE.match
+        return [match(value) is not None for value in uuid_strs]
+
     # ========================================================================
     # Time Helpers
     # ========================================================================
@@ -4981,10 +6688,16 @@ class UtilitiesResource:
             >>> print(ts)
             1640995200
         """
+        if self.local:
+            if format == "unix":
+                return int(time.time())
+            if format in ("iso8601", "rfc3339"):
+                return self.iso8601()
+            raise ValidationError(f"Unknown timestamp format: {format}")
         response = self.client.post("/utilities/timestamp", json={"format": format})
         return response["timestamp"]
 
-    def iso8601(self, unix_timestamp: Optional[int] = None) -> str:
+    def iso8601(self, unix_timestamp: int | None = None) -> str:
         """
         Convert Unix timestamp to ISO8601 format
 
@@ -4999,6 +6712,17 @@ class UtilitiesResource:
             >>> print(iso)
             2022-01-01T00:00:00Z
         """
+        if unix_timestamp is None:
+            unix_timestamp = int(time.time())
+        if self.local:
+            dt = datetime.fromtimestamp(unix_timestamp, tz=timezone.utc)
+            result = dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+            if self.verify_parity:
+                return self._check_parity(
+                    "iso8601", result, "/utilities/iso8601",
+                    {"timestamp": unix_timestamp}, "iso8601",
+                )
+            return result
         response = self.client.post("/utilities/iso8601", json={
             "timestamp": unix_timestamp
         })
@@ -5019,8 +6743,44 @@ class UtilitiesResource:
             >>> print(ts)
             1640995200
         """
-        response = self.client.post("/utilities/parse-time", json={"time": time_str})
-        return response["timestamp"]
+        if not self.local:
+            response = self.client.post("/utilities/parse-time", json={"time": time_str})
+            return response["timestamp"]
+        text = time_str.strip()
+        # Cheap shape check dispatches ISO-8601 input (the common case)
+        # to the compiled parsers without trying exotic formats first
+        looks_iso = len(text) >= 10 and text[4] == "-" and text[7] == "-"
+        dt = None
+        if looks_iso or _dateutil_parser is None:
+            if _ciso8601 is not None:
+                try:
+                    dt = _ciso8601.parse_datetime(text)
+                except ValueError:
+                    dt = None
+            if dt is None:
+                iso_text = (
+                    text[:-1] + "+00:00" if text.endswith(("Z", "z")) else text
+                )
+                try:
+                    dt = datetime.fromisoformat(iso_text)
+                except ValueError:
+                    dt = None
+        if dt is None and _dateutil_parser is not None:
+            try:
+                dt = _dateutil_parser.parse(text)
+            except (ValueError, OverflowError) as e:
+                raise ValidationError(f"Unrecognized time string: {time_str}") from e
+        if dt is None:
+            raise ValidationError(f"Unrecognized time string: {time_str}")
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        result = int(dt.timestamp())
+        if self.verify_parity:
+            return self._check_parity(
+                "parse_time", result, "/utilities/parse-time",
+                {"time": time_str}, "timestamp",
+            )
+        return result
 
     def time_ago(self, unix_timestamp: int) -> str:
         """
@@ -5037,10 +6797,26 @@ class UtilitiesResource:
             >>> print(relative)
             2 years ago
         """
-        response = self.client.post("/utilities/time-ago", json={
-            "timestamp": unix_timestamp
-        })
-        return response["relative"]
+        if not self.local:
+            # Clock-relative, so no parity check: local and server clocks
+            # can legitimately disagree near a bucket boundary
+            response = self.client.post("/utilities/time-ago", json={
+                "timestamp": unix_timestamp
+            })
+            return response["relative"]
+        delta = int(time.time()) - int(unix_timestamp)
+        if delta < 0:
+            return "in the future"
+        for threshold, unit_seconds, unit in _TIME_AGO_BUCKETS:
+            if delta < threshold:
+                count = delta // unit_seconds
+                if count <= 0:
+                    return "just now"
+                plural = "s" if count != 1 else ""
+                return f"{count} {unit}{plural} ago"
+        count = delta // 31536000
+        plural = "s" if count != 1 else ""
+        return f"{count} year{plural} ago"
 
     # ========================================================================
     # String Helpers
@@ -5061,6 +6837,16 @@ class UtilitiesResource:
             >>> print(slug)
             hello-world-stuff
         """
+        if self.local:
+            slug = text.lower().translate(_SLUG_TABLE)
+            slug = _SLUG_NON_ASCII.sub("-", slug)
+            result = _SLUG_COLLAPSE.sub("-", slug).strip("-")
+            if self.verify_parity:
+                return self._check_parity(
+                    "slugify", result, "/utilities/slugify",
+                    {"text": text}, "slug",
+                )
+            return result
         response = self.client.post("/utilities/slugify", json={"text": text})
         return response["slug"]
 
@@ -5080,11 +6866,71 @@ class UtilitiesResource:
             >>> print(random)
             a1b2c3d4e5f6...
         """
-        response = self.client.post("/utilities/random-string", json={
+        buf = self._rand_buffers.get((length, charset))
+        if not buf:
+            if buf is None:
+                buf = self._rand_buffers[(length, charset)] = deque()
+            buf.extend(self.random_strings(self._RAND_BATCH, length, charset))
+        return buf.popleft()
+
+    # Strings pre-generated per (length, charset) for random_string
+    _RAND_BATCH = 256
+
+    def random_strings(
+        self,
+        count: int,
+        length: int = 16,
+        charset: str = "alphanumeric",
+    ) -> list[str]:
+        """
+        Generate many random strings in one pass
+
+        Entropy for all count strings is drawn in a single rejection-
+        sampling sweep (or one POST with local=False), instead of one
+        pass per token.
+
+        Args:
+            count: Number of strings to generate
+            length: Length of each string
+            charset: Character set (alphanumeric, alpha, numeric, hex)
+
+        Returns:
+            List of random strings
+
+        Example:
+            >>> tokens = mf.utilities.random_strings(1000, 32, "hex")
+            >>> len(tokens)
+            1000
+        """
+        if count < 1:
+            raise ValidationError("count must be a positive integer")
+        if self.local:
+            chars = _CHARSETS.get(charset)
+            if chars is None:
+                raise ValidationError(f"Unknown charset: {charset}")
+            if charset == "hex":
+                # Hex needs no rejection sampling: urandom bytes map
+                # straight to hex digits, two per byte
+                if length < 1:
+                    raise ValidationError("length must be a positive integer")
+                nbytes = (length + 1) // 2
+                hex_blob = os.urandom(count * nbytes).hex()
+                step = nbytes * 2
+                return [
+                    hex_blob[offset:offset + length]
+                    for offset in range(0, count * step, step)
+                ]
+            blob = _random_chars(count * length, chars)
+            return [
+                blob[offset:offset + length]
+                for offset in range(0, count * length, length)
+            ]
+        response = self.client.post("/utilities/random-strings", json={
+            "count": count,
             "length": length,
-            "charset": charset
+            "charset": charset,
         })
-        return response["string"]
+        return response["strings"]
 
     def random_password(
         self,
@@ -5112,6 +6958,19 @@ class UtilitiesResource:
             >>> print(password)
             Xa9#bC2$dE5&fG8*
         """
+        if self.local:
+            charset = ""
+            if include_lowercase:
+                charset += "abcdefghijklmnopqrstuvwxyz"
+            if include_uppercase:
+                charset += "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+            if include_numbers:
+                charset += "0123456789"
+            if include_symbols:
+                charset += "!@#$%^&*"
+            if not charset:
+                raise ValidationError("At least one character class must be included")
+            return _random_chars(length, charset)
         response = self.client.post("/utilities/random-password", json={
             "length": length,
             "include_symbols": include_symbols,
@@ -5125,7 +6984,7 @@ class UtilitiesResource:
     # ARN Helpers
     # ========================================================================
 
-    def parse_arn(self, arn: str) -> Dict[str, str]:
+    def parse_arn(self, arn: str) -> dict[str, str]:
         """
         Parse AWS ARN into components
 
@@ -5140,15 +6999,31 @@ class UtilitiesResource:
             >>> print(result["service"])
             iam
         """
-        response = self.client.post("/utilities/parse-arn", json={"arn": arn})
-        return response
+        if self.local:
+            parts = arn.split(":", 5)
+            if len(parts) != 6 or parts[0] != "arn":
+                raise ValidationError(f"Invalid ARN: {arn}")
+            result = {
+                "partition": parts[1],
+                "service": parts[2],
+                "region": parts[3],
+                "account": parts[4],
+                "resource": parts[5],
+            }
+            if self.verify_parity:
+                return self._check_parity(
+                    "parse_arn", result, "/utilities/parse-arn",
+                    {"arn": arn}, None,
+                )
+            return result
+        return self.client.post("/utilities/parse-arn", json={"arn": arn})
 
     def build_arn(
         self,
         service: str,
         resource: str,
-        account: Optional[str] = None,
-        region: Optional[str] = None,
+        account: str | None = None,
+        region: str | None = None,
         partition: str = "aws",
     ) -> str:
         """
@@ -5173,6 +7048,24 @@ class UtilitiesResource:
             >>> print(arn)
             arn:aws:iam::123456789:user/john
         """
+        if self.local:
+            result = (
+                f"arn:{partition}:{service}:{region or ''}:"
+                f"{account or ''}:{resource}"
+            )
+            if self.verify_parity:
+                return self._check_parity(
+                    "build_arn", result, "/utilities/build-arn",
+                    {
+                        "service": service,
+                        "resource": resource,
+                        "account": account,
+                        "region": region,
+                        "partition": partition,
+                    },
+                    "arn",
+                )
+            return result
         response = self.client.post("/utilities/build-arn", json={
             "service": service,
             "resource": resource,
@@ -5197,5 +7090,30 @@ class UtilitiesResource:
             >>> print(valid)
             True
         """
+        if self.local:
+            result = _ARN_RE.match(arn) is not None
+            if self.verify_parity:
+                return self._check_parity(
+                    "validate_arn", result, "/utilities/validate-arn",
+                    {"arn": arn}, "valid",
+                )
+            return result
         response = self.client.post("/utilities/validate-arn", json={"arn": arn})
         return response["valid"]
+
+    def validate_arns(self, arns: list[str]) -> list[bool]:
+        """
+        Validate many ARNs in one local pass
+
+        The precompiled pattern's bound match method is applied across
+        the batch, so log-pipeline-scale validation pays no per-call
+        attribute lookups or round-trips.
+
+        Args:
+            arns: ARN strings to validate
+
+        Returns:
+            List of booleans, one per input ARN
+        """
+        match = _ARN_RE.match
+        return [match(arn) is not None for arn in arns]
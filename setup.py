@@ -18,16 +18,23 @@ setup(
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         "requests>=2.28.0",
     ],
     extras_require={
+        "async": [
+            "httpx>=0.24.0",
+        ],
+        "yaml": [
+            "PyYAML>=6.0",
+        ],
+        "msgpack": [
+            "msgpack>=1.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "black>=22.0.0",